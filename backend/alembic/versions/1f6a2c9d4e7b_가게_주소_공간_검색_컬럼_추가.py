@@ -0,0 +1,55 @@
+"""가게 주소 공간 검색 컬럼 추가
+
+Revision ID: 1f6a2c9d4e7b
+Revises: 947d2e807710
+Create Date: 2026-10-18 10:12:41.512305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.geo_utils import build_coordinate_values
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f6a2c9d4e7b'
+down_revision: Union[str, Sequence[str], None] = '947d2e807710'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('store_addresses', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('store_addresses', sa.Column('longitude', sa.Float(), nullable=True))
+    op.add_column('store_addresses', sa.Column('geohash', sa.String(length=12, collation='C'), nullable=True))
+    op.create_index('ix_store_addresses_geohash', 'store_addresses', ['geohash'], unique=False)
+    
+    # 기존 문자열 위도/경도로 공간 검색 컬럼 채우기
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT address_id, lat, lng FROM store_addresses")
+    ).fetchall()
+    
+    for address_id, lat, lng in rows:
+        values = build_coordinate_values(lat, lng)
+        if values["geohash"] is None:
+            continue
+        connection.execute(
+            sa.text("""
+                UPDATE store_addresses
+                SET latitude = :latitude, longitude = :longitude, geohash = :geohash
+                WHERE address_id = :address_id
+            """),
+            {**values, "address_id": address_id}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_store_addresses_geohash', table_name='store_addresses')
+    op.drop_column('store_addresses', 'geohash')
+    op.drop_column('store_addresses', 'longitude')
+    op.drop_column('store_addresses', 'latitude')
@@ -0,0 +1,69 @@
+"""상품별 당일 주문 집계 테이블 추가
+
+Revision ID: 3c7a9e2f5b18
+Revises: 8b4f1e6d2a93
+Create Date: 2026-10-18 14:21:43.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7a9e2f5b18'
+down_revision: Union[str, Sequence[str], None] = '8b4f1e6d2a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('store_product_daily_stats',
+        sa.Column('product_id', sa.String(length=255), nullable=False),
+        sa.Column('store_id', sa.String(length=255), nullable=False),
+        sa.Column('reserved_quantity', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('reserved_amount', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('accepted_quantity', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('accepted_amount', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('completed_quantity', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('completed_amount', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('cancelled_quantity', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('cancelled_amount', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['product_id'], ['store_product_info.product_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.store_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id')
+    )
+    op.create_index('ix_store_product_daily_stats_store_id', 'store_product_daily_stats', ['store_id'], unique=False)
+    
+    # 현재 남아있는 당일 주문으로 집계 생성
+    op.execute("""
+        INSERT INTO store_product_daily_stats (
+            product_id, store_id,
+            reserved_quantity, reserved_amount,
+            accepted_quantity, accepted_amount,
+            completed_quantity, completed_amount,
+            cancelled_quantity, cancelled_amount
+        )
+        SELECT
+            o.product_id, p.store_id,
+            COALESCE(SUM(o.quantity) FILTER (WHERE o.status = 'reservation'), 0),
+            COALESCE(SUM(o.total_amount) FILTER (WHERE o.status = 'reservation'), 0),
+            COALESCE(SUM(o.quantity) FILTER (WHERE o.status = 'accept'), 0),
+            COALESCE(SUM(o.total_amount) FILTER (WHERE o.status = 'accept'), 0),
+            COALESCE(SUM(o.quantity) FILTER (WHERE o.status = 'complete'), 0),
+            COALESCE(SUM(o.total_amount) FILTER (WHERE o.status = 'complete'), 0),
+            COALESCE(SUM(o.quantity) FILTER (WHERE o.status = 'cancel'), 0),
+            COALESCE(SUM(o.total_amount) FILTER (WHERE o.status = 'cancel'), 0)
+        FROM order_current_items o
+        JOIN store_product_info p ON p.product_id = o.product_id
+        GROUP BY o.product_id, p.store_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_store_product_daily_stats_store_id', table_name='store_product_daily_stats')
+    op.drop_table('store_product_daily_stats')
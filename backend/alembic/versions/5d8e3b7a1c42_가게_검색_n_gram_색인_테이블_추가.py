@@ -0,0 +1,80 @@
+"""가게 검색 n-gram 색인 테이블 추가
+
+Revision ID: 5d8e3b7a1c42
+Revises: 1f6a2c9d4e7b
+Create Date: 2026-10-18 11:03:27.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.search_tokenizer import build_document, build_document_tokens, to_choseong
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e3b7a1c42'
+down_revision: Union[str, Sequence[str], None] = '1f6a2c9d4e7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    documents = op.create_table('store_search_documents',
+        sa.Column('store_id', sa.String(length=255), nullable=False),
+        sa.Column('search_text', sa.Text(), nullable=False),
+        sa.Column('choseong_text', sa.Text(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.store_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('store_id')
+    )
+    tokens = op.create_table('store_search_tokens',
+        sa.Column('token', sa.String(length=8), nullable=False),
+        sa.Column('store_id', sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.store_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('token', 'store_id')
+    )
+    op.create_index('ix_store_search_tokens_store_id', 'store_search_tokens', ['store_id'], unique=False)
+    
+    # 기존 가게/상품 이름으로 색인 생성
+    connection = op.get_bind()
+    rows = connection.execute(sa.text("""
+        SELECT s.store_id, s.store_name, p.product_name
+        FROM stores s
+        LEFT JOIN store_product_info p ON p.store_id = s.store_id
+        ORDER BY s.store_id
+    """)).fetchall()
+    
+    names_by_store = {}
+    for store_id, store_name, product_name in rows:
+        names = names_by_store.setdefault(store_id, [store_name])
+        if product_name:
+            names.append(product_name)
+    
+    document_rows = []
+    token_rows = []
+    for store_id, names in names_by_store.items():
+        search_text = build_document(names)
+        document_rows.append({
+            'store_id': store_id,
+            'search_text': search_text,
+            'choseong_text': to_choseong(search_text)
+        })
+        token_rows.extend(
+            {'token': token, 'store_id': store_id}
+            for token in build_document_tokens(search_text)
+        )
+    
+    if document_rows:
+        op.bulk_insert(documents, document_rows)
+    if token_rows:
+        op.bulk_insert(tokens, token_rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_store_search_tokens_store_id', table_name='store_search_tokens')
+    op.drop_table('store_search_tokens')
+    op.drop_table('store_search_documents')
@@ -0,0 +1,33 @@
+"""당일 주문 소비자별 예약시간 인덱스 추가
+
+Revision ID: 6e2d8b4a9f31
+Revises: 3c7a9e2f5b18
+Create Date: 2026-10-18 15:08:52.731604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2d8b4a9f31'
+down_revision: Union[str, Sequence[str], None] = '3c7a9e2f5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_order_current_items_customer_reservation',
+        'order_current_items',
+        ['customer_id', 'reservation_at', 'payment_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_order_current_items_customer_reservation', table_name='order_current_items')
@@ -0,0 +1,31 @@
+"""상품 hot 재고 모드 컬럼 추가
+
+Revision ID: 8b4f1e6d2a93
+Revises: 5d8e3b7a1c42
+Create Date: 2026-10-18 13:02:17.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4f1e6d2a93'
+down_revision: Union[str, Sequence[str], None] = '5d8e3b7a1c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'store_product_info',
+        sa.Column('is_hot_stock', sa.Boolean(), server_default=sa.false(), nullable=False)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('store_product_info', 'is_hot_stock')
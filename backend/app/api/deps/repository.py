@@ -28,10 +28,13 @@ from repositories.store_payment_info import StorePaymentInfoRepository
 from repositories.store_product_info import StoreProductInfoRepository
 from repositories.product_nutrition import ProductNutritionRepository
 from repositories.product_stock_reservation import ProductStockReservationRepository
+from repositories.store_search_index import StoreSearchIndexRepository
 # 주문
 from repositories.cart_item import CartItemRepository
 from repositories.order_current_item import OrderCurrentItemRepository
 from repositories.order_history_item import OrderHistoryItemRepository
+from repositories.settlement_daily import SettlementDailyRepository
+from repositories.store_product_daily_stat import StoreProductDailyStatRepository
 
 
 
@@ -120,6 +123,10 @@ def get_product_stock_reservation_repository() -> ProductStockReservationReposit
     return ProductStockReservationRepository()
 
 
+def get_store_search_index_repository(session: AsyncSessionDep) -> StoreSearchIndexRepository:
+    return StoreSearchIndexRepository(session)
+
+
 # 주문
 def get_cart_item_repository(session: AsyncSessionDep) -> CartItemRepository:
     return CartItemRepository(session)
@@ -133,6 +140,14 @@ def get_order_history_item_repository() -> OrderHistoryItemRepository:
     return OrderHistoryItemRepository()
 
 
+def get_settlement_daily_repository() -> SettlementDailyRepository:
+    return SettlementDailyRepository()
+
+
+def get_store_product_daily_stat_repository(session: AsyncSessionDep) -> StoreProductDailyStatRepository:
+    return StoreProductDailyStatRepository(session)
+
+
 
 # 소비자
 CustomerRepositoryDep = Annotated[CustomerRepository, Depends(get_customer_repository)]
@@ -157,7 +172,10 @@ StoreOperationInfoModificationRepositoryDep = Annotated[StoreOperationInfoModifi
 StoreProductInfoRepositoryDep = Annotated[StoreProductInfoRepository, Depends(get_store_product_info_repository)]
 ProductNutritionRepositoryDep = Annotated[ProductNutritionRepository, Depends(get_product_nutrition_repository)]
 ProductStockReservationRepositoryDep = Annotated[ProductStockReservationRepository, Depends(get_product_stock_reservation_repository)]
+StoreSearchIndexRepositoryDep = Annotated[StoreSearchIndexRepository, Depends(get_store_search_index_repository)]
 # 주문
 CartItemRepositoryDep = Annotated[CartItemRepository, Depends(get_cart_item_repository)]
 OrderCurrentItemRepositoryDep = Annotated[OrderCurrentItemRepository, Depends(get_order_current_item_repository)]
-OrderHistoryItemRepositoryDep = Annotated[OrderHistoryItemRepository, Depends(get_order_history_item_repository)]
\ No newline at end of file
+OrderHistoryItemRepositoryDep = Annotated[OrderHistoryItemRepository, Depends(get_order_history_item_repository)]
+SettlementDailyRepositoryDep = Annotated[SettlementDailyRepository, Depends(get_settlement_daily_repository)]
+StoreProductDailyStatRepositoryDep = Annotated[StoreProductDailyStatRepository, Depends(get_store_product_daily_stat_repository)]
\ No newline at end of file
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
+import heapq
+from typing import Optional, Tuple
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Query
 from datetime import datetime, timezone, timedelta
 
 from utils.qr_generator import validate_qr_data
 from utils.docs_error import create_error_responses
 from utils.string_utils import parse_comma_separated_string
-from utils.store_utils import get_main_image_url
+from utils.store_utils import get_main_image_url, convert_order_to_response
+from utils.cursor import encode_cursor, decode_cursor
 from api.deps.auth import CurrentCustomerDep
 from api.deps.repository import (
     OrderCurrentItemRepositoryDep,
@@ -14,7 +17,7 @@ from api.deps.repository import (
     StoreRepositoryDep,
     StoreImageRepositoryDep
 )
-from repositories.store_product_info import StockUpdateResult
+from database.mongodb_models.order_history_item import OrderHistoryItem
 from schemas.order import (
     OrderStatus,
     OrderItemResponse,
@@ -30,8 +33,8 @@ from schemas.order import (
 )
 from services.payment import PaymentService
 from services.background_email import send_customer_cancel_email
-from services.qr_callback import QRCallbackCache
-from config.settings import settings
+from services.qr_callback import set_completed_status_on_commit
+from services.order_event import publish_order_event
 
 # KST 타임존 설정
 KST = timezone(timedelta(hours=9))
@@ -39,8 +42,33 @@ KST = timezone(timedelta(hours=9))
 router = APIRouter(prefix="/orders", tags=["Customer-Order"])
 
 
+def _as_utc(value: datetime) -> datetime:
+    """MongoDB에서 조회한 naive datetime을 UTC로 맞춤"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _decode_order_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, str]]:
+    """주문 내역 커서를 (reservation_at, payment_id)로 디코딩"""
+    values = decode_cursor(cursor, ("at", "id"))
+    if values is None:
+        return None
+    
+    try:
+        return _as_utc(datetime.fromisoformat(values[0])), values[1]
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 커서입니다"
+        )
+
+
+def _order_sort_key(order) -> Tuple[datetime, str]:
+    return _as_utc(order.reservation_at), order.payment_id
+
+
 @router.get("", response_model=CustomerOrderListResponse,
     responses=create_error_responses({
+        400:"올바르지 않은 커서",
         401:["인증 정보가 없음", "토큰 만료"]
     })
 )
@@ -48,96 +76,113 @@ async def get_order_history(
     current_user: CurrentCustomerDep,
     order_repo: OrderCurrentItemRepositoryDep,
     history_repo: OrderHistoryItemRepositoryDep,
-    image_repo: StoreImageRepositoryDep
+    image_repo: StoreImageRepositoryDep,
+    limit: int = Query(20, description="페이지 크기", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
     주문 내역 조회 - 모든 주문 조회 (당일 + 과거)
+    
+    당일 주문(PostgreSQL)과 과거 주문(MongoDB)을 각각 예약 시간 내림차순으로 limit + 1개씩만 조회한 뒤
+    병합하여 한 페이지를 구성하고, 마지막 주문 기준의 next_cursor를 반환
     """
     customer_email = current_user["sub"]
+    page_cursor = _decode_order_cursor(cursor)
     
     # 당일 주문 조회
-    current_orders = await order_repo.get_customer_current_orders(customer_email)
+    current_orders = await order_repo.get_customer_orders_page(customer_email, limit + 1, page_cursor)
     
     # 과거 주문 조회
-    history_orders = await history_repo.get_customer_history(customer_email)
-    
-    order_responses = []
-    
-    # 당일 주문 처리
-    for order in current_orders:
-        order_response = CustomerOrderItemResponse(
-            payment_id=order.payment_id,
-            customer_id=order.customer_id,
-            customer_nickname=order.customer.detail.nickname,
-            customer_phone_number=order.customer.detail.phone_number,
-            product_id=order.product_id,
-            product_name=order.product.product_name,
-            store_id=order.product.store_id,
-            store_name=order.product.store.store_name,
-            main_image_url=get_main_image_url(order.product.store),
-            quantity=order.quantity,
-            price=order.price,
-            sale=order.sale,
-            total_amount=order.total_amount,
-            status=order.status,
-            reservation_at=order.reservation_at,
-            accepted_at=order.accepted_at,
-            completed_at=order.completed_at,
-            canceled_at=order.canceled_at,
-            cancel_reason=order.cancel_reason,
-            preferred_menus=parse_comma_separated_string(order.preferred_menus),
-            nutrition_types=parse_comma_separated_string(order.nutrition_types),
-            allergies=parse_comma_separated_string(order.allergies),
-            topping_types=parse_comma_separated_string(order.topping_types)
-        )
-        order_responses.append(order_response)
+    history_orders = await history_repo.get_customer_history_page(customer_email, limit + 1, page_cursor)
+    
+    # 두 스트림 병합 (마이그레이션 중 양쪽에 있는 주문은 한 번만 포함)
+    page_orders = []
+    seen_payment_ids = set()
+    for order in heapq.merge(current_orders, history_orders, key=_order_sort_key, reverse=True):
+        if order.payment_id in seen_payment_ids:
+            continue
+        seen_payment_ids.add(order.payment_id)
+        page_orders.append(order)
+        if len(page_orders) > limit:
+            break
     
-    history_store_ids = list(set(order.store_id for order in history_orders))
+    is_end = len(page_orders) <= limit
+    page_orders = page_orders[:limit]
     
+    history_store_ids = list(set(
+        order.store_id for order in page_orders if isinstance(order, OrderHistoryItem)
+    ))
     store_main_images = await image_repo.get_main_images_for_stores(history_store_ids)
     
-    # 과거 주문 처리
-    for history_order in history_orders:
-        
-        main_image_url = store_main_images.get(history_order.store_id)
+    order_responses = []
+    for order in page_orders:
+        # 과거 주문 처리
+        if isinstance(order, OrderHistoryItem):
+            order_response = CustomerOrderItemResponse(
+                payment_id=order.payment_id,
+                customer_id=order.customer_id,
+                customer_nickname=order.customer_nickname,
+                customer_phone_number=order.customer_phone_number,
+                product_id=order.product_id,
+                product_name=order.product_name,
+                store_id=order.store_id,
+                store_name=order.store_name,
+                main_image_url=store_main_images.get(order.store_id),
+                quantity=order.quantity,
+                price=order.price,
+                sale=order.sale,
+                total_amount=order.total_amount,
+                status=order.status,
+                reservation_at=order.reservation_at,
+                accepted_at=order.accepted_at,
+                completed_at=order.completed_at,
+                canceled_at=order.canceled_at,
+                cancel_reason=order.cancel_reason,
+                preferred_menus=parse_comma_separated_string(order.preferred_menus),
+                nutrition_types=parse_comma_separated_string(order.nutrition_types),
+                allergies=parse_comma_separated_string(order.allergies),
+                topping_types=parse_comma_separated_string(order.topping_types)
+            )
         
-        order_response = CustomerOrderItemResponse(
-            payment_id=history_order.payment_id,
-            customer_id=history_order.customer_id,
-            customer_nickname=history_order.customer_nickname,
-            customer_phone_number=history_order.customer_phone_number,
-            product_id=history_order.product_id,
-            product_name=history_order.product_name,
-            store_id=history_order.store_id,
-            store_name=history_order.store_name,
-            main_image_url=main_image_url,
-            quantity=history_order.quantity,
-            price=history_order.price,
-            sale=history_order.sale,
-            total_amount=history_order.total_amount,
-            status=history_order.status,
-            reservation_at=history_order.reservation_at,
-            accepted_at=history_order.accepted_at,
-            completed_at=history_order.completed_at,
-            canceled_at=history_order.canceled_at,
-            cancel_reason=history_order.cancel_reason,
-            preferred_menus=parse_comma_separated_string(history_order.preferred_menus),
-            nutrition_types=parse_comma_separated_string(history_order.nutrition_types),
-            allergies=parse_comma_separated_string(history_order.allergies),
-            topping_types=parse_comma_separated_string(history_order.topping_types)
-        )
+        # 당일 주문 처리
+        else:
+            order_response = CustomerOrderItemResponse(
+                payment_id=order.payment_id,
+                customer_id=order.customer_id,
+                customer_nickname=order.customer.detail.nickname,
+                customer_phone_number=order.customer.detail.phone_number,
+                product_id=order.product_id,
+                product_name=order.product.product_name,
+                store_id=order.product.store_id,
+                store_name=order.product.store.store_name,
+                main_image_url=get_main_image_url(order.product.store),
+                quantity=order.quantity,
+                price=order.price,
+                sale=order.sale,
+                total_amount=order.total_amount,
+                status=order.status,
+                reservation_at=order.reservation_at,
+                accepted_at=order.accepted_at,
+                completed_at=order.completed_at,
+                canceled_at=order.canceled_at,
+                cancel_reason=order.cancel_reason,
+                preferred_menus=parse_comma_separated_string(order.preferred_menus),
+                nutrition_types=parse_comma_separated_string(order.nutrition_types),
+                allergies=parse_comma_separated_string(order.allergies),
+                topping_types=parse_comma_separated_string(order.topping_types)
+            )
         order_responses.append(order_response)
     
-    order_responses.sort(
-        key=lambda x: max(
-            filter(None, [x.reservation_at, x.accepted_at, x.completed_at, x.canceled_at])
-        ),
-        reverse=True
-    )
+    next_cursor = None
+    if not is_end:
+        last_reservation_at, last_payment_id = _order_sort_key(page_orders[-1])
+        next_cursor = encode_cursor({"at": last_reservation_at.isoformat(), "id": last_payment_id})
     
     return CustomerOrderListResponse(
         orders=order_responses,
-        total=len(order_responses)
+        total=len(order_responses),
+        is_end=is_end,
+        next_cursor=next_cursor
     )
 
 
@@ -408,14 +453,16 @@ async def complete_pickup(
     
     # 주문 상태를 완료로 변경
     completed_order = await order_repo.complete_order(payment_id)
+    if not completed_order:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 픽업이 완료된 주문입니다"
+        )
     
-    try:
-        await QRCallbackCache.set_completed_status(payment_id)
-    except Exception:
-        # Redis 업데이트 실패는 critical하지 않으므로 무시, 30초 후 자동 타임아웃됨
-        pass
+    # 판매자 QR 대기 화면으로 완료 알림 발행 (커밋 후)
+    set_completed_status_on_commit(order_repo.session, payment_id)
     
-    return OrderItemResponse(
+    order_response = OrderItemResponse(
         payment_id=completed_order.payment_id,
         customer_id=order.customer_id,
         customer_nickname=order.customer.detail.nickname,
@@ -440,13 +487,17 @@ async def complete_pickup(
         topping_types=parse_comma_separated_string(completed_order.topping_types)
     )
     
+    # 가게 주문 채널로 픽업 완료 이벤트 발행 (커밋 후)
+    publish_order_event(order_repo.session, order_response)
+    
+    return order_response
+
     
 @router.delete("/{payment_id}/cancel", response_model=OrderCancelResponse,
     responses=create_error_responses({
         400: ["이미 취소된 주문", "이미 승인된 주문"],
         401:["인증 정보가 없음", "토큰 만료"],
-        404:"상품을 찾을 수 없음",
-        409: "동시성 충돌 발생"
+        404:"상품을 찾을 수 없음"
     })               
 )
 async def cancel_order(
@@ -487,6 +538,18 @@ async def cancel_order(
             detail="이미 처리 중인 주문은 취소할 수 없습니다"
         )
     
+    # 주문을 먼저 취소 상태로 바꿔 잠근 뒤 환불 (환불이 실패하면 요청 전체가 롤백되어 주문이 유지됨)
+    quantity = await order_repo.cancel_order(
+        payment_id,
+        cancel_reason=request.reason,
+        allowed_statuses=[OrderStatus.reservation]
+    )
+    if quantity is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 처리 중인 주문은 취소할 수 없습니다"
+        )
+    
     # 가게의 결제 정보 조회
     payment_info = await payment_info_repo.get_by_store_id(order.product.store_id)
     
@@ -503,21 +566,10 @@ async def cancel_order(
             detail=refund_result.get("error", "환불 처리 중 오류가 발생했습니다")
         )
     
-    # 주문 취소 처리
-    quantity = await order_repo.cancel_order(payment_id, cancel_reason=request.reason)
- 
-    max_retries = settings.MAX_RETRY_LOCK
-    for attempt in range(max_retries):
-        result = await product_repo.adjust_purchased_stock(order.product_id, -quantity)
-        
-        if result == StockUpdateResult.SUCCESS:
-            break
-        
-        if attempt == max_retries - 1:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="재고 복구 중 충돌이 발생했습니다. 다시 시도해주세요."
-            )
+    await product_repo.release_stock(order.product_id, quantity)
+    
+    # 가게 주문 채널로 취소 이벤트 발행 (커밋 후)
+    publish_order_event(order_repo.session, convert_order_to_response(order))
     
     # 소비자 주문 취소 이메일을 백그라운드로 전송
     store = await store_repo.get_by_store_id(order.product.store_id)
@@ -11,7 +11,6 @@ from api.deps.repository import (
     CustomerProfileRepositoryDep,
     StoreOperationInfoRepositoryDep
 )
-from repositories.store_product_info import StockUpdateResult
 from schemas.order import OrderStatus
 from schemas.payment import (
     PaymentInitRequest,
@@ -22,10 +21,11 @@ from schemas.payment import (
 from services.payment_scheduler import PaymentSchedulerService
 from services.payment import PaymentService
 from services.background_email import send_reservation_email
+from services.order_event import publish_order_event
 from utils.docs_error import create_error_responses
 from utils.id_generator import generate_payment_id
 from utils.string_utils import join_values
-from config.settings import settings
+from utils.store_utils import convert_order_to_response
 
 # KST 타임존 설정
 KST = timezone(timedelta(hours=9))
@@ -39,7 +39,7 @@ async def restore_product_stock(
     product_repo: StoreProductInfoRepositoryDep
 ) -> bool:
     """
-    낙관적 락을 사용하여 상품 구매 수량을 복구 (구매 취소)
+    상품 구매 수량을 복구 (구매 취소)
     
     Args:
         product_id: 상품 ID
@@ -50,24 +50,16 @@ async def restore_product_stock(
         성공 여부
         
     Raises:
-        HTTPException: 재고 복구 실패 시
+        HTTPException: 상품을 찾을 수 없는 경우
     """
     
-    max_retries = settings.MAX_RETRY_LOCK
+    if await product_repo.release_stock(product_id, quantity):
+        return True
     
-    for attempt in range(max_retries):
-        result = await product_repo.adjust_purchased_stock(product_id, -quantity)
-        
-        if result == StockUpdateResult.SUCCESS:
-            return True
-        
-        if attempt == max_retries - 1:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="재고 복구 중 충돌이 발생했습니다. 다시 시도해주세요."
-            )
-    
-    return False
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="상품을 찾을 수 없습니다"
+    )
 
 
 
@@ -76,8 +68,7 @@ async def restore_product_stock(
     responses=create_error_responses({
         400: ["재고가 없음", "가게가 현재 영업 중이 아님", "픽업 시간이 종료됨"],
         401:["인증 정보가 없음", "토큰 만료"],
-        404:"상품을 찾을 수 없음",
-        409: "동시성 충돌 발생"
+        404:"상품을 찾을 수 없음"
     })
 )
 async def init_payment(
@@ -125,34 +116,18 @@ async def init_payment(
             detail=f"픽업 시간이 종료되었습니다. 픽업 종료 시간: {today_operation.pickup_end_time.strftime('%H:%M')}"
         )
     
-    # 재고 확인
-    if product.current_stock < request.quantity:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"재고가 부족합니다. 현재 재고: {product.current_stock}개"
-        )
-    
     # 결제 ID 생성
     payment_id = generate_payment_id()
     
-    max_retries = settings.MAX_RETRY_LOCK
-    for attempt in range(max_retries):
-        result = await product_repo.adjust_purchased_stock(request.product_id, request.quantity)
-        
-        if result == StockUpdateResult.SUCCESS:
-            break
-        elif result == StockUpdateResult.INSUFFICIENT_STOCK:
-            current_product = await product_repo.get_by_product_id(request.product_id)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"재고가 부족합니다. 현재 재고: {current_product.current_stock}개"
-            )
-        
-        if attempt == max_retries - 1:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="재고 차감 중 충돌이 발생했습니다. 다시 시도해주세요."
-            )
+    # 재고 확인과 차감을 한 번에 처리 (hot 상품은 Redis 카운터에서 차감)
+    reserved_product = await product_repo.reserve_stock(request.product_id, request.quantity)
+    
+    if not reserved_product:
+        current_stock = await product_repo.get_available_stock(product)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"재고가 부족합니다. 현재 재고: {current_stock}개"
+        )
     
     if product.sale:
         discounted = product.price * (100 - product.sale) / 100
@@ -162,11 +137,7 @@ async def init_payment(
     else:
         total_amount = product.price * request.quantity 
     
-    await PaymentSchedulerService.schedule_payment_timeout(
-        payment_id=payment_id,
-        product_id=request.product_id,
-        quantity=request.quantity
-    )
+    await PaymentSchedulerService.schedule_payment_timeout(payment_id)
     
     # 장바구니에 등록
     cart_data = {
@@ -213,8 +184,7 @@ async def init_payment(
         401:["인증 정보가 없음", "토큰 만료"],
         403: "결제 권한이 없음",
         404:["결제 정보를 찾을 수 없음", "상품 정보를 찾을 수 없음"],
-        408: "결제 타임 아웃",
-        409: "재고 복구 중, 동시성 충돌 발생"
+        408: "결제 타임 아웃"
     })  
 )
 async def confirm_payment(
@@ -238,7 +208,7 @@ async def confirm_payment(
     payment_info = None
     
     try:
-        if not PaymentSchedulerService.remove_payment_schedule(request.payment_id):
+        if not await PaymentSchedulerService.remove_payment_schedule(request.payment_id):
             raise HTTPException(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 detail="결제 시간이 만료되었습니다."
@@ -334,6 +304,13 @@ async def confirm_payment(
         
         await order_repo.create(**order_data)
         
+        # 가게 주문 채널로 예약 이벤트 발행 (커밋 후), 실패해도 결제는 계속 진행
+        try:
+            created_order = await order_repo.get_order_with_store_relation(cart_item.payment_id)
+            publish_order_event(order_repo.session, convert_order_to_response(created_order))
+        except Exception as e:
+            logger.error(f"주문 예약 이벤트 생성 실패 - Payment ID: {cart_item.payment_id}, Error: {str(e)}")
+        
         # 장바구니에서 삭제
         await cart_repo.delete(cart_item.payment_id)
         
@@ -1,30 +1,102 @@
-from typing import List
+from typing import List, Optional, Tuple
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Query
 
 from utils.docs_error import create_error_responses
-from utils.store_utils import convert_store_to_response
+from utils.store_utils import convert_store_to_response, get_store_cards, get_favorite_flags
+from utils.cursor import encode_cursor, decode_cursor
 
 from api.deps.auth import CurrentCustomerDep
 from api.deps.repository import (
     StoreRepositoryDep, 
-    StoreProductInfoRepositoryDep
+    StoreProductInfoRepositoryDep,
+    CustomerFavoriteRepositoryDep
 )
 from schemas.product import ProductsResponse, ProductResponse
-from schemas.store import PaginatedStoreResponse
+from schemas.store import (
+    StoreDetailResponseForCustomer,
+    PaginatedStoreResponse,
+    PaginatedNearbyStoreResponse,
+    NearbyStoreResponse
+)
 from services.redis_cache import SearchHistoryCache
 
 router = APIRouter(prefix="/search", tags=["Customer-Search"])
 
 
+def _decode_store_cursor(cursor: Optional[str], sort_key: str) -> Optional[Tuple]:
+    """가게 목록 커서를 (정렬 키 값, store_id)로 디코딩"""
+    values = decode_cursor(cursor, ("k", "id"))
+    if values is None or sort_key != "created_at":
+        return values
+    
+    try:
+        return datetime.fromisoformat(values[0]), values[1]
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 커서입니다"
+        )
+
+
+def _decode_nearby_cursor(cursor: Optional[str]) -> Optional[Tuple[float, str]]:
+    """주변 가게 커서를 (거리, store_id)로 디코딩"""
+    values = decode_cursor(cursor, ("d", "id"))
+    if values is None:
+        return None
+    
+    distance, store_id = values
+    if isinstance(distance, bool) or not isinstance(distance, (int, float)) or not isinstance(store_id, str):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 커서입니다"
+        )
+    
+    return float(distance), store_id
+
+
+def _encode_store_cursor(store_rows: List, is_end: bool) -> Optional[str]:
+    """페이지 마지막 가게의 (정렬 키 값, store_id)로 다음 페이지 커서 생성"""
+    if is_end or not store_rows:
+        return None
+    
+    last_row = store_rows[-1]
+    value = last_row.sort_value
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    
+    return encode_cursor({"k": value, "id": last_row.store_id})
+
+
+async def _build_store_responses(
+    store_rows: List,
+    customer_email: str,
+    store_repo: StoreRepositoryDep,
+    favorite_repo: CustomerFavoriteRepositoryDep
+) -> List[StoreDetailResponseForCustomer]:
+    """페이지의 store_id 목록을 캐시된 가게 카드와 즐겨찾기 여부로 응답 변환"""
+    store_ids = [row.store_id for row in store_rows]
+    cards = await get_store_cards(store_ids, store_repo)
+    favorite_flags = await get_favorite_flags(customer_email, store_ids, favorite_repo)
+    return [
+        convert_store_to_response(cards[store_id], is_favorite)
+        for store_id, is_favorite in zip(store_ids, favorite_flags)
+        if store_id in cards
+    ]
+
+
 @router.get("/stores", response_model=PaginatedStoreResponse,
     responses=create_error_responses({
+        400:"올바르지 않은 커서",
         401:["인증 정보가 없음", "토큰 만료"]
     })
 )
 async def get_stores(
     current_user: CurrentCustomerDep,
     store_repo: StoreRepositoryDep,
-    page: int = Query(0, description="페이지 번호", ge=0)
+    favorite_repo: CustomerFavoriteRepositoryDep,
+    page: int = Query(0, description="페이지 번호 (cursor가 없을 때만 사용)", ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
     가게 및 상품 정보 조회 API
@@ -37,13 +109,19 @@ async def get_stores(
     items_per_page = 4
     offset = page * items_per_page
     
-    store_results, is_end = await store_repo.get_stores_with_products_and_favorites(
-        customer_email, offset=offset, limit=items_per_page
+    store_rows, is_end = await store_repo.get_store_ids_with_products(
+        offset=offset,
+        limit=items_per_page,
+        cursor=_decode_store_cursor(cursor, "created_at")
     )
     
-    stores = [convert_store_to_response(store, is_favorite) for store, is_favorite in store_results]
+    stores = await _build_store_responses(store_rows, customer_email, store_repo, favorite_repo)
     
-    return PaginatedStoreResponse(stores=stores, is_end=is_end)
+    return PaginatedStoreResponse(
+        stores=stores,
+        is_end=is_end,
+        next_cursor=_encode_store_cursor(store_rows, is_end)
+    )
 
 
 @router.get("/stores/{store_id}/products", response_model=ProductsResponse,
@@ -102,16 +180,19 @@ async def get_store_products(
 
 @router.get("/stores/by-location", response_model=PaginatedStoreResponse,
     responses=create_error_responses({
+        400:"올바르지 않은 커서",
         401:["인증 정보가 없음", "토큰 만료"]
     })
 )
 async def search_stores_by_location(
     current_user: CurrentCustomerDep,
     store_repo: StoreRepositoryDep,
+    favorite_repo: CustomerFavoriteRepositoryDep,
     sido: str = Query(..., description="시/도"),
     sigungu: str = Query(..., description="시/군/구"),
     bname: List[str] = Query(..., description="읍/면/동 리스트"),
-    page: int = Query(0, description="페이지 번호", ge=0)
+    page: int = Query(0, description="페이지 번호 (cursor가 없을 때만 사용)", ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
     위치로만 가게 검색 API
@@ -123,30 +204,90 @@ async def search_stores_by_location(
     items_per_page = 4
     offset = page * items_per_page
     
-    store_results, is_end = await store_repo.search_by_location_with_favorites(
+    store_rows, is_end = await store_repo.search_store_ids_by_location(
         sido=sido,
         sigungu=sigungu,
         bname=bname,
-        customer_email=customer_email,
         offset=offset,
-        limit=items_per_page
+        limit=items_per_page,
+        cursor=_decode_store_cursor(cursor, "store_name")
+    )
+    
+    stores = await _build_store_responses(store_rows, customer_email, store_repo, favorite_repo)
+    
+    return PaginatedStoreResponse(
+        stores=stores,
+        is_end=is_end,
+        next_cursor=_encode_store_cursor(store_rows, is_end)
     )
 
-    stores = [convert_store_to_response(store, is_favorite) for store, is_favorite in store_results]
+
+@router.get("/stores/nearby", response_model=PaginatedNearbyStoreResponse,
+    responses=create_error_responses({
+        400:"올바르지 않은 커서",
+        401:["인증 정보가 없음", "토큰 만료"]
+    })
+)
+async def search_stores_nearby(
+    current_user: CurrentCustomerDep,
+    store_repo: StoreRepositoryDep,
+    favorite_repo: CustomerFavoriteRepositoryDep,
+    lat: float = Query(..., description="기준 위도", ge=-90, le=90),
+    lng: float = Query(..., description="기준 경도", ge=-180, le=180),
+    radius_m: int = Query(1000, description="검색 반경 (미터)", ge=100, le=20000),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
+):
+    """
+    주변 가게 검색 API
+    
+    기준 좌표로부터 반경 내에 위치한 가게들을 가까운 순으로 조회
+    """
+    customer_email = current_user["sub"]
+    
+    items_per_page = 4
+    
+    store_rows, is_end = await store_repo.search_store_ids_nearby(
+        lat=lat,
+        lng=lng,
+        radius_m=radius_m,
+        cursor=_decode_nearby_cursor(cursor),
+        limit=items_per_page
+    )
     
-    return PaginatedStoreResponse(stores=stores, is_end=is_end)
+    store_ids = [row.store_id for row in store_rows]
+    cards = await get_store_cards(store_ids, store_repo)
+    favorite_flags = await get_favorite_flags(customer_email, store_ids, favorite_repo)
+    stores = [
+        NearbyStoreResponse(
+            **cards[row.store_id],
+            is_favorite=is_favorite,
+            distance_m=round(row.sort_value)
+        )
+        for row, is_favorite in zip(store_rows, favorite_flags)
+        if row.store_id in cards
+    ]
+    
+    next_cursor = None
+    if not is_end and store_rows:
+        last_row = store_rows[-1]
+        next_cursor = encode_cursor({"d": last_row.sort_value, "id": last_row.store_id})
+    
+    return PaginatedNearbyStoreResponse(stores=stores, is_end=is_end, next_cursor=next_cursor)
 
 
 @router.get("/stores/by-name", response_model=PaginatedStoreResponse,
     responses=create_error_responses({
+        400:"올바르지 않은 커서",
         401:["인증 정보가 없음", "토큰 만료"]
     })
 )
 async def search_stores_by_name(
     current_user: CurrentCustomerDep,
     store_repo: StoreRepositoryDep,
+    favorite_repo: CustomerFavoriteRepositoryDep,
     search_name: str = Query(..., description="검색할 가게 또는 상품 이름"),
-    page: int = Query(0, description="페이지 번호", ge=0)
+    page: int = Query(0, description="페이지 번호 (cursor가 없을 때만 사용)", ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
     가게/상품 이름으로 검색 API
@@ -158,30 +299,40 @@ async def search_stores_by_name(
     items_per_page = 4
     offset = page * items_per_page
     
-    store_results, is_end = await store_repo.search_by_name_with_favorites(
-        search_name, customer_email, offset=offset, limit=items_per_page
+    store_rows, is_end = await store_repo.search_store_ids_by_name(
+        search_name,
+        offset=offset,
+        limit=items_per_page,
+        cursor=_decode_store_cursor(cursor, "store_name")
     )
     
     await SearchHistoryCache.add_search_name(customer_email, search_name)
     
-    stores = [convert_store_to_response(store, is_favorite) for store, is_favorite in store_results]
+    stores = await _build_store_responses(store_rows, customer_email, store_repo, favorite_repo)
     
-    return PaginatedStoreResponse(stores=stores, is_end=is_end)
+    return PaginatedStoreResponse(
+        stores=stores,
+        is_end=is_end,
+        next_cursor=_encode_store_cursor(store_rows, is_end)
+    )
 
 
 @router.get("/stores/by-location-name", response_model=PaginatedStoreResponse,
     responses=create_error_responses({
+        400:"올바르지 않은 커서",
         401:["인증 정보가 없음", "토큰 만료"]
     })
 )
 async def search_stores_by_location_name(
     current_user: CurrentCustomerDep,
     store_repo: StoreRepositoryDep,
+    favorite_repo: CustomerFavoriteRepositoryDep,
     sido: str = Query(..., description="시/도"),
     sigungu: str = Query(..., description="시/군/구"),
     bname: List[str] = Query(..., description="읍/면/동 리스트"),
     search_name: str = Query(..., description="검색할 가게 또는 상품 이름"),
-    page: int = Query(0, description="페이지 번호", ge=0)
+    page: int = Query(0, description="페이지 번호 (cursor가 없을 때만 사용)", ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
     주소와 가게/상품 이름으로 검색 API
@@ -194,18 +345,22 @@ async def search_stores_by_location_name(
     items_per_page = 4
     offset = page * items_per_page
     
-    store_results, is_end = await store_repo.search_by_location_and_name_with_favorites(
+    store_rows, is_end = await store_repo.search_store_ids_by_location_and_name(
         sido=sido,
         sigungu=sigungu,
         bname=bname,
         search_name=search_name,
-        customer_email=customer_email,
         offset=offset,
-        limit=items_per_page
+        limit=items_per_page,
+        cursor=_decode_store_cursor(cursor, "store_name")
     )
     
     await SearchHistoryCache.add_search_name(customer_email, search_name)
     
-    stores = [convert_store_to_response(store, is_favorite) for store, is_favorite in store_results]
+    stores = await _build_store_responses(store_rows, customer_email, store_repo, favorite_repo)
     
-    return PaginatedStoreResponse(stores=stores, is_end=is_end)
\ No newline at end of file
+    return PaginatedStoreResponse(
+        stores=stores,
+        is_end=is_end,
+        next_cursor=_encode_store_cursor(store_rows, is_end)
+    )
\ No newline at end of file
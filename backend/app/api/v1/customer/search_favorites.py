@@ -2,7 +2,7 @@ from typing import List
 from fastapi import APIRouter, HTTPException, status
 
 from utils.docs_error import create_error_responses
-from utils.store_utils import convert_store_to_response
+from utils.store_utils import convert_store_to_response, get_store_cards
 
 from api.deps.auth import CurrentCustomerDep
 from api.deps.repository import (
@@ -10,6 +10,7 @@ from api.deps.repository import (
     CustomerFavoriteRepositoryDep
 )
 from schemas.store import StoreDetailResponseForCustomer, StoreFavoriteStateResponse
+from services.redis_cache import FavoriteCache
 
 router = APIRouter(prefix="/search", tags=["Customer-Search"])
 
@@ -30,12 +31,18 @@ async def get_favorite_stores(
     """
     customer_email = current_user["sub"]
     
-    stores = await store_repo.get_favorite_stores_with_full_info(customer_email)
+    store_ids = await store_repo.get_favorite_store_ids(customer_email)
     
-    if not stores:
+    if not store_ids:
         return []
     
-    return [convert_store_to_response(store, is_favorite=True) for store in stores]
+    cards = await get_store_cards(store_ids, store_repo)
+    
+    return [
+        convert_store_to_response(cards[store_id], is_favorite=True)
+        for store_id in store_ids
+        if store_id in cards
+    ]
 
 
 @router.post("/stores/{store_id}/favorites", response_model=StoreFavoriteStateResponse,
@@ -76,6 +83,7 @@ async def add_favorite_store(
     
     # 즐겨찾기 추가
     await favorite_repo.create_for_customer(customer_email, store_id)
+    await FavoriteCache.add_favorite(customer_email, store_id)
     
     return StoreFavoriteStateResponse(message="즐겨찾기에 추가되었습니다")
 
@@ -106,5 +114,7 @@ async def remove_favorite_store(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="즐겨찾기에서 찾을 수 없습니다"
         )
+    
+    await FavoriteCache.remove_favorite(customer_email, store_id)
         
     return StoreFavoriteStateResponse(message="즐겨찾기가 삭제 되었습니다")
\ No newline at end of file
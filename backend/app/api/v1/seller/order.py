@@ -1,21 +1,22 @@
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks, WebSocket, WebSocketDisconnect
-from datetime import datetime, timezone
-import asyncio
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, WebSocket, WebSocketDisconnect, Request
+from fastapi.responses import StreamingResponse
 
 from utils.qr_generator import encode_qr_data
 from utils.docs_error import create_error_responses
-from utils.store_utils import get_store_id_by_email
+from utils.store_utils import get_store_id_by_email, convert_order_to_response
 from utils.string_utils import parse_comma_separated_string
 
 from api.deps.auth import CurrentSellerDep
+from database.session import get_session
+from repositories.store import StoreRepository
 from api.deps.repository import (
     StoreRepositoryDep,
     OrderCurrentItemRepositoryDep,
     OrderHistoryItemRepositoryDep,
     StoreProductInfoRepositoryDep,
-    StorePaymentInfoRepositoryDep
+    StorePaymentInfoRepositoryDep,
+    StoreProductDailyStatRepositoryDep
 )
-from repositories.store_product_info import StockUpdateResult
 from schemas.order import (
     OrderItemResponse,
     OrderListResponse,
@@ -28,8 +29,8 @@ from schemas.order import (
 )
 from services.payment import PaymentService
 from services.qr_callback import QRCallbackCache
+from services.order_event import OrderEventChannel, publish_order_event
 from services.background_email import send_order_accepted_email, send_seller_cancel_email
-from config.settings import settings
 
 router = APIRouter(prefix="/store/orders", tags=["Seller-Order"])
 
@@ -194,6 +195,39 @@ async def get_order_today(
     )
 
 
+@router.get("/stream",
+    responses=create_error_responses({
+        401:["인증 정보가 없음", "토큰 만료"],
+        404:"등록된 가게를 찾을 수 없음"
+    })
+)
+async def stream_store_orders(
+    request: Request,
+    current_user: CurrentSellerDep
+):
+    """
+    가게 주문 실시간 스트림 (SSE)
+    - 주문 예약/수락/완료/취소 시 `event: order` 로 변경된 주문 전달
+    - data: {"event": 주문 상태, "order": OrderItemResponse}
+    - 최초 목록은 /today 로 조회 후, 이후 변경분만 반영
+    """
+    
+    seller_email = current_user["sub"]
+    
+    # 스트림 동안 DB 연결을 붙잡지 않도록 가게 조회 후 바로 세션 반환
+    async with get_session(auto_commit=False) as session:
+        store_id = await get_store_id_by_email(seller_email, StoreRepository(session))
+    
+    return StreamingResponse(
+        OrderEventChannel.stream(store_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @router.patch("/{payment_id}/accept", response_model=OrderItemResponse,
     responses=create_error_responses({
         400:"이미 처리한 주문",
@@ -230,18 +264,20 @@ async def update_order_accept(
             detail="이미 처리된 주문입니다"
         )
     
-    updated_order = await order_repo.update(
-        payment_id,
-        status=OrderStatus.accept,
-        accepted_at=datetime.now(timezone.utc)
-    )
+    # 상태 확인과 변경을 한 문장으로 처리 (동시 수락 시 한 건만 성공)
+    updated_order = await order_repo.accept_order(payment_id)
+    if not updated_order:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 처리된 주문입니다"
+        )
     
     # 주문 확정 이메일을 백그라운드로 전송
     store = await store_repo.get_by_store_id(store_id)
     background_tasks.add_task(send_order_accepted_email, order.customer_id, store.store_name)
     
     # response 포맷으로 변환
-    return OrderItemResponse(
+    order_response = OrderItemResponse(
         payment_id=updated_order.payment_id,
         customer_id=order.customer_id,
         customer_nickname=order.customer.detail.nickname,
@@ -265,14 +301,18 @@ async def update_order_accept(
         allergies=parse_comma_separated_string(updated_order.allergies),
         topping_types=parse_comma_separated_string(updated_order.topping_types)
     )
+    
+    # 가게 주문 채널로 수락 이벤트 발행 (커밋 후)
+    publish_order_event(order_repo.session, order_response)
+    
+    return order_response
 
 
 @router.delete("/{payment_id}/cancel", response_model=OrderCancelResponse,
     responses=create_error_responses({
         400:"이미 취소한 주문",
         401:["인증 정보가 없음", "토큰 만료"],
-        404:"등록된 가게를 찾을 수 없음",
-        409:"재고 복구 중, 충돌 발생"
+        404:"등록된 가게를 찾을 수 없음"
     })                    
 )
 async def cancel_order(
@@ -315,6 +355,18 @@ async def cancel_order(
             detail="가게의 결제 설정이 완료되지 않았습니다"
         )
     
+    # 주문을 먼저 취소 상태로 바꿔 잠근 뒤 환불 (환불이 실패하면 요청 전체가 롤백되어 주문이 유지됨)
+    quantity = await order_repo.cancel_order(
+        payment_id,
+        cancel_reason=request.reason,
+        allowed_statuses=[OrderStatus.reservation, OrderStatus.accept, OrderStatus.complete]
+    )
+    if quantity is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 취소된 주문입니다"
+        )
+    
     # 포트원 환불 처리
     refund_result = await PaymentService.process_refund(
         payment_id=payment_id,
@@ -328,20 +380,10 @@ async def cancel_order(
             detail=refund_result.get("error", "환불 처리 중 오류가 발생했습니다")
         )
     
-    quantity = await order_repo.cancel_order(payment_id, cancel_reason=request.reason)
+    await product_repo.release_stock(order.product_id, quantity)
     
-    max_retries = settings.MAX_RETRY_LOCK
-    for attempt in range(max_retries):
-        result = await product_repo.adjust_purchased_stock(order.product_id, -quantity)
-        
-        if result == StockUpdateResult.SUCCESS:
-            break
-        
-        if attempt == max_retries - 1:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="재고 복구 중 충돌이 발생했습니다. 다시 시도해주세요."
-            )
+    # 가게 주문 채널로 취소 이벤트 발행 (커밋 후)
+    publish_order_event(order_repo.session, convert_order_to_response(order))
     
     # 판매자 주문 취소 이메일을 백그라운드로 전송
     store = await store_repo.get_by_store_id(store_id)
@@ -416,33 +458,33 @@ async def get_order_qr(
 async def get_dashboard(
     current_user: CurrentSellerDep,
     store_repo: StoreRepositoryDep,
-    product_repo: StoreProductInfoRepositoryDep,
-    order_repo: OrderCurrentItemRepositoryDep,
+    daily_stat_repo: StoreProductDailyStatRepositoryDep,
 ):
     """
     대시보드 - 재고 현황 조회
+    
+    주문 상태 변경 시 함께 갱신되는 상품별 당일 주문 집계를 상품 목록과 한 번에 조회
     """
     
     seller_email = current_user["sub"]
     
     store_id = await get_store_id_by_email(seller_email, store_repo)
     
-    store_current_orders = await order_repo.get_by_store_id(store_id)
-    
-    # 가게의 모든 상품 조회
-    products = await product_repo.get_by_store_id(store_id)
-    
-    product_order_quantities = {}
-    for order in store_current_orders:
-        if order.status != OrderStatus.cancel:
-            if order.product_id not in product_order_quantities:
-                product_order_quantities[order.product_id] = 0
-            product_order_quantities[order.product_id] += order.quantity
+    product_stats = await daily_stat_repo.get_store_product_stats(store_id)
     
     # 대시보드 응답 생성
     dashboard_items = []
-    for product in products:
-        purchased_stock = product_order_quantities.get(product.product_id, 0)
+    for product, stat in product_stats:
+        counters = {
+            "reserved_quantity": stat.reserved_quantity if stat else 0,
+            "accepted_quantity": stat.accepted_quantity if stat else 0,
+            "completed_quantity": stat.completed_quantity if stat else 0,
+            "cancelled_quantity": stat.cancelled_quantity if stat else 0,
+            "sales_amount": (stat.accepted_amount + stat.completed_amount) if stat else 0,
+        }
+        purchased_stock = (
+            counters["reserved_quantity"] + counters["accepted_quantity"] + counters["completed_quantity"]
+        )
         
         current_stock = product.initial_stock - purchased_stock + product.admin_adjustment
         
@@ -452,7 +494,8 @@ async def get_dashboard(
             current_stock=current_stock,
             initial_stock=product.initial_stock,
             purchased_stock=purchased_stock,
-            adjustment_stock=product.admin_adjustment
+            adjustment_stock=product.admin_adjustment,
+            **counters
         )
         dashboard_items.append(dashboard_item)
     
@@ -470,48 +513,29 @@ async def qr_callback_websocket(
     """
     QR 콜백 WebSocket 엔드포인트
     - 30초 동안 연결 유지
-    - 완료 상태가 되면 응답 전송 후 연결 종료
+    - 완료 알림을 받으면 응답 전송 후 연결 종료
     """
     await websocket.accept()
     
     try:
         await QRCallbackCache.set_waiting_status(payment_id)
         
-        async def check_payment_status():
-            for _ in range(31):
-                try:
-                    status = await QRCallbackCache.get_status(payment_id)
-                    
-                    if status is None:
-                        await websocket.send_json({
-                            "status": "error",
-                            "message": "Payment ID를 찾을 수 없습니다. 다시 시도 해주세요."
-                        })
-                        return
-                    
-                    if status == QRCallbackCache.COMPLETED_STATUS:
-                        await websocket.send_json({
-                            "status": "completed",
-                            "message": "Payment completed successfully"
-                        })
-                        return
-                    
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    await websocket.send_json({
-                        "status": "error",
-                        "message": str(e)
-                    })
-                    return
-            
+        completed = await QRCallbackCache.wait_for_completed(
+            payment_id,
+            timeout=QRCallbackCache.TTL_SECONDS
+        )
+        
+        if completed:
+            await websocket.send_json({
+                "status": "completed",
+                "message": "Payment completed successfully"
+            })
+        else:
             await websocket.send_json({
                 "status": "timeout",
                 "message": "Connection timeout after 30 seconds"
             })
         
-        await check_payment_status()
-        
     except WebSocketDisconnect:
         pass
     except Exception as e:
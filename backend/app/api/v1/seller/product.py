@@ -7,7 +7,8 @@ from api.deps.repository import (
     StoreRepositoryDep,
     StoreProductInfoRepositoryDep,
     ProductNutritionRepositoryDep,
-    ProductStockReservationRepositoryDep
+    ProductStockReservationRepositoryDep,
+    StoreSearchIndexRepositoryDep
 )
 from repositories.store_product_info import StockUpdateResult
 from schemas.product import (
@@ -16,9 +17,13 @@ from schemas.product import (
     ProductResponse,
     ProductNutritionRequest,
     ProductStockReservationRequest,
-    ProductStockReservationResponse
+    ProductStockReservationResponse,
+    ProductHotStockRequest,
+    ProductHotStockResponse
 )
 from utils.id_generator import generate_product_id
+from services.store_card import mark_store_cards_dirty
+from services.hot_stock import sync_hot_stock_on_commit
 from config.settings import settings
 
 router = APIRouter(prefix="/store/products", tags=["Seller-Product"])
@@ -35,7 +40,8 @@ async def create_product(
     request: ProductCreateRequest,
     current_user: CurrentSellerDep,
     store_repo: StoreRepositoryDep,
-    product_repo: StoreProductInfoRepositoryDep
+    product_repo: StoreProductInfoRepositoryDep,
+    search_index_repo: StoreSearchIndexRepositoryDep
 ):
     """
     새 상품 등록
@@ -65,6 +71,9 @@ async def create_product(
         sale=request.sale,
         nutrition_types=request.nutrition_types
     )
+    
+    # 검색 색인 갱신
+    await search_index_repo.refresh_store(store_id)
 
     response_data = {
         **product.__dict__,
@@ -132,7 +141,8 @@ async def update_product(
     request: ProductUpdateRequest,
     current_user: CurrentSellerDep,
     store_repo: StoreRepositoryDep,
-    product_repo: StoreProductInfoRepositoryDep
+    product_repo: StoreProductInfoRepositoryDep,
+    search_index_repo: StoreSearchIndexRepositoryDep
 ):
     """
     상품 정보 수정
@@ -159,6 +169,10 @@ async def update_product(
 
     if update_data:
         await product_repo.update(product_id, **update_data)
+    
+    # 상품 이름이 바뀌면 검색 색인 갱신
+    if 'product_name' in update_data:
+        await search_index_repo.refresh_store(product.store_id)
 
     updated_product = await product_repo.get_with_nutrition_info(product_id)
     nutrition_types = [n.nutrition_type for n in updated_product.nutrition_info] if updated_product.nutrition_info else []
@@ -291,6 +305,49 @@ async def decrease_product_stock(
             )
 
 
+@router.patch("/{product_id}/stock/hot", response_model=ProductHotStockResponse,
+    responses=create_error_responses({
+        401: ["인증 정보가 없음", "토큰 만료"],
+        404: "상품을 찾을 수 없음"
+    })
+)
+async def update_product_hot_stock(
+    product_id: str,
+    request: ProductHotStockRequest,
+    current_user: CurrentSellerDep,
+    store_repo: StoreRepositoryDep,
+    product_repo: StoreProductInfoRepositoryDep
+):
+    """
+    상품 hot 모드 설정
+    
+    주문이 몰리는 상품은 hot 모드로 설정하면 재고가 Redis 카운터에서 처리됨
+    (커밋 직후 카운터가 현재 재고로 생성되고, 해제하면 남은 변화량을 DB에 반영한 뒤 삭제)
+    """
+    
+    seller_email = current_user["sub"]
+    
+    store_id = await get_store_id_by_email(seller_email, store_repo)
+    
+    product = await product_repo.get_by_product_id(product_id)
+    
+    if not product or product.store_id != store_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="상품을 찾을 수 없습니다"
+        )
+    
+    if product.is_hot_stock != request.is_hot_stock:
+        product = await product_repo.update(product_id, is_hot_stock=request.is_hot_stock)
+        sync_hot_stock_on_commit(product_repo.session)
+    
+    return ProductHotStockResponse(
+        product_id=product.product_id,
+        is_hot_stock=product.is_hot_stock,
+        current_stock=await product_repo.get_available_stock(product)
+    )
+
+
 @router.get("/{product_id}/stock/reservation", response_model=ProductStockReservationResponse,
     responses=create_error_responses({
         401: ["인증 정보가 없음", "토큰 만료"],
@@ -463,6 +520,8 @@ async def add_product_nutrition(
             detail=f"이미 존재하는 영양 타입: {', '.join([d.value for d in duplicates])}"
         )
     
+    mark_store_cards_dirty(nutrition_repo.session, product.store_id)
+    
     # 응답 생성
     response_data = {
         **product.__dict__,
@@ -520,6 +579,8 @@ async def remove_product_nutrition(
             detail=f"존재하지 않는 영양 타입: {', '.join([nt.value for nt in not_found])}"
         )
     
+    mark_store_cards_dirty(nutrition_repo.session, product.store_id)
+    
     # 업데이트된 영양 정보 조회
     updated_nutrition = await nutrition_repo.get_nutrition_types_by_product(product_id)
     
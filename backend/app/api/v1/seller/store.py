@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, status
 from loguru import logger
 
 from utils.docs_error import create_error_responses
-from utils.store_utils import get_store_id_by_email
+from utils.store_utils import get_store_id_by_email, convert_order_to_response
 from api.deps.auth import CurrentSellerDep
 from api.deps.repository import (
     StoreRepositoryDep, 
@@ -11,7 +11,6 @@ from api.deps.repository import (
     StorePaymentInfoRepositoryDep,
     StoreProductInfoRepositoryDep
 )
-from repositories.store_product_info import StockUpdateResult
 from schemas.store import StoreDetailResponse, StoreSNSInfo, StoreCloseStateResponse
 from schemas.product import ProductResponse
 from schemas.image import ImageUploadResponse
@@ -19,8 +18,8 @@ from schemas.store_operation import StoreOperationResponse
 from schemas.store_settings import StoreAddressResponse
 from schemas.order import OrderStatus
 from services.payment import PaymentService
+from services.order_event import publish_order_event
 from core.object_storage import object_storage
-from config.settings import settings
 
 router = APIRouter(prefix="/store", tags=["Seller-Store"])
 
@@ -179,44 +178,55 @@ async def close_store(
                 detail="가게의 결제 설정이 완료되지 않았습니다"
             )
         
+        # 마감 상태는 환불 결과와 관계없이 먼저 반영
+        await operation_repo.session.commit()
+        
         current_orders = await order_repo.get_store_current_orders_with_relations(store_id)
         
         refund_count = 0
         
-        for order in current_orders:
-            if order.status in [OrderStatus.reservation, OrderStatus.accept]:
-                try:
-                    refund_result = await PaymentService.process_refund(
-                        payment_id=order.payment_id,
-                        secret_key=payment_info.portone_secret_key,
-                        reason="‘기타 사정’ 으로 주문이 취소되었어요."
-                    )
-                    
-                    if refund_result.get("success"):
-                        # 주문 취소 처리
-                        quantity = await order_repo.cancel_order(
-                            payment_id=order.payment_id,
-                            cancel_reason="‘기타 사정’ 으로 주문이 취소되었어요."
-                        )
-                        
-                        # 재고 복구
-                        max_retries = settings.MAX_RETRY_LOCK
-                        for attempt in range(max_retries):
-                            result = await product_repo.adjust_purchased_stock(order.product_id, -quantity)
-                            
-                            if result == StockUpdateResult.SUCCESS:
-                                break
-                            
-                            if attempt == max_retries - 1:
-                                logger.error(f"가게 마감 처리로 인한 환불 중 - 재고 복구 오류 발생: {str(e)}")
-                                break
-                        
-                        refund_count += 1
-                    else:
-                        logger.error(f"가게 마감 처리로 인한 환불 중 - 환불 오류 발생: {str(e)}")
-                        
-                except Exception as e:
-                    logger.error(f"가게 마감 처리로 인한 환불 중 - 오류 발생: {str(e)}")
+        # 롤백하면 조회한 주문 객체가 만료되므로 필요한 값만 미리 꺼내 둠
+        cancel_targets = [
+            (order.payment_id, order.product_id)
+            for order in current_orders
+            if order.status in [OrderStatus.reservation, OrderStatus.accept]
+        ]
+        
+        # 주문마다 취소 → 환불 → 커밋 (환불이 실패하면 해당 주문의 취소만 롤백)
+        for payment_id, product_id in cancel_targets:
+            try:
+                # 주문을 먼저 취소 상태로 바꿔 잠근 뒤 환불 (그 사이 이미 처리된 주문은 환불하지 않음)
+                quantity = await order_repo.cancel_order(
+                    payment_id=payment_id,
+                    cancel_reason="‘기타 사정’ 으로 주문이 취소되었어요."
+                )
+                if quantity is None:
+                    await order_repo.session.rollback()
+                    continue
+                
+                refund_result = await PaymentService.process_refund(
+                    payment_id=payment_id,
+                    secret_key=payment_info.portone_secret_key,
+                    reason="‘기타 사정’ 으로 주문이 취소되었어요."
+                )
+                
+                if not refund_result.get("success"):
+                    await order_repo.session.rollback()
+                    logger.error(f"가게 마감 처리로 인한 환불 중 - 환불 오류 발생: {refund_result.get('error')}")
+                    continue
+                
+                await product_repo.release_stock(product_id, quantity)
+                
+                # 가게 주문 채널로 취소 이벤트 발행 (커밋 후)
+                canceled_order = await order_repo.get_order_with_store_relation(payment_id)
+                publish_order_event(order_repo.session, convert_order_to_response(canceled_order))
+                
+                await order_repo.session.commit()
+                refund_count += 1
+                
+            except Exception as e:
+                await order_repo.session.rollback()
+                logger.error(f"가게 마감 처리로 인한 환불 중 - 오류 발생: {str(e)}")
         
         # 결과 반환
         return {
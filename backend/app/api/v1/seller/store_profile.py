@@ -3,7 +3,7 @@ from fastapi import APIRouter, HTTPException, status
 from utils.docs_error import create_error_responses
 from utils.store_utils import get_store_id_by_email
 from api.deps.auth import CurrentSellerDep, CurrentSellerNoActiveDep
-from api.deps.repository import StoreRepositoryDep
+from api.deps.repository import StoreRepositoryDep, StoreSearchIndexRepositoryDep
 from schemas.seller_profile import (
     StoreNameUpdateRequest,
     StoreIntroductionUpdateRequest,
@@ -38,7 +38,8 @@ async def get_customer_profile_all(
 async def update_store_name(
     request: StoreNameUpdateRequest,
     current_user: CurrentSellerDep,
-    store_repo: StoreRepositoryDep
+    store_repo: StoreRepositoryDep,
+    search_index_repo: StoreSearchIndexRepositoryDep
 ):
     """
     매장 이름 수정
@@ -54,6 +55,9 @@ async def update_store_name(
             store_name=request.store_name
         )
         
+        # 검색 색인 갱신
+        await search_index_repo.refresh_store(store_id)
+        
         return StoreProfileResponse(
             store_id=updated_store.store_id,
             store_name=updated_store.store_name,
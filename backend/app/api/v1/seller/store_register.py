@@ -5,7 +5,7 @@ from utils.id_generator import generate_store_id
 from utils.docs_error import create_error_responses
 from utils.store_utils import get_store_id_by_email
 from api.deps.auth import CurrentSellerDep
-from api.deps.repository import StoreRepositoryDep, StorePaymentInfoRepositoryDep
+from api.deps.repository import StoreRepositoryDep, StorePaymentInfoRepositoryDep, StoreSearchIndexRepositoryDep
 from api.deps.service import ImageServiceDep
 from schemas.seller_profile import SellerProfileCreateRequest, SellerProfileResponse, StorePaymentInfoCreateRequest, StorePaymentInfoCheckResponse
 from schemas.image import StoreImagesUploadResponse
@@ -24,7 +24,8 @@ router = APIRouter(prefix="/store/register", tags=["Seller-Store-Register"])
 async def register_seller_store(
     request: SellerProfileCreateRequest,
     current_user: CurrentSellerDep,
-    store_repo: StoreRepositoryDep
+    store_repo: StoreRepositoryDep,
+    search_index_repo: StoreSearchIndexRepositoryDep
 ):
     """
     판매자 1차 가게 등록 회원가입 완료
@@ -97,6 +98,9 @@ async def register_seller_store(
             operation_times=operation_times_dict
         )
         
+        # 검색 색인 생성
+        await search_index_repo.refresh_store(store.store_id)
+        
         # 성공 응답
         return SellerProfileResponse(
             store_id=store.store_id,
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, status, Query
 from datetime import datetime, timedelta, date
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from collections import defaultdict
 import pytz
 
@@ -11,8 +11,11 @@ from api.deps.auth import CurrentSellerDep
 from api.deps.repository import (
     StoreRepositoryDep,
     OrderCurrentItemRepositoryDep,
-    OrderHistoryItemRepositoryDep
+    OrderHistoryItemRepositoryDep,
+    SettlementDailyRepositoryDep
 )
+from database.models.order_current_item import OrderCurrentItem
+from repositories.settlement_daily import SettlementDailyRepository
 from schemas.order import (
     OrderStatus,
     SettlementResponse,
@@ -24,6 +27,48 @@ from schemas.order import (
 router = APIRouter(prefix="/store/settlement", tags=["Seller-Settlement"])
 kst = pytz.timezone('Asia/Seoul')
 
+# 정산에 포함되는 주문 상태
+SETTLEMENT_STATUSES = [OrderStatus.complete, OrderStatus.cancel]
+
+# 정산 조회 시 반환하는 지난 주문 수 상한
+SETTLEMENT_HISTORY_LIMIT = 100
+
+
+def _get_live_rollups(store_id: str, current_orders: List[OrderCurrentItem]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """아직 히스토리로 이동되지 않은 당일 주문을 일별 정산 집계 형태로 변환"""
+    return SettlementDailyRepository.aggregate_orders([
+        {
+            "store_id": store_id,
+            "product_id": order.product_id,
+            "product_name": order.product.product_name,
+            "quantity": order.quantity,
+            "total_amount": order.total_amount,
+            "status": order.status.value,
+            "reservation_at": order.reservation_at,
+            "accepted_at": order.accepted_at,
+            "completed_at": order.completed_at,
+            "canceled_at": order.canceled_at
+        }
+        for order in current_orders
+    ])
+
+
+def _merge_rollup(target: Dict[str, Any], rollup: Dict[str, Any]) -> None:
+    """일별 정산 집계를 target에 더함"""
+    for status_key, totals in rollup["statuses"].items():
+        target_totals = target["statuses"].setdefault(status_key, {"count": 0, "quantity": 0, "amount": 0})
+        for key, value in totals.items():
+            target_totals[key] += value
+    
+    for product_id, product in rollup["products"].items():
+        target_product = target["products"].setdefault(
+            product_id, {"product_name": product["product_name"], "statuses": {}}
+        )
+        for status_key, totals in product["statuses"].items():
+            target_totals = target_product["statuses"].setdefault(status_key, {"count": 0, "quantity": 0, "amount": 0})
+            for key, value in totals.items():
+                target_totals[key] += value
+
 
 @router.get("", response_model=SettlementResponse,
     responses=create_error_responses({
@@ -37,6 +82,7 @@ async def get_store_settlement(
     store_repo: StoreRepositoryDep,
     order_repo: OrderCurrentItemRepositoryDep,
     history_repo: OrderHistoryItemRepositoryDep,
+    settlement_repo: SettlementDailyRepositoryDep,
     start_date: date = Query(..., description="조회 시작일"),
     end_date: date = Query(..., description="조회 종료일")
 ):
@@ -45,6 +91,8 @@ async def get_store_settlement(
     - start_date와 end_date 기간의 정산 데이터를 조회합니다
     - complete와 cancel 상태의 주문만 포함됩니다
     - 날짜별로 그룹화하여 반환합니다
+    - 지난 주문은 최근 주문부터 최대 100건까지 반환합니다
+    - 날짜별 픽업 완료/취소 금액 합계는 건수 제한 없이 일별 정산 집계에서 계산합니다
     """
     
     seller_email = current_user["sub"]
@@ -68,15 +116,19 @@ async def get_store_settlement(
     end_date_kst = kst.localize(end_datetime)
     end_date_utc = end_date_kst.astimezone(pytz.UTC)
     
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+    
     all_orders = []
     
+    # 아직 히스토리로 이동되지 않은 주문 (날짜별 합계에도 사용)
+    current_orders = await order_repo.get_store_orders_with_relations(store_id)
+    
     # end_date가 오늘인 경우 current에서 조회
     if end_date >= today.date():
-        current_orders = await order_repo.get_store_orders_with_relations(store_id)
-        
         for order in current_orders:
             # 날짜 범위 체크 (UTC 기준)
-            if order.status in [OrderStatus.complete, OrderStatus.cancel]:
+            if order.status in SETTLEMENT_STATUSES:
                 
                 # UTC를 KST로 변환
                 kst_date, kst_time = get_order_time_by_status(order, order.status)
@@ -90,12 +142,13 @@ async def get_store_settlement(
                     'time_at': kst_time
                 })
     
-    # 과거 날짜가 포함된 경우 history에서 조회
+    # 과거 날짜가 포함된 경우 history에서 조회 (최근 주문부터 SETTLEMENT_HISTORY_LIMIT건까지)
     if start_date < today.date():
         history_orders = await history_repo.get_store_history(
             store_id=store_id,
             start_date=start_date_utc,
-            end_date=end_date_utc
+            end_date=end_date_utc,
+            limit=SETTLEMENT_HISTORY_LIMIT
         )
         
         # 상태 필터링
@@ -118,6 +171,16 @@ async def get_store_settlement(
         date_str = order['date']
         daily_data[date_str].append(order)
     
+    # 날짜별 합계는 주문 목록 제한과 관계없이 일별 정산 집계에서 계산
+    daily_rollups: Dict[str, Dict[str, Any]] = {}
+    for rollup in await settlement_repo.get_store_range(store_id, start_str, end_str):
+        daily_rollups[rollup.date] = rollup.model_dump(include={"statuses", "products"})
+    
+    # 아직 히스토리로 이동되지 않은 당일 주문 집계 합산
+    for (_, date_str), rollup in _get_live_rollups(store_id, current_orders).items():
+        if start_str <= date_str <= end_str:
+            _merge_rollup(daily_rollups.setdefault(date_str, {"statuses": {}, "products": {}}), rollup)
+    
     daily_settlements = []
     
     for date_str in sorted(daily_data.keys(), reverse=True):
@@ -133,9 +196,13 @@ async def get_store_settlement(
                 time_at=order['time_at']
             ))
         
+        statuses = daily_rollups.get(date_str, {}).get("statuses", {})
+        
         daily_settlements.append(SettlementDayGroup(
             date=date_str,
             items=items,
+            completed_amount=statuses.get(OrderStatus.complete.value, {}).get("amount", 0),
+            canceled_amount=statuses.get(OrderStatus.cancel.value, {}).get("amount", 0)
         ))
     
     return SettlementResponse(
@@ -153,7 +220,7 @@ async def get_weekly_revenue(
     current_user: CurrentSellerDep,
     store_repo: StoreRepositoryDep,
     order_repo: OrderCurrentItemRepositoryDep,
-    history_repo: OrderHistoryItemRepositoryDep
+    settlement_repo: SettlementDailyRepositoryDep
 ):
     """
     주간 수익 집계
@@ -167,9 +234,7 @@ async def get_weekly_revenue(
     
     # 이번 주 월요일 찾기
     days_since_monday = today_kst.weekday()
-    monday_kst = (today_kst - timedelta(days=days_since_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    monday_utc = monday_kst.astimezone(pytz.UTC)
+    monday_kst = today_kst - timedelta(days=days_since_monday)
     
     total_revenue = 0
     
@@ -180,20 +245,21 @@ async def get_weekly_revenue(
         if order.status == OrderStatus.complete:
             total_revenue += order.total_amount
     
-    # 월요일부터 어제까지의 주문은 history에서 조회
+    # 월요일부터 어제까지의 주문은 일별 정산 집계에서 조회
     if days_since_monday > 0:
-        yesterday_end_utc = (today_kst - timedelta(days=1)).replace(hour=23, minute=59, second=59, microsecond=999999).astimezone(pytz.UTC)
+        yesterday_kst = today_kst - timedelta(days=1)
         
-        history_orders = await history_repo.get_store_history(
-            store_id=store_id,
-            start_date=monday_utc,
-            end_date=yesterday_end_utc
+        rollups = await settlement_repo.get_store_range(
+            store_id,
+            monday_kst.strftime('%Y-%m-%d'),
+            yesterday_kst.strftime('%Y-%m-%d')
         )
         
-        for order in history_orders:
-            if order.status == "complete":
-                total_revenue += order.total_amount
+        for rollup in rollups:
+            completed = rollup.statuses.get(OrderStatus.complete.value)
+            if completed:
+                total_revenue += completed.amount
     
     return WeeklyRevenueResponse(
         total_revenue=total_revenue
-    )
\ No newline at end of file
+    )
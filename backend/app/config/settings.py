@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -54,6 +55,13 @@ class Settings(BaseSettings):
     # 낙관적 Lock 재시도 횟수
     MAX_RETRY_LOCK: int
     
+    # 자동 환불 동시 요청 수 / 주문 취소 커밋 배치 크기
+    REFUND_CONCURRENCY: int = 10
+    REFUND_DB_BATCH_SIZE: int = 100
+    
+    # 동적 스케줄 작업 저장소 (기본값: PostgreSQL, 테스트 시 sqlite:///scheduler_jobs.sqlite 등)
+    SCHEDULER_JOBSTORE_URL: Optional[str] = None
+    
     # AWS S3 설정
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
@@ -77,6 +85,10 @@ class Settings(BaseSettings):
     def SYNC_DATABASE_URL(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
+    @property
+    def SCHEDULER_DATABASE_URL(self) -> str:
+        return self.SCHEDULER_JOBSTORE_URL or f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+    
     @property
     def REDIS_URL(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
@@ -1,3 +1,4 @@
+import asyncio
 import boto3
 import uuid
 from typing import BinaryIO, Optional, List, Tuple
@@ -9,6 +10,10 @@ from loguru import logger
 from config.settings import settings
 
 
+# delete_objects 한 번에 요청할 수 있는 최대 키 수
+DELETE_BATCH_SIZE = 1000
+
+
 class ObjectStorage:
     """AWS S3 객체 스토리지 관리 클래스"""
     
@@ -139,6 +144,47 @@ class ObjectStorage:
         except ClientError as e:
             logger.error(f"파일 삭제 실패 ({file_key}): {str(e)}")
             return False
+    
+    async def delete_files(self, file_keys: List[str]) -> List[str]:
+        """
+        여러 파일을 S3에서 삭제
+        
+        DELETE_BATCH_SIZE개씩 나눈 delete_objects 요청을 동시에 실행
+        
+        Args:
+            file_keys: 삭제할 파일 키 목록
+        
+        Returns:
+            삭제에 실패한 파일 키 목록
+        """
+        batches = [
+            file_keys[start:start + DELETE_BATCH_SIZE]
+            for start in range(0, len(file_keys), DELETE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._delete_batch, batch) for batch in batches)
+        )
+        return [file_key for failed_keys in results for file_key in failed_keys]
+    
+    def _delete_batch(self, file_keys: List[str]) -> List[str]:
+        """delete_objects 한 번으로 파일 삭제, 실패한 파일 키 목록 반환"""
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={
+                    'Objects': [{'Key': file_key} for file_key in file_keys],
+                    'Quiet': True
+                }
+            )
+        except ClientError as e:
+            logger.error(f"파일 일괄 삭제 실패 ({len(file_keys)}개): {str(e)}")
+            return file_keys
+        
+        failed_keys = []
+        for error in response.get('Errors', []):
+            logger.error(f"파일 삭제 실패 ({error['Key']}): {error.get('Message')}")
+            failed_keys.append(error['Key'])
+        return failed_keys
 
 
 # 싱글톤 인스턴스
@@ -1,24 +1,98 @@
 import json
+import httpx
+from collections import OrderedDict
 import portone_server_sdk as portone
 from config.settings import settings
 from fastapi import HTTPException
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 class PortOneClient:
     """
     PortOne API 클라이언트
+    
+    SDK의 비동기 메서드를 사용하며, 모든 가게가 연결 풀을 가진 하나의 HTTP 클라이언트를 공유함
+    인스턴스는 secret key별로 최근 사용한 MAX_CACHED_CLIENTS개까지 캐싱되므로 await get_client()로 가져와서 사용
     """
     
+    # 포트원 응답 지연이 요청 전체를 붙잡지 않도록 명시적 타임아웃 설정 (초)
+    CONNECT_TIMEOUT = 3.0
+    READ_TIMEOUT = 10.0
+    POOL_TIMEOUT = 5.0
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CACHED_CLIENTS = 256
+    
+    # PaymentClient가 함께 만드는 하위 클라이언트 (각자 AsyncClient를 가짐)
+    SDK_SUB_CLIENTS = ("billing_key", "cash_receipt", "payment_schedule", "promotion")
+    
+    _http_client: Optional[httpx.AsyncClient] = None
+    _clients: "OrderedDict[str, PortOneClient]" = OrderedDict()
+    
     def __init__(self, secret_key: Optional[str] = None):
         """
         secret_key가 제공되지 않으면 기본 테스트 키 사용
         """
         self.secret = secret_key
         self.client = portone.PaymentClient(secret=self.secret)
+    
+    async def _use_shared_http_client(self) -> None:
+        """
+        SDK 클라이언트들의 HTTP 클라이언트를 공유 클라이언트로 교체하고 기존 클라이언트는 닫음
+        
+        SDK(0.16.0)는 HTTP 클라이언트를 주입받는 인자 없이 클라이언트마다 기본 설정의 AsyncClient를 만듦
+        """
+        http_client = PortOneClient._get_http_client()
+        sdk_clients = [self.client, *(getattr(self.client, name) for name in self.SDK_SUB_CLIENTS)]
+        
+        for sdk_client in sdk_clients:
+            replaced_client = sdk_client._client
+            sdk_client._client = http_client
+            await replaced_client.aclose()
+    
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    cls.READ_TIMEOUT,
+                    connect=cls.CONNECT_TIMEOUT,
+                    pool=cls.POOL_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=cls.MAX_CONNECTIONS,
+                    max_keepalive_connections=cls.MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+        return cls._http_client
+    
+    @classmethod
+    async def get_client(cls, secret_key: str) -> "PortOneClient":
+        """secret key별로 캐싱된 클라이언트 반환 (가장 오래 사용하지 않은 클라이언트부터 캐시에서 제거)"""
+        client = cls._clients.get(secret_key)
+        if client is not None:
+            cls._clients.move_to_end(secret_key)
+            return client
+        
+        client = cls(secret_key=secret_key)
+        await client._use_shared_http_client()
+        
+        cls._clients[secret_key] = client
+        # 제거된 클라이언트는 공유 HTTP 클라이언트만 사용하므로 따로 닫을 필요 없음
+        while len(cls._clients) > cls.MAX_CACHED_CLIENTS:
+            cls._clients.popitem(last=False)
+        return client
+    
+    @classmethod
+    async def close(cls) -> None:
+        """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+        cls._clients.clear()
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
 
-    def get_payment(self, payment_id: str) -> portone.payment.PaidPayment:
+    async def get_payment(self, payment_id: str) -> portone.payment.PaidPayment:
         try:
-            payment = self.client.get_payment(payment_id=payment_id)
+            payment = await self.client.get_payment_async(payment_id=payment_id)
             if not isinstance(payment, portone.payment.PaidPayment):
                 raise ValueError(f"유효하지 않은 결제 정보입니다. Type: {type(payment)}")
             return payment
@@ -27,6 +101,11 @@ class PortOneClient:
             raise HTTPException(
                 status_code=400, detail=f"결제 정보를 가져올 수 없습니다: {str(e)}"
             )
+        
+        except httpx.TimeoutException:
+            raise HTTPException(
+                status_code=504, detail="포트원 결제 조회 응답 시간이 초과되었습니다"
+            )
             
         except Exception as e:
             raise HTTPException(
@@ -51,11 +130,11 @@ class PortOneClient:
             "payment_method": payment_method
         }
     
-    def cancel_payment(self, payment_id: str, reason: str = "고객 요청") -> dict:
+    async def cancel_payment(self, payment_id: str, reason: str = "고객 요청") -> dict:
         try:
 
             # 환불
-            result = self.client.cancel_payment(
+            result = await self.client.cancel_payment_async(
                 payment_id=payment_id,
                 reason=reason
             )
@@ -70,6 +149,11 @@ class PortOneClient:
                 status_code=400, detail=f"환불 처리 중 오류가 발생했습니다: {str(e)}"
             )
             
+        except httpx.TimeoutException:
+            raise HTTPException(
+                status_code=504, detail="포트원 환불 응답 시간이 초과되었습니다"
+            )
+        
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"예상치 못한 오류: {str(e)}"
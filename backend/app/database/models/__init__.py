@@ -15,6 +15,8 @@ from database.models.store_operation_info import StoreOperationInfo
 from database.models.store_operation_info_modification import StoreOperationInfoModification
 from database.models.product_nutrition import ProductNutrition
 from database.models.customer_favorite import CustomerFavorite
+from database.models.store_search_index import StoreSearchDocument, StoreSearchToken
+from database.models.store_product_daily_stat import StoreProductDailyStat
 
 __all__ = [
     "Base",
@@ -36,5 +38,8 @@ __all__ = [
     "StoreOperationInfo",
     "StoreOperationInfoModification",
     "ProductNutrition",
-    "CustomerFavorite"
+    "CustomerFavorite",
+    "StoreSearchDocument",
+    "StoreSearchToken",
+    "StoreProductDailyStat"
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database.session import Base
@@ -32,4 +32,9 @@ class OrderCurrentItem(Base):
     
     # Relationships
     product = relationship("StoreProductInfo", back_populates="order_current_items")
-    customer = relationship("Customer", foreign_keys=[customer_id])
\ No newline at end of file
+    customer = relationship("Customer", foreign_keys=[customer_id])
+    
+    # 인덱스
+    __table_args__ = (
+        Index("ix_order_current_items_customer_reservation", "customer_id", "reservation_at", "payment_id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer
+from sqlalchemy import Column, String, Integer, Float, Index
 from sqlalchemy.orm import relationship
 from database.session import Base
 
@@ -13,8 +13,16 @@ class StoreAddress(Base):
     bname = Column(String(50), nullable=False)  # 읍/면/동
     lat = Column(String(50), nullable=False)  # 위도
     lng = Column(String(50), nullable=False)  # 경도
+    latitude = Column(Float, nullable=True)  # 위도 (공간 검색용)
+    longitude = Column(Float, nullable=True)  # 경도 (공간 검색용)
+    geohash = Column(String(12, collation="C"), nullable=True)  # 공간 인덱스용 geohash
     nearest_station = Column(String(100), nullable=True)  # 가장 가까운 역
     walking_time = Column(Integer, nullable=True)  # 도보 시간 (분)
     
     # Relationships
-    stores = relationship("Store", back_populates="address")
\ No newline at end of file
+    stores = relationship("Store", back_populates="address")
+    
+    # 인덱스
+    __table_args__ = (
+        Index("ix_store_addresses_geohash", "geohash"),
+    )
\ No newline at end of file
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from database.session import Base
+
+
+class StoreProductDailyStat(Base):
+    """ 상품별 당일 주문 집계 (주문 상태 변경 시 같은 트랜잭션에서 갱신, 자정 마이그레이션 시 초기화) """
+    __tablename__ = "store_product_daily_stats"
+    
+    product_id = Column(String(255), ForeignKey("store_product_info.product_id", ondelete="CASCADE"), primary_key=True)  # 상품 고유 ID
+    store_id = Column(String(255), ForeignKey("stores.store_id", ondelete="CASCADE"), nullable=False)  # 가게 고유 ID
+    reserved_quantity = Column(Integer, nullable=False, default=0, server_default="0")  # 수락 대기 수량
+    reserved_amount = Column(Integer, nullable=False, default=0, server_default="0")  # 수락 대기 금액
+    accepted_quantity = Column(Integer, nullable=False, default=0, server_default="0")  # 수락 수량
+    accepted_amount = Column(Integer, nullable=False, default=0, server_default="0")  # 수락 금액
+    completed_quantity = Column(Integer, nullable=False, default=0, server_default="0")  # 픽업 완료 수량
+    completed_amount = Column(Integer, nullable=False, default=0, server_default="0")  # 픽업 완료 금액
+    cancelled_quantity = Column(Integer, nullable=False, default=0, server_default="0")  # 취소 수량
+    cancelled_amount = Column(Integer, nullable=False, default=0, server_default="0")  # 취소 금액
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # 인덱스
+    __table_args__ = (
+        Index("ix_store_product_daily_stats_store_id", "store_id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, false
 from sqlalchemy.orm import relationship
 from database.session import Base
 
@@ -17,6 +17,7 @@ class StoreProductInfo(Base):
     price = Column(Integer, nullable=False)  # 원 단위
     sale = Column(Integer)  # 세일 퍼센트, nullable
     version = Column(Integer, default=1, nullable=False)  # 낙관적 락
+    is_hot_stock = Column(Boolean, default=False, server_default=false(), nullable=False)  # 재고를 Redis 카운터로 관리하는 상품 여부
     
     # Relationships
     store = relationship("Store", back_populates="products")
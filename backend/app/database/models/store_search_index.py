@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func
+from database.session import Base
+
+
+class StoreSearchDocument(Base):
+    """ 가게 검색 문서 (가게/상품 이름 정규화 텍스트) """
+    __tablename__ = "store_search_documents"
+    
+    store_id = Column(String(255), ForeignKey("stores.store_id", ondelete="CASCADE"), primary_key=True)
+    search_text = Column(Text, nullable=False)  # 정규화된 가게/상품 이름 (줄바꿈 구분)
+    choseong_text = Column(Text, nullable=False)  # search_text의 초성 변환 텍스트
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class StoreSearchToken(Base):
+    """ 가게 검색 n-gram 역색인 """
+    __tablename__ = "store_search_tokens"
+    
+    token = Column(String(8), primary_key=True)  # unigram/bigram 토큰 (초성 포함)
+    store_id = Column(String(255), ForeignKey("stores.store_id", ondelete="CASCADE"), primary_key=True)
+    
+    # 인덱스
+    __table_args__ = (
+        Index("ix_store_search_tokens_store_id", "store_id"),
+    )
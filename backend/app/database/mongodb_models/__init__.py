@@ -2,5 +2,9 @@ from .base import Document
 from .order_history_item import OrderHistoryItem
 from .seller_withdraw_reservation import SellerWithdrawReservation
 from .customer_withdraw_reservation import CustomerWithdrawReservation
+from .refund_failure import RefundFailure
+from .settlement_daily import SettlementDaily
+from .migration_checkpoint import MigrationCheckpoint
+from .product_stock_reservation import ProductStockReservation
 
-__all__ = ["Document", "OrderHistoryItem", "SellerWithdrawReservation", "CustomerWithdrawReservation"]
\ No newline at end of file
+__all__ = ["Document", "OrderHistoryItem", "SellerWithdrawReservation", "CustomerWithdrawReservation", "RefundFailure", "SettlementDaily", "MigrationCheckpoint", "ProductStockReservation"]
\ No newline at end of file
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from pydantic import Field
+from pymongo import IndexModel
+
+from database.mongodb_models.base import Document
+
+
+class MigrationCheckpoint(Document):
+    """배치 마이그레이션 진행 상태 (중단 시 이어서 처리)"""
+    
+    job: str = Field(..., description="마이그레이션 작업 이름")
+    last_payment_id: Optional[str] = Field(None, description="마지막으로 삭제까지 끝난 청크의 마지막 결제 ID")
+    archived_count: int = Field(0, description="이동된 주문 수")
+    settlement_dates: List[str] = Field(default_factory=list, description="정산 집계를 다시 계산할 날짜 KST (YYYY-MM-DD)")
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="시작 시간"
+    )
+    completed_at: Optional[datetime] = Field(None, description="완료 시간 (진행 중이면 None)")
+    
+    class Settings:
+        name = "migration_checkpoints"
+        indexes = [
+            IndexModel([("job", 1)], unique=True),
+        ]
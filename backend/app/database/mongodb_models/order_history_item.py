@@ -34,6 +34,7 @@ class OrderHistoryItem(Document):
     nutrition_types: Optional[str] = Field(None, max_length=500, description="식품 영양 타입 (콤마로 구분)")
     allergies: Optional[str] = Field(None, max_length=500, description="알레르기/제약조건 (콤마로 구분)")
     topping_types: Optional[str] = Field(None, max_length=500, description="선호 토핑 (콤마로 구분)")
+    settlement_date: Optional[str] = Field(None, description="정산 날짜 KST (YYYY-MM-DD), 주문 상태별 시간 기준")
     
     class Settings:
         use_cache = True
@@ -44,4 +45,7 @@ class OrderHistoryItem(Document):
             [("product_id", 1)],
             [("store_id", 1)],
             [("reservation_at", -1)],
+            [("customer_id", 1), ("reservation_at", -1), ("payment_id", -1)],
+            [("payment_id", 1)],
+            [("settlement_date", 1)],
         ]
\ No newline at end of file
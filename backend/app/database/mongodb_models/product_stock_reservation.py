@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from pydantic import Field
+from pymongo import IndexModel
 from database.mongodb_models.base import Document
 
 
@@ -17,6 +18,6 @@ class ProductStockReservation(Document):
     class Settings:
         name = "product_stock_reservations"
         indexes = [
-            [("product_id", 1), {"unique": True}]
+            IndexModel([("product_id", 1)], unique=True)
         ]
         use_state_management = True
\ No newline at end of file
@@ -0,0 +1,28 @@
+from pydantic import Field
+from pymongo import IndexModel
+
+from database.mongodb_models.base import Document
+
+
+class RefundFailure(Document):
+    """자동 환불 실패 내역 (재시도 대기)"""
+    
+    payment_id: str = Field(..., description="결제 고유 ID")
+    store_id: str = Field(..., description="가게 고유 ID")
+    store_name: str = Field(..., description="가게 이름")
+    customer_id: str = Field(..., description="소비자 고유 ID")
+    product_id: str = Field(..., description="상품 고유 ID")
+    quantity: int = Field(..., description="구매 수량")
+    total_amount: int = Field(..., description="환불 금액")
+    cancel_reason: str = Field(..., description="취소 사유")
+    release_stock: bool = Field(False, description="취소 시 재고 복구 여부")
+    refunded: bool = Field(False, description="포트원 환불 완료 여부 (주문 취소 반영만 실패한 경우 True)")
+    error: str = Field(..., description="마지막 실패 사유")
+    attempts: int = Field(1, description="시도 횟수")
+    
+    class Settings:
+        name = "refund_failures"
+        indexes = [
+            IndexModel([("payment_id", 1)], unique=True),
+            [("attempts", 1), ("updated_at", 1)],
+        ]
@@ -0,0 +1,35 @@
+from typing import Dict
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
+
+from database.mongodb_models.base import Document
+
+
+class SettlementTotals(BaseModel):
+    """주문 상태별 집계"""
+    
+    count: int = Field(0, description="주문 수")
+    quantity: int = Field(0, description="수량")
+    amount: int = Field(0, description="금액")
+
+
+class SettlementProductTotals(BaseModel):
+    """상품별 주문 상태 집계"""
+    
+    product_name: str = Field(..., description="상품 이름")
+    statuses: Dict[str, SettlementTotals] = Field(default_factory=dict, description="상태별 집계")
+
+
+class SettlementDaily(Document):
+    """가게의 일별 정산 집계 (주문 마이그레이션 시 해당 날짜를 히스토리 기준으로 다시 계산)"""
+    
+    store_id: str = Field(..., description="가게 고유 ID")
+    date: str = Field(..., description="날짜 KST (YYYY-MM-DD), 주문 상태별 시간 기준")
+    statuses: Dict[str, SettlementTotals] = Field(default_factory=dict, description="상태별 집계")
+    products: Dict[str, SettlementProductTotals] = Field(default_factory=dict, description="상품 ID별 집계")
+    
+    class Settings:
+        name = "settlement_daily"
+        indexes = [
+            IndexModel([("store_id", 1), ("date", -1)], unique=True),
+        ]
@@ -9,8 +9,7 @@ from middleware.auth import JWTAuthMiddleware
 from services.auth.jwt import JWTService
 from database.mongodb_session import init_mongodb, close_mongodb
 from services.scheduler import scheduler
-from services.cart_recovery import CartRecoveryService
-from services.startup_recovery import ScheduleRecovery
+from core.portone import PortOneClient
 
 # 로깅 설정
 logging.basicConfig(
@@ -27,30 +26,13 @@ async def lifespan(app: FastAPI):
     logger.info("애플리케이션 시작 중...")
     await init_mongodb()
     scheduler.start()
-    logger.info(f"스케줄러 상태: {'실행 중' if scheduler.is_running else '중지됨'}")
-    
-    try:
-        recovered_carts = await CartRecoveryService.recover_abandoned_carts()
-        if recovered_carts > 0:
-            logger.info(f"장바구니 재고 복구 완료: {recovered_carts}개 아이템")
-        else:
-            logger.info("복구할 장바구니 아이템이 없습니다")
-    except Exception as e:
-        logger.error(f"장바구니 재고 복구 중 오류 발생: {e}", exc_info=True)
-    
-    try:
-        recovered = await ScheduleRecovery.recover_dynamic_schedules_if_needed(scheduler)
-        if recovered:
-            logger.info("서버 재시작으로 인한 동적 스케줄 복원 완료")
-        else:
-            logger.info("동적 스케줄 복원이 필요하지 않습니다")
-    except Exception as e:
-        logger.error(f"동적 스케줄 복원 중 오류 발생: {e}", exc_info=True)
+    logger.info(f"스케줄러 상태: {'실행 중' if scheduler.is_running else '중지됨'} (리더 선출 후 복구/작업 실행)")
     
     yield
     # Shutdown
     logger.info("애플리케이션 종료 중...")
-    scheduler.stop()
+    await scheduler.stop()
+    await PortOneClient.close()
     await close_mongodb()
 
 
@@ -22,6 +22,7 @@ from repositories.store_operation_info_modification import StoreOperationInfoMod
 from repositories.product_nutrition import ProductNutritionRepository
 from repositories.product_stock_reservation import ProductStockReservationRepository
 from repositories.customer_favorite import CustomerFavoriteRepository
+from repositories.store_search_index import StoreSearchIndexRepository
 
 __all__ = [
     "BaseRepository",
@@ -45,5 +46,6 @@ __all__ = [
     "StoreOperationInfoModificationRepository",
     "ProductNutritionRepository",
     "ProductStockReservationRepository",
-    "CustomerFavoriteRepository"
+    "CustomerFavoriteRepository",
+    "StoreSearchIndexRepository"
 ]
\ No newline at end of file
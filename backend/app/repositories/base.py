@@ -1,6 +1,6 @@
 from abc import ABC
 from typing import Generic, Optional, Type, TypeVar, List, Dict, Any, Union
-from sqlalchemy import select, func, and_, or_, desc, asc, update
+from sqlalchemy import select, func, and_, or_, desc, asc, update, insert, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.sql import Select
@@ -36,6 +36,21 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(db_obj)
         return db_obj
     
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[ModelType]:
+        """
+        여러 레코드를 한 문장으로 생성 (INSERT ... VALUES ... RETURNING)
+        
+        create와 달리 레코드마다 flush/refresh 하지 않으며, 서버 기본값이 채워진 객체를 입력 순서대로 반환
+        """
+        if not rows:
+            return []
+        
+        result = await self.session.execute(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            rows
+        )
+        return result.scalars().all()
+    
     async def get_by_pk(self, pk_value: Union[str, int]) -> Optional[ModelType]:
         """Primary key로 조회 (타입에 관계없이)"""
         pk_attr = getattr(self.model, self._primary_key)
@@ -130,6 +145,24 @@ class BaseRepository(Generic[ModelType]):
         await self.session.flush()
         return len(objects)
     
+    async def bulk_update_where(self, values: Dict[str, Any], **filters) -> List[ModelType]:
+        """
+        조건에 맞는 여러 레코드를 한 문장으로 업데이트 (UPDATE ... WHERE ... RETURNING)
+        
+        update_where와 달리 대상 객체를 먼저 조회하지 않으며, 업데이트된 객체들을 반환
+        조건은 bulk_delete_where와 같이 키워드 인자로 받음
+        """
+        if not filters:
+            raise ValueError("bulk_update_where requires at least one filter")
+        
+        result = await self.session.execute(
+            update(self.model)
+            .where(*self._build_conditions(**filters))
+            .values(**values)
+            .returning(self.model)
+        )
+        return result.scalars().all()
+    
     async def update_lock(
         self, 
         pk_value: Union[str, int],
@@ -206,6 +239,23 @@ class BaseRepository(Generic[ModelType]):
         await self.session.flush()
         return len(objects)
     
+    async def bulk_delete_where(self, **filters) -> List[ModelType]:
+        """
+        조건에 맞는 여러 레코드를 한 문장으로 삭제 (DELETE ... WHERE ... RETURNING)
+        
+        delete_where와 달리 대상 객체를 먼저 조회하지 않으며, 삭제된 객체들을 반환
+        ORM cascade가 적용되지 않으므로 자식 레코드는 호출하는 쪽에서 먼저 삭제해야 함
+        """
+        if not filters:
+            raise ValueError("bulk_delete_where requires at least one filter")
+        
+        result = await self.session.execute(
+            delete(self.model)
+            .where(*self._build_conditions(**filters))
+            .returning(self.model)
+        )
+        return result.scalars().all()
+    
     async def exists(self, **filters) -> bool:
         """조건에 맞는 레코드 존재 여부 확인"""
         count = await self.count(**filters)
@@ -214,6 +264,15 @@ class BaseRepository(Generic[ModelType]):
     def _build_filter_query(self, **filters) -> Select:
         """필터 조건으로 쿼리 생성"""
         query = select(self.model)
+        conditions = self._build_conditions(**filters)
+        
+        if conditions:
+            query = query.where(and_(*conditions))
+        
+        return query
+    
+    def _build_conditions(self, **filters) -> List[Any]:
+        """필터 딕셔너리를 WHERE 조건 목록으로 변환"""
         conditions = []
         
         for key, value in filters.items():
@@ -240,7 +299,4 @@ class BaseRepository(Generic[ModelType]):
                 else:
                     conditions.append(getattr(self.model, key) == value)
         
-        if conditions:
-            query = query.where(and_(*conditions))
-        
-        return query
\ No newline at end of file
+        return conditions
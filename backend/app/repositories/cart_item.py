@@ -1,8 +1,11 @@
 from typing import List, Optional
 from datetime import datetime, timedelta
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models.cart_item import CartItem
+from database.models.order_current_item import OrderCurrentItem
 from repositories.base import BaseRepository
 
 
@@ -30,9 +33,42 @@ class CartItemRepository(BaseRepository[CartItem]):
             order_by=["-created_at"]
         )
     
+    async def get_abandoned(self, created_before: datetime) -> List[CartItem]:
+        """
+        created_before 이전에 생성되었고 주문으로 전환되지 않은 장바구니 항목 조회
+        
+        결제 확인 중(주문 생성 전)이거나 이미 주문이 생성된 항목은 제외
+        """
+        has_order = (
+            select(OrderCurrentItem.payment_id)
+            .where(OrderCurrentItem.payment_id == CartItem.payment_id)
+            .exists()
+        )
+        result = await self.session.execute(
+            select(CartItem).where(CartItem.created_at < created_before, ~has_order)
+        )
+        return list(result.scalars().all())
+    
     async def delete_paymen_id_and_return_quantity(self, payment_id: str) -> int:
         """결제 ID로 삭제 후, 수량 반환"""
         deleted_item = await self.delete_and_return(payment_id)
         
         if deleted_item:
-            return deleted_item.quantity
\ No newline at end of file
+            return deleted_item.quantity
+    
+    async def delete_by_payment_ids_and_return(self, payment_ids: List[str]) -> List[Row]:
+        """
+        결제 ID 목록으로 한 번에 삭제 후, 실제로 삭제된 항목의 (payment_id, product_id, quantity) 반환
+        
+        이미 삭제된 결제 ID는 결과에 포함되지 않으므로 재고 복구를 중복 없이 처리할 수 있음
+        """
+        if not payment_ids:
+            return []
+        
+        result = await self.session.execute(
+            delete(CartItem)
+            .where(CartItem.payment_id.in_(payment_ids))
+            .returning(CartItem.payment_id, CartItem.product_id, CartItem.quantity)
+        )
+        await self.session.flush()
+        return result.all()
\ No newline at end of file
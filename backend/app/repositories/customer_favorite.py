@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, and_
 from repositories.base import BaseRepository
@@ -21,6 +21,13 @@ class CustomerFavoriteRepository(BaseRepository[CustomerFavorite]):
         )
         return result.scalar_one_or_none()
     
+    async def get_store_ids_by_customer(self, customer_email: str) -> List[str]:
+        """소비자가 즐겨찾기한 가게 ID 목록 조회"""
+        result = await self.session.execute(
+            select(self.model.store_id).where(self.model.customer_email == customer_email)
+        )
+        return result.scalars().all()
+    
     async def create_for_customer(self, customer_email: str, store_id: str) -> CustomerFavorite:
         """소비자의 즐겨찾기 추가"""
         return await self.create(
@@ -26,19 +26,10 @@ class CustomerPreferredMenuRepository(BaseRepository[CustomerPreferredMenu]):
     
     async def create_bulk_for_customer(self, customer_email: str, menu_types: List[PreferredMenu]) -> List[CustomerPreferredMenu]:
         """소비자의 여러 선호 메뉴 한번에 추가"""
-        created_items = []
-        for menu_type in menu_types:
-            obj = self.model(
-                customer_email=customer_email,
-                menu_type=menu_type
-            )
-            self.session.add(obj)
-            created_items.append(obj)
-        
-        await self.session.flush()
-        for obj in created_items:
-            await self.session.refresh(obj)
-        return created_items
+        return await self.bulk_create([
+            {"customer_email": customer_email, "menu_type": menu_type}
+            for menu_type in menu_types
+        ])
     
     async def delete_for_customer(self, customer_email: str, menu_type: PreferredMenu) -> bool:
         """소비자의 특정 선호 메뉴 삭제"""
@@ -72,19 +63,10 @@ class CustomerNutritionTypeRepository(BaseRepository[CustomerNutritionType]):
     
     async def create_bulk_for_customer(self, customer_email: str, nutrition_types: List[NutritionType]) -> List[CustomerNutritionType]:
         """소비자의 여러 영양 타입 한번에 추가"""
-        created_items = []
-        for nutrition_type in nutrition_types:
-            obj = self.model(
-                customer_email=customer_email,
-                nutrition_type=nutrition_type
-            )
-            self.session.add(obj)
-            created_items.append(obj)
-        
-        await self.session.flush()
-        for obj in created_items:
-            await self.session.refresh(obj)
-        return created_items
+        return await self.bulk_create([
+            {"customer_email": customer_email, "nutrition_type": nutrition_type}
+            for nutrition_type in nutrition_types
+        ])
     
     async def delete_for_customer(self, customer_email: str, nutrition_type: NutritionType) -> bool:
         """소비자의 특정 영양 타입 삭제"""
@@ -118,19 +100,10 @@ class CustomerAllergyRepository(BaseRepository[CustomerAllergy]):
     
     async def create_bulk_for_customer(self, customer_email: str, allergy_types: List[AllergyType]) -> List[CustomerAllergy]:
         """소비자의 여러 알레르기 한번에 추가"""
-        created_items = []
-        for allergy_type in allergy_types:
-            obj = self.model(
-                customer_email=customer_email,
-                allergy_type=allergy_type
-            )
-            self.session.add(obj)
-            created_items.append(obj)
-        
-        await self.session.flush()
-        for obj in created_items:
-            await self.session.refresh(obj)
-        return created_items
+        return await self.bulk_create([
+            {"customer_email": customer_email, "allergy_type": allergy_type}
+            for allergy_type in allergy_types
+        ])
     
     async def delete_for_customer(self, customer_email: str, allergy_type: AllergyType) -> bool:
         """소비자의 특정 알레르기 삭제"""
@@ -164,19 +137,10 @@ class CustomerToppingTypeRepository(BaseRepository[CustomerToppingType]):
     
     async def create_bulk_for_customer(self, customer_email: str, topping_types: List[ToppingType]) -> List[CustomerToppingType]:
         """소비자의 여러 토핑 타입 한번에 추가"""
-        created_items = []
-        for topping_type in topping_types:
-            obj = self.model(
-                customer_email=customer_email,
-                topping_type=topping_type
-            )
-            self.session.add(obj)
-            created_items.append(obj)
-        
-        await self.session.flush()
-        for obj in created_items:
-            await self.session.refresh(obj)
-        return created_items
+        return await self.bulk_create([
+            {"customer_email": customer_email, "topping_type": topping_type}
+            for topping_type in topping_types
+        ])
     
     async def delete_for_customer(self, customer_email: str, topping_type: ToppingType) -> bool:
         """소비자의 특정 토핑 타입 삭제"""
@@ -0,0 +1,75 @@
+from typing import List
+from datetime import datetime, timezone
+
+from pymongo import ReturnDocument
+
+from database.mongodb_models.migration_checkpoint import MigrationCheckpoint
+from repositories.mongodb_base import BaseMongoRepository
+
+
+class MigrationCheckpointRepository(BaseMongoRepository[MigrationCheckpoint]):
+    """배치 마이그레이션 체크포인트 Repository"""
+    
+    def __init__(self):
+        super().__init__(MigrationCheckpoint)
+    
+    async def start_or_resume(self, job: str) -> MigrationCheckpoint:
+        """
+        완료되지 않은 체크포인트가 있으면 그대로 반환하고, 없으면 새로 시작
+        
+        Returns:
+            진행할 체크포인트 (completed_at이 None)
+        """
+        checkpoint = await self.get_one(job=job)
+        if checkpoint and checkpoint.completed_at is None:
+            return checkpoint
+        
+        now = datetime.now(timezone.utc)
+        document = await self.model.get_motor_collection().find_one_and_update(
+            {"job": job},
+            {
+                "$set": {
+                    "last_payment_id": None,
+                    "archived_count": 0,
+                    "settlement_dates": [],
+                    "started_at": now,
+                    "completed_at": None,
+                    "updated_at": now
+                },
+                "$setOnInsert": {"created_at": now}
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return MigrationCheckpoint.model_validate(document)
+    
+    async def add_settlement_dates(self, job: str, dates: List[str]) -> None:
+        """정산 집계를 다시 계산할 날짜 추가"""
+        if not dates:
+            return
+        
+        await self.model.get_motor_collection().update_one(
+            {"job": job},
+            {
+                "$addToSet": {"settlement_dates": {"$each": dates}},
+                "$set": {"updated_at": datetime.now(timezone.utc)}
+            }
+        )
+    
+    async def advance(self, job: str, last_payment_id: str, archived_count: int) -> None:
+        """청크 처리 완료 기록"""
+        await self.model.get_motor_collection().update_one(
+            {"job": job},
+            {
+                "$set": {"last_payment_id": last_payment_id, "updated_at": datetime.now(timezone.utc)},
+                "$inc": {"archived_count": archived_count}
+            }
+        )
+    
+    async def complete(self, job: str) -> None:
+        """마이그레이션 완료 기록"""
+        now = datetime.now(timezone.utc)
+        await self.model.get_motor_collection().update_one(
+            {"job": job},
+            {"$set": {"completed_at": now, "updated_at": now}}
+        )
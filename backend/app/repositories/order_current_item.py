@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, join
+from sqlalchemy import select, update, and_, join, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import selectinload
-from datetime import datetime, timezone
+from datetime import datetime, timezone, time, timedelta, date
 
 from database.models.order_current_item import OrderCurrentItem
 from database.models.store_product_info import StoreProductInfo
@@ -11,12 +12,14 @@ from database.models.store import Store
 from database.models.store_operation_info import StoreOperationInfo
 from schemas.order import OrderStatus
 from repositories.base import BaseRepository
+from repositories.store_product_daily_stat import StoreProductDailyStatRepository
 
 
 class OrderCurrentItemRepository(BaseRepository[OrderCurrentItem]):
     """주문 내역 - 당일 보관"""
     def __init__(self, session: AsyncSession):
         super().__init__(OrderCurrentItem, session)
+        self.daily_stat_repo = StoreProductDailyStatRepository(session)
     
     async def get_by_payment_id(self, payment_id: str) -> Optional[OrderCurrentItem]:
         """결제 ID로 조회"""
@@ -47,29 +50,268 @@ class OrderCurrentItemRepository(BaseRepository[OrderCurrentItem]):
             order_by=["order_time"]
         )
     
+    async def create(self, **kwargs) -> OrderCurrentItem:
+        """주문 생성 (당일 주문 집계에 함께 반영)"""
+        order = await super().create(**kwargs)
+        await self.daily_stat_repo.apply_transitions([
+            (order.product_id, order.quantity, order.total_amount, None, order.status)
+        ])
+        return order
+    
+    async def _transition(
+        self,
+        payment_id: str,
+        allowed_statuses: List[OrderStatus],
+        **values
+    ) -> Optional[OrderCurrentItem]:
+        """
+        주문 상태를 조건부로 한 문장에 변경 (UPDATE ... WHERE status IN (...) RETURNING)
+        
+        현재 상태가 allowed_statuses가 아니면 변경하지 않고 None 반환 (중복 수락/취소 방지)
+        변경된 주문은 이전 상태와 비교해 당일 주문 집계에 함께 반영
+        """
+        # 변경 전 상태를 함께 반환하기 위해 대상 주문을 잠그고 조회
+        target = (
+            select(OrderCurrentItem.payment_id, OrderCurrentItem.status)
+            .where(
+                OrderCurrentItem.payment_id == payment_id,
+                OrderCurrentItem.status.in_(allowed_statuses)
+            )
+            .with_for_update()
+            .cte("target")
+        )
+        
+        result = await self.session.execute(
+            update(OrderCurrentItem)
+            .where(OrderCurrentItem.payment_id == target.c.payment_id)
+            .values(**values)
+            .returning(OrderCurrentItem, target.c.status.label("previous_status"))
+            .execution_options(synchronize_session="fetch")
+        )
+        row = result.one_or_none()
+        if not row:
+            return None
+        
+        order, previous_status = row
+        await self.daily_stat_repo.apply_transitions([
+            (order.product_id, order.quantity, order.total_amount, previous_status, order.status)
+        ])
+        return order
+    
     async def accept_order(self, payment_id: str) -> Optional[OrderCurrentItem]:
-        """주문 수락 처리"""
-        return await self.update(payment_id, status=OrderStatus.accept, accepted_at=datetime.now(timezone.utc))
+        """주문 수락 처리 (수락 대기 주문만, 이미 처리된 주문이면 None)"""
+        return await self._transition(
+            payment_id,
+            [OrderStatus.reservation],
+            status=OrderStatus.accept,
+            accepted_at=datetime.now(timezone.utc)
+        )
     
     async def complete_order(self, payment_id: str) -> Optional[OrderCurrentItem]:
-        """픽업 완료 처리"""
-        return await self.update(payment_id, status=OrderStatus.complete, completed_at=datetime.now(timezone.utc))
-
-    async def cancel_order(self, payment_id: str, cancel_reason: Optional[str] = None) -> int:
-        """주문 취소 처리"""
-        canceled_item = await self.update(
+        """픽업 완료 처리 (수락된 주문만, 이미 처리된 주문이면 None)"""
+        return await self._transition(
             payment_id,
+            [OrderStatus.accept],
+            status=OrderStatus.complete,
+            completed_at=datetime.now(timezone.utc)
+        )
+    
+    async def cancel_order(
+        self,
+        payment_id: str,
+        cancel_reason: Optional[str] = None,
+        allowed_statuses: Optional[List[OrderStatus]] = None
+    ) -> Optional[int]:
+        """
+        주문 취소 처리
+        
+        Args:
+            allowed_statuses: 취소할 수 있는 현재 상태 (기본값: 수락 대기, 수락)
+        
+        Returns:
+            취소된 주문 수량 (취소할 수 없는 상태면 None)
+        """
+        canceled_item = await self._transition(
+            payment_id,
+            allowed_statuses or [OrderStatus.reservation, OrderStatus.accept],
             status=OrderStatus.cancel,
             canceled_at=datetime.now(timezone.utc),
             cancel_reason=cancel_reason
         )
         if canceled_item:
             return canceled_item.quantity
+        return None
+    
+    async def lock_orders(self, payment_ids: List[str], allowed_statuses: List[OrderStatus]) -> List[str]:
+        """
+        allowed_statuses 상태인 주문을 잠그고 (SELECT ... FOR UPDATE) payment_id 반환
+        
+        트랜잭션이 끝날 때까지 다른 요청이 주문 상태를 바꾸지 못함
+        """
+        if not payment_ids:
+            return []
+        
+        result = await self.session.execute(
+            select(OrderCurrentItem.payment_id)
+            .where(
+                OrderCurrentItem.payment_id.in_(payment_ids),
+                OrderCurrentItem.status.in_(allowed_statuses)
+            )
+            .with_for_update()
+        )
+        return list(result.scalars().all())
+    
+    async def cancel_orders(
+        self,
+        payment_ids: List[str],
+        cancel_reason: str,
+        allowed_statuses: List[OrderStatus]
+    ) -> List[Row]:
+        """
+        여러 주문을 한 번에 취소 처리
+        
+        allowed_statuses 상태인 주문만 취소되며, 실제로 취소된 주문의
+        (payment_id, product_id, quantity, total_amount, previous_status) 반환
+        """
+        if not payment_ids:
+            return []
+        
+        # 취소 전 상태를 함께 반환하기 위해 대상 주문을 잠그고 조회
+        targets = (
+            select(OrderCurrentItem.payment_id, OrderCurrentItem.status)
+            .where(
+                OrderCurrentItem.payment_id.in_(payment_ids),
+                OrderCurrentItem.status.in_(allowed_statuses)
+            )
+            .with_for_update()
+            .cte("targets")
+        )
+        
+        result = await self.session.execute(
+            update(OrderCurrentItem)
+            .where(OrderCurrentItem.payment_id == targets.c.payment_id)
+            .values(
+                status=OrderStatus.cancel,
+                canceled_at=datetime.now(timezone.utc),
+                cancel_reason=cancel_reason
+            )
+            .returning(
+                OrderCurrentItem.payment_id,
+                OrderCurrentItem.product_id,
+                OrderCurrentItem.quantity,
+                OrderCurrentItem.total_amount,
+                targets.c.status.label("previous_status")
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        
+        await self.daily_stat_repo.apply_transitions([
+            (row.product_id, row.quantity, row.total_amount, row.previous_status, OrderStatus.cancel)
+            for row in rows
+        ])
+        return rows
+    
+    async def complete_orders(self, payment_ids: List[str]) -> List[Row]:
+        """
+        수락된 주문을 한 문장으로 픽업 완료 처리
+        
+        Returns:
+            실제로 완료된 주문의 (payment_id, product_id, quantity, total_amount)
+        """
+        if not payment_ids:
+            return []
+        
+        result = await self.session.execute(
+            update(OrderCurrentItem)
+            .where(
+                OrderCurrentItem.payment_id.in_(payment_ids),
+                OrderCurrentItem.status == OrderStatus.accept
+            )
+            .values(status=OrderStatus.complete, completed_at=datetime.now(timezone.utc))
+            .returning(
+                OrderCurrentItem.payment_id,
+                OrderCurrentItem.product_id,
+                OrderCurrentItem.quantity,
+                OrderCurrentItem.total_amount
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        
+        await self.daily_stat_repo.apply_transitions([
+            (row.product_id, row.quantity, row.total_amount, OrderStatus.accept, OrderStatus.complete)
+            for row in rows
+        ])
+        return rows
+    
+    async def get_due_store_orders(
+        self,
+        day_of_week: int,
+        time_field: str,
+        due_minute: time,
+        statuses: List[OrderStatus]
+    ) -> List[OrderCurrentItem]:
+        """
+        운영 정보의 기준 시각이 due_minute(분 단위)인 가게들의 주문을 한 번에 조회 (상품, 가게 포함)
+        
+        오늘 실제로 운영 중인 가게(is_currently_open)만 대상으로 함
+        
+        Args:
+            day_of_week: 요일
+            time_field: 기준 시각 컬럼 (pickup_end_time, close_time 등)
+            due_minute: 기준 시각 (HH:MM)
+            statuses: 조회할 주문 상태
+        """
+        time_column = getattr(StoreOperationInfo, time_field)
+        minute_end = (datetime.combine(date.min, due_minute) + timedelta(minutes=1)).time()
+        
+        time_conditions = [time_column >= due_minute]
+        if minute_end > due_minute:
+            time_conditions.append(time_column < minute_end)
+        
+        stmt = (
+            select(OrderCurrentItem)
+            .join(StoreProductInfo, OrderCurrentItem.product_id == StoreProductInfo.product_id)
+            .join(StoreOperationInfo, StoreOperationInfo.store_id == StoreProductInfo.store_id)
+            .where(
+                StoreOperationInfo.day_of_week == day_of_week,
+                StoreOperationInfo.is_open_enabled.is_(True),
+                StoreOperationInfo.is_currently_open.is_(True),
+                *time_conditions,
+                OrderCurrentItem.status.in_(statuses)
+            )
+            .options(selectinload(OrderCurrentItem.product).selectinload(StoreProductInfo.store))
+        )
+        
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+    
+    async def get_migration_batch(self, after_payment_id: Optional[str], limit: int) -> List[OrderCurrentItem]:
+        """히스토리 이동용 주문을 결제 ID 순 키셋 배치로 조회 (관계 포함)"""
+        stmt = (
+            select(OrderCurrentItem)
+            .options(
+                selectinload(OrderCurrentItem.product).selectinload(StoreProductInfo.store),
+                selectinload(OrderCurrentItem.customer).selectinload(Customer.detail)
+            )
+            .order_by(OrderCurrentItem.payment_id)
+            .limit(limit)
+        )
+        
+        if after_payment_id:
+            stmt = stmt.where(OrderCurrentItem.payment_id > after_payment_id)
+        
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
     
-    async def delete_all_items(self) -> List[OrderCurrentItem]:
-        """하루 종료 후, history로 이동하기 위한 삭제"""
-        deleted_items = await self.delete_all_and_return()
-        return deleted_items
+    async def delete_by_payment_ids(self, payment_ids: List[str]) -> int:
+        """히스토리로 이동된 주문을 한 문장으로 삭제"""
+        if not payment_ids:
+            return 0
+        
+        deleted_items = await self.bulk_delete_where(payment_id=payment_ids)
+        return len(deleted_items)
     
     async def get_all_orders_with_relations(self) -> List[OrderCurrentItem]:
         """모든 주문 조회 (관계 포함) - 마이그레이션용"""
@@ -115,6 +357,39 @@ class OrderCurrentItemRepository(BaseRepository[OrderCurrentItem]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
     
+    async def get_customer_orders_page(
+        self,
+        customer_id: str,
+        limit: int,
+        cursor: Optional[Tuple[datetime, str]] = None
+    ) -> List[OrderCurrentItem]:
+        """
+        소비자의 당일 주문을 (reservation_at, payment_id) 내림차순 키셋 페이지로 조회
+        
+        Args:
+            customer_id: 소비자 ID
+            limit: 조회할 최대 개수
+            cursor: 이전 페이지 마지막 주문의 (reservation_at, payment_id)
+        """
+        stmt = (
+            select(OrderCurrentItem)
+            .where(OrderCurrentItem.customer_id == customer_id)
+            .options(
+                selectinload(OrderCurrentItem.product).selectinload(StoreProductInfo.store).selectinload(Store.images),
+                selectinload(OrderCurrentItem.customer).selectinload(Customer.detail)
+            )
+            .order_by(OrderCurrentItem.reservation_at.desc(), OrderCurrentItem.payment_id.desc())
+            .limit(limit)
+        )
+        
+        if cursor:
+            stmt = stmt.where(
+                tuple_(OrderCurrentItem.reservation_at, OrderCurrentItem.payment_id) < tuple_(*cursor)
+            )
+        
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+    
     async def get_customer_current_orders_with_pickup_time(self, customer_id: str, today_weekday: int) -> List[OrderCurrentItem]:
         """소비자의 당일 주문 조회 + 오늘 요일의 가게 픽업 시간"""
         orders_stmt = (
@@ -169,6 +444,27 @@ class OrderCurrentItemRepository(BaseRepository[OrderCurrentItem]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_orders_with_store_relation(self, payment_ids: List[str]) -> List[OrderCurrentItem]:
+        """
+        여러 주문을 상세 정보와 함께 한 번에 조회 (상품, 가게, 소비자 정보 포함)
+        
+        일괄 UPDATE 직후에도 변경된 값이 보이도록 세션에 있는 객체를 조회 결과로 갱신
+        """
+        if not payment_ids:
+            return []
+        
+        stmt = (
+            select(OrderCurrentItem)
+            .where(OrderCurrentItem.payment_id.in_(payment_ids))
+            .options(
+                selectinload(OrderCurrentItem.product).selectinload(StoreProductInfo.store),
+                selectinload(OrderCurrentItem.customer).selectinload(Customer.detail)
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+    
     async def get_order_with_product_relation(self, payment_id: str) -> Optional[OrderCurrentItem]:
         """주문 정보 조회 (상품 정보 포함)"""
         stmt = (
@@ -1,8 +1,11 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
 
+from pymongo import UpdateOne
+
 from database.mongodb_models.order_history_item import OrderHistoryItem
 from repositories.mongodb_base import BaseMongoRepository
+from repositories.settlement_daily import STATUS_TIME_FIELDS, get_settlement_date
 
 
 class OrderHistoryItemRepository(BaseMongoRepository[OrderHistoryItem]):
@@ -41,8 +44,15 @@ class OrderHistoryItemRepository(BaseMongoRepository[OrderHistoryItem]):
         return await self.create(history_item)
     
     async def bulk_archive_orders(self, orders_data: List[Dict[str, Any]]) -> int:
-        """여러 주문을 일괄 아카이브"""
-        history_items = []
+        """
+        여러 주문을 결제 ID 기준으로 일괄 아카이브 (순서 없는 upsert)
+        
+        이미 아카이브된 결제는 건너뛰므로 중단된 마이그레이션을 다시 실행해도 중복되지 않음
+        
+        Returns:
+            새로 아카이브된 주문 수
+        """
+        operations = []
         
         for order in orders_data:
             history_item = OrderHistoryItem(
@@ -67,19 +77,101 @@ class OrderHistoryItemRepository(BaseMongoRepository[OrderHistoryItem]):
                 preferred_menus=order.get("preferred_menus"),
                 nutrition_types=order.get("nutrition_types"),
                 allergies=order.get("allergies"),
-                topping_types=order.get("topping_types")
+                topping_types=order.get("topping_types"),
+                settlement_date=get_settlement_date(order)
             )
-            history_items.append(history_item)
+            operations.append(UpdateOne(
+                {"payment_id": history_item.payment_id},
+                {"$setOnInsert": history_item.model_dump(exclude={"id", "revision_id"})},
+                upsert=True
+            ))
         
-        if history_items:
-            await self.create_many(history_items)
-            return len(history_items)
-        return 0
+        if not operations:
+            return 0
+        
+        result = await self.model.get_motor_collection().bulk_write(operations, ordered=False)
+        return result.upserted_count
     
     async def get_by_payment_id(self, payment_id: str) -> Optional[OrderHistoryItem]:
         """결제 ID로 조회"""
         return await self.get_one(payment_id=payment_id)
     
+    async def get_payment_ids(self, payment_ids: List[str], allowed_statuses: List[str]) -> List[str]:
+        """히스토리로 이동된 주문 중 allowed_statuses 상태인 주문의 payment_id 조회"""
+        if not payment_ids:
+            return []
+        
+        return await self.model.get_motor_collection().distinct(
+            "payment_id", {"payment_id": {"$in": payment_ids}, "status": {"$in": allowed_statuses}}
+        )
+    
+    async def cancel_orders(
+        self,
+        payment_ids: List[str],
+        cancel_reason: str,
+        allowed_statuses: List[str]
+    ) -> List[str]:
+        """
+        이미 히스토리로 이동된 주문을 한 번에 취소 처리 (allowed_statuses 상태인 주문만)
+        
+        Returns:
+            취소된 주문의 payment_id 목록
+        """
+        if not payment_ids:
+            return []
+        
+        filters = {"payment_id": {"$in": payment_ids}, "status": {"$in": allowed_statuses}}
+        cancel_ids = await self.model.get_motor_collection().distinct("payment_id", filters)
+        if not cancel_ids:
+            return []
+        
+        canceled_at = datetime.now(timezone.utc)
+        await self.update_many(
+            {**filters, "payment_id": {"$in": cancel_ids}},
+            {
+                "status": "cancel",
+                "canceled_at": canceled_at,
+                "cancel_reason": cancel_reason,
+                "settlement_date": get_settlement_date({"status": "cancel", "canceled_at": canceled_at})
+            }
+        )
+        return cancel_ids
+    
+    async def backfill_settlement_dates(self) -> int:
+        """
+        정산 날짜가 없는 주문(정산 날짜를 저장하기 전에 이동된 주문)에 정산 날짜 기록
+        
+        get_settlement_date와 같은 기준(주문 상태별 시간, 없으면 reservation_at)의 KST 날짜를
+        한 번의 파이프라인 업데이트로 계산
+        
+        Returns:
+            정산 날짜가 기록된 주문 수
+        """
+        time_at = {
+            "$switch": {
+                "branches": [
+                    {"case": {"$eq": ["$status", order_status]}, "then": f"${field}"}
+                    for order_status, field in STATUS_TIME_FIELDS.items()
+                ],
+                "default": "$reservation_at"
+            }
+        }
+        result = await self.model.get_motor_collection().update_many(
+            {"settlement_date": None},
+            [{
+                "$set": {
+                    "settlement_date": {
+                        "$dateToString": {
+                            "date": {"$ifNull": [time_at, "$reservation_at"]},
+                            "format": "%Y-%m-%d",
+                            "timezone": "Asia/Seoul"
+                        }
+                    }
+                }
+            }]
+        )
+        return result.modified_count
+    
     async def get_by_product_id(self, product_id: str) -> Optional[OrderHistoryItem]:
         """상품 ID로 조회"""
         return await self.get_one(product_id=product_id)
@@ -112,6 +204,35 @@ class OrderHistoryItemRepository(BaseMongoRepository[OrderHistoryItem]):
             limit=limit
         )
     
+    async def get_customer_history_page(
+        self,
+        customer_id: str,
+        limit: int,
+        cursor: Optional[Tuple[datetime, str]] = None
+    ) -> List[OrderHistoryItem]:
+        """
+        소비자의 주문 히스토리를 (reservation_at, payment_id) 내림차순 키셋 페이지로 조회
+        
+        Args:
+            customer_id: 소비자 ID
+            limit: 조회할 최대 개수
+            cursor: 이전 페이지 마지막 주문의 (reservation_at, payment_id)
+        """
+        filters: Dict[str, Any] = {"customer_id": customer_id}
+        
+        if cursor:
+            reservation_at, payment_id = cursor
+            filters["$or"] = [
+                {"reservation_at": {"$lt": reservation_at}},
+                {"reservation_at": reservation_at, "payment_id": {"$lt": payment_id}}
+            ]
+        
+        return await self.get_many(
+            filters=filters,
+            sort=[("reservation_at", -1), ("payment_id", -1)],
+            limit=limit
+        )
+    
     async def get_store_history(
         self,
         store_id: str,
@@ -45,4 +45,11 @@ class ProductStockReservationRepository(BaseMongoRepository[ProductStockReservat
         reservation = await self.get_by_product_id(product_id)
         if reservation:
             return await self.delete(reservation)
-        return False
\ No newline at end of file
+        return False
+    
+    async def delete_by_product_ids(self, product_ids: List[str]) -> int:
+        """여러 상품의 예약을 한 번에 삭제"""
+        if not product_ids:
+            return 0
+        
+        return await self.delete_many(product_id={"$in": product_ids})
\ No newline at end of file
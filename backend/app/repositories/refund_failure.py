@@ -0,0 +1,75 @@
+from typing import List, Dict, Any
+from datetime import datetime, timezone
+
+from pymongo import UpdateOne
+
+from database.mongodb_models.refund_failure import RefundFailure
+from repositories.mongodb_base import BaseMongoRepository
+
+
+class RefundFailureRepository(BaseMongoRepository[RefundFailure]):
+    """자동 환불 실패 내역 Repository"""
+    
+    def __init__(self):
+        super().__init__(RefundFailure)
+    
+    async def record_failures(self, failures: List[Dict[str, Any]]) -> int:
+        """
+        환불 실패 내역을 결제 ID 기준으로 일괄 upsert
+        
+        이미 기록된 결제는 실패 사유/환불 여부를 갱신하고 시도 횟수를 1 증가
+        
+        Args:
+            failures: 환불 대상 정보 + error 키를 가진 딕셔너리 목록
+        
+        Returns:
+            기록된 실패 수
+        """
+        if not failures:
+            return 0
+        
+        now = datetime.now(timezone.utc)
+        operations = []
+        for failure in failures:
+            operations.append(UpdateOne(
+                {"payment_id": failure["payment_id"]},
+                {
+                    "$set": {
+                        "error": failure["error"],
+                        "refunded": failure.get("refunded", False),
+                        "updated_at": now
+                    },
+                    "$inc": {"attempts": 1},
+                    "$setOnInsert": {
+                        "store_id": failure["store_id"],
+                        "store_name": failure["store_name"],
+                        "customer_id": failure["customer_id"],
+                        "product_id": failure["product_id"],
+                        "quantity": failure["quantity"],
+                        "total_amount": failure["total_amount"],
+                        "cancel_reason": failure["cancel_reason"],
+                        "release_stock": failure.get("release_stock", False),
+                        "created_at": now
+                    }
+                },
+                upsert=True
+            ))
+        
+        await self.model.get_motor_collection().bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    async def get_retryable(self, max_attempts: int, limit: int) -> List[RefundFailure]:
+        """재시도 횟수가 남은 실패 내역을 오래된 순으로 조회"""
+        return await self.get_many(
+            filters={"attempts": {"$lt": max_attempts}},
+            sort=[("updated_at", 1)],
+            limit=limit
+        )
+    
+    async def delete_by_payment_ids(self, payment_ids: List[str]) -> int:
+        """환불이 완료된 결제의 실패 내역 삭제"""
+        if not payment_ids:
+            return 0
+        
+        result = await self.model.find({"payment_id": {"$in": payment_ids}}).delete()
+        return result.deleted_count if result else 0
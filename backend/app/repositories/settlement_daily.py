@@ -0,0 +1,172 @@
+from typing import List, Dict, Any, Tuple
+from datetime import datetime, timezone
+import pytz
+
+from pymongo import UpdateOne
+
+from database.mongodb_models.order_history_item import OrderHistoryItem
+from database.mongodb_models.settlement_daily import SettlementDaily
+from repositories.mongodb_base import BaseMongoRepository
+
+
+kst = pytz.timezone('Asia/Seoul')
+
+# 주문 상태별 정산 기준 시간 필드
+STATUS_TIME_FIELDS = {
+    "complete": "completed_at",
+    "cancel": "canceled_at",
+    "accept": "accepted_at",
+    "reservation": "reservation_at",
+}
+
+
+def get_settlement_date(order: Dict[str, Any]) -> str:
+    """주문 상태별 시간 기준 KST 날짜 (YYYY-MM-DD)"""
+    time_at = order.get(STATUS_TIME_FIELDS.get(order["status"], "reservation_at")) or order["reservation_at"]
+    if time_at.tzinfo is None:
+        time_at = time_at.replace(tzinfo=timezone.utc)
+    return time_at.astimezone(kst).strftime('%Y-%m-%d')
+
+
+class SettlementDailyRepository(BaseMongoRepository[SettlementDaily]):
+    """가게 일별 정산 집계 Repository"""
+    
+    def __init__(self):
+        super().__init__(SettlementDaily)
+    
+    @staticmethod
+    def _accumulate(rollups: Dict[Tuple[str, str], Dict[str, Any]], order: Dict[str, Any]) -> None:
+        """주문 하나를 (store_id, 날짜)별 집계에 더함"""
+        rollup = rollups.setdefault(
+            (order["store_id"], get_settlement_date(order)), {"statuses": {}, "products": {}}
+        )
+        
+        product = rollup["products"].setdefault(
+            order["product_id"], {"product_name": order["product_name"], "statuses": {}}
+        )
+        for totals in (
+            rollup["statuses"].setdefault(order["status"], {"count": 0, "quantity": 0, "amount": 0}),
+            product["statuses"].setdefault(order["status"], {"count": 0, "quantity": 0, "amount": 0})
+        ):
+            totals["count"] += 1
+            totals["quantity"] += order["quantity"]
+            totals["amount"] += order["total_amount"]
+    
+    @classmethod
+    def aggregate_orders(cls, orders: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        주문 목록을 (store_id, 날짜)별 집계로 변환
+        
+        Args:
+            orders: store_id, product_id, product_name, quantity, total_amount, status(문자열),
+                    reservation_at, accepted_at, completed_at, canceled_at 키를 가진 딕셔너리 목록
+        
+        Returns:
+            {(store_id, 날짜): {"statuses": {...}, "products": {...}}}
+        """
+        rollups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for order in orders:
+            cls._accumulate(rollups, order)
+        return rollups
+    
+    async def rebuild_dates(self, dates: List[str]) -> int:
+        """
+        주문 히스토리로 해당 날짜들의 일별 정산 집계를 다시 계산해 덮어씀
+        
+        히스토리 기준으로 다시 계산하므로 같은 날짜를 여러 번 반영해도 중복 집계되지 않음
+        
+        Returns:
+            갱신된 (가게, 날짜) 집계 수
+        """
+        if not dates:
+            return 0
+        
+        pipeline = [
+            {"$match": {"settlement_date": {"$in": dates}}},
+            {
+                "$group": {
+                    "_id": {
+                        "store_id": "$store_id",
+                        "date": "$settlement_date",
+                        "product_id": "$product_id",
+                        "status": "$status"
+                    },
+                    "product_name": {"$last": "$product_name"},
+                    "count": {"$sum": 1},
+                    "quantity": {"$sum": "$quantity"},
+                    "amount": {"$sum": "$total_amount"}
+                }
+            }
+        ]
+        
+        rollups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        async for row in OrderHistoryItem.get_motor_collection().aggregate(pipeline):
+            key = row["_id"]
+            rollup = rollups.setdefault((key["store_id"], key["date"]), {"statuses": {}, "products": {}})
+            
+            product = rollup["products"].setdefault(
+                key["product_id"], {"product_name": row["product_name"], "statuses": {}}
+            )
+            product["statuses"][key["status"]] = {
+                "count": row["count"], "quantity": row["quantity"], "amount": row["amount"]
+            }
+            
+            totals = rollup["statuses"].setdefault(key["status"], {"count": 0, "quantity": 0, "amount": 0})
+            totals["count"] += row["count"]
+            totals["quantity"] += row["quantity"]
+            totals["amount"] += row["amount"]
+        
+        if not rollups:
+            return 0
+        
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"store_id": store_id, "date": date},
+                {
+                    "$set": {**rollup, "updated_at": now},
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+            for (store_id, date), rollup in rollups.items()
+        ]
+        await self.model.get_motor_collection().bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    async def rebuild_if_empty(self) -> int:
+        """
+        집계가 하나도 없으면 주문 히스토리 전체로 일별 정산 집계 생성 (기존 데이터 최초 반영용)
+        
+        히스토리는 커서로 순회하며 (가게, 날짜)별 집계만 메모리에 유지
+        
+        Returns:
+            생성된 (가게, 날짜) 집계 수
+        """
+        if await self.model.find_one({}):
+            return 0
+        
+        rollups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        cursor = OrderHistoryItem.get_motor_collection().find({}, {
+            "store_id": 1, "product_id": 1, "product_name": 1, "quantity": 1, "total_amount": 1, "status": 1,
+            "reservation_at": 1, "accepted_at": 1, "completed_at": 1, "canceled_at": 1
+        })
+        async for order in cursor:
+            self._accumulate(rollups, order)
+        
+        if not rollups:
+            return 0
+        
+        documents = [
+            SettlementDaily(store_id=store_id, date=date, **rollup)
+            for (store_id, date), rollup in rollups.items()
+        ]
+        await self.create_many(documents)
+        return len(documents)
+    
+    async def get_store_range(self, store_id: str, start_date: str, end_date: str) -> List[SettlementDaily]:
+        """가게의 기간 내 일별 정산 집계 조회 (최신 날짜순)"""
+        return await self.get_many(
+            filters={"store_id": store_id, "date": {"$gte": start_date, "$lte": end_date}},
+            sort=[("date", -1)]
+        )
@@ -1,7 +1,9 @@
 from typing import List, Optional, Dict, Tuple
-from sqlalchemy import select, and_, or_, update as sql_update, case
+from sqlalchemy import select, and_, or_, exists, update as sql_update, func, tuple_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
 
 from database.models.store import Store
 from database.models.store_address import StoreAddress
@@ -13,6 +15,9 @@ from database.models.customer_favorite import CustomerFavorite
 from database.models.order_current_item import OrderCurrentItem
 from schemas.order import OrderStatus
 from repositories.base import BaseRepository
+from repositories.store_search_index import StoreSearchIndexRepository
+from utils.geo_utils import EARTH_RADIUS_M, build_coordinate_values, covering_geohashes
+from services.store_card import mark_store_cards_dirty
 
 
 class StoreRepository(BaseRepository[Store]):
@@ -20,6 +25,90 @@ class StoreRepository(BaseRepository[Store]):
     def __init__(self, session: AsyncSession):
         super().__init__(Store, session)
     
+    @staticmethod
+    def _paginate(
+        query: Select,
+        sort_column,
+        descending: bool,
+        cursor: Optional[Tuple],
+        offset: int,
+        limit: int
+    ) -> Select:
+        """
+        (정렬 컬럼, store_id) 순으로 정렬하고 페이지네이션 적용
+        
+        cursor가 있으면 키셋 조건으로 이어서 조회하고 (offset 무시),
+        없으면 offset 기반으로 조회
+        """
+        sort_key = tuple_(sort_column, Store.store_id)
+        
+        if descending:
+            query = query.order_by(sort_column.desc(), Store.store_id.desc())
+            if cursor:
+                query = query.where(sort_key < tuple_(*cursor))
+        else:
+            query = query.order_by(sort_column, Store.store_id)
+            if cursor:
+                query = query.where(sort_key > tuple_(*cursor))
+        
+        if not cursor and offset:
+            query = query.offset(offset)
+        
+        return query.limit(limit+1)
+    
+    async def get_stores_for_cards(self, store_ids: List[str]) -> List[Store]:
+        """가게 카드 생성에 필요한 관련 정보와 함께 가게들을 한 번에 로딩"""
+        if not store_ids:
+            return []
+        
+        query = (
+            select(Store)
+            .where(Store.store_id.in_(store_ids))
+            .options(
+                selectinload(Store.address),
+                selectinload(Store.sns_info),
+                selectinload(Store.operation_info),
+                selectinload(Store.images),
+                selectinload(Store.products).selectinload(StoreProductInfo.nutrition_info)
+            )
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+    
+    async def _fetch_page(
+        self,
+        id_query: Select,
+        sort_column,
+        descending: bool,
+        cursor: Optional[Tuple],
+        offset: int,
+        limit: int
+    ) -> tuple[List[Row], bool]:
+        """
+        store_id만 조회하는 좁은 쿼리로 가게 목록 페이지 범위 결정
+        
+        가게 상세 정보는 조회하지 않으며, 호출하는 쪽에서 store_id로 가게 카드를 조회
+        
+        Returns:
+            ((store_id, 정렬 값) 목록, 마지막 페이지 여부)
+        """
+        result = await self.session.execute(
+            self._paginate(
+                id_query.add_columns(sort_column.label("sort_value")),
+                sort_column, descending, cursor, offset, limit
+            )
+        )
+        rows = result.all()
+        
+        has_next = len(rows) > limit
+        
+        return rows[:limit], not has_next
+    
+    async def update(self, pk_value: str, **kwargs) -> Optional[Store]:
+        """가게 정보 업데이트 (가게 카드 갱신 대상으로 기록)"""
+        mark_store_cards_dirty(self.session, pk_value)
+        return await super().update(pk_value, **kwargs)
+    
     async def get_by_store_id(self, store_id: str) -> Optional[Store]:
         """가게 ID로 조회"""
         return await self.get_by_pk(store_id)
@@ -111,6 +200,7 @@ class StoreRepository(BaseRepository[Store]):
                 "bname": bname,
                 "lat": lat,
                 "lng": lng,
+                **build_coordinate_values(lat, lng),
                 "nearest_station": nearest_station,
                 "walking_time": walking_time
             }
@@ -140,6 +230,7 @@ class StoreRepository(BaseRepository[Store]):
         # 4. 변경사항 플러시 및 갱신된 객체 반환
         await self.session.flush()
         await self.session.refresh(store)
+        mark_store_cards_dirty(self.session, store_id)
         
         return store
     
@@ -176,6 +267,7 @@ class StoreRepository(BaseRepository[Store]):
                 bname=bname,
                 lat=lat,
                 lng=lng,
+                **build_coordinate_values(lat, lng),
                 nearest_station=nearest_station,
                 walking_time=walking_time
             )
@@ -252,42 +344,21 @@ class StoreRepository(BaseRepository[Store]):
         result = await self.session.execute(query)
         return result.scalars().unique().all()
     
-    async def get_stores_with_products_and_favorites(self, customer_email: str, offset: int = 0, limit: int = 4) -> tuple[List[tuple[Store, bool]], bool]:
-        """상품이 있는 가게들과 즐겨찾기 여부를 함께 조회"""
-        
-        favorite_stores_query = (
-            select(CustomerFavorite.store_id)
-            .where(CustomerFavorite.customer_email == customer_email)
-        )
+    async def get_store_ids_with_products(
+        self,
+        offset: int = 0,
+        limit: int = 4,
+        cursor: Optional[Tuple] = None
+    ) -> tuple[List[Row], bool]:
+        """상품이 있는 가게 ID 페이지 조회 (최신 등록 순)"""
+        has_products = exists().where(StoreProductInfo.store_id == Store.store_id)
         
-        query = (
-            select(
-                Store,
-                case(
-                    (Store.store_id.in_(favorite_stores_query), True),
-                    else_=False
-                ).label('is_favorite')
-            )
-            .join(Store.products)
-            .options(
-                selectinload(Store.address),
-                selectinload(Store.sns_info),
-                selectinload(Store.operation_info),
-                selectinload(Store.images),
-                selectinload(Store.products).selectinload(StoreProductInfo.nutrition_info)
-            )
-            .order_by(Store.created_at.desc())
-            .distinct()  # 중복 제거
+        id_query = (
+            select(Store.store_id)
+            .where(has_products)
         )
         
-        # 페이지네이션 적용
-        paginated_query = query.offset(offset).limit(limit+1)
-        result = await self.session.execute(paginated_query)
-        items = result.unique().all()
-        
-        has_next = len(items) > limit
-        
-        return items[:limit], not has_next
+        return await self._fetch_page(id_query, Store.created_at, True, cursor, offset, limit)
     
     async def search_by_location(
         self,
@@ -319,23 +390,18 @@ class StoreRepository(BaseRepository[Store]):
         result = await self.session.execute(query)
         return result.scalars().unique().all()
     
-    async def search_by_location_with_favorites(
+    async def search_store_ids_by_location(
         self,
         sido: str,
         sigungu: str,
         bname: List[str],
-        customer_email: str,
         offset: int = 0,
-        limit: int = 4
-    ) -> tuple[List[tuple[Store, bool]], bool]:
-        """위치로 가게 검색 (즐겨찾기 정보 포함)"""
-        favorite_stores_query = (
-            select(CustomerFavorite.store_id)
-            .where(CustomerFavorite.customer_email == customer_email)
-        )
-        
-        query = (
-            select(Store, Store.store_id.in_(favorite_stores_query))
+        limit: int = 4,
+        cursor: Optional[Tuple] = None
+    ) -> tuple[List[Row], bool]:
+        """위치로 가게 ID 페이지 검색 (가게 이름 순)"""
+        id_query = (
+            select(Store.store_id)
             .join(Store.address)
             .where(
                 and_(
@@ -344,27 +410,67 @@ class StoreRepository(BaseRepository[Store]):
                     StoreAddress.bname.in_(bname)
                 )
             )
-            .options(
-                selectinload(Store.address),
-                selectinload(Store.sns_info),
-                selectinload(Store.operation_info),
-                selectinload(Store.images),
-                selectinload(Store.products).selectinload(StoreProductInfo.nutrition_info)
-            )
-            .order_by(Store.store_name)
-            .distinct()
         )
-        # 페이지네이션 적용
-        paginated_query = query.offset(offset).limit(limit+1)
-        result = await self.session.execute(paginated_query)
-        items = result.unique().all()
         
-        has_next = len(items) > limit
+        return await self._fetch_page(id_query, Store.store_name, False, cursor, offset, limit)
     
-        return items[:limit], not has_next
+    async def search_store_ids_nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: int,
+        cursor: Optional[Tuple[float, str]] = None,
+        limit: int = 4
+    ) -> tuple[List[Row], bool]:
+        """
+        좌표 반경 내 가게 ID를 가까운 순으로 검색
+        
+        geohash 인덱스로 후보를 좁힌 뒤 정확한 거리로 필터링하며,
+        (거리, store_id) 키셋으로 페이지네이션
+        
+        Args:
+            lat: 기준 위도
+            lng: 기준 경도
+            radius_m: 검색 반경 (미터)
+            cursor: 이전 페이지 마지막 항목의 (거리, store_id)
+            limit: 페이지 크기
+        
+        Returns:
+            ((store_id, 거리) 목록, 마지막 페이지 여부)
+        """
+        # 하버사인 거리 (미터)
+        distance = (
+            2 * EARTH_RADIUS_M * func.asin(
+                func.sqrt(
+                    func.power(func.sin(func.radians(StoreAddress.latitude - lat) / 2), 2)
+                    + func.cos(func.radians(lat))
+                    * func.cos(func.radians(StoreAddress.latitude))
+                    * func.power(func.sin(func.radians(StoreAddress.longitude - lng) / 2), 2)
+                )
+            )
+        )
+        
+        # geohash prefix 범위 조건 (C collation B-tree 인덱스 사용)
+        geohash_conditions = [
+            and_(StoreAddress.geohash >= prefix, StoreAddress.geohash < prefix + "~")
+            for prefix in covering_geohashes(lat, lng, radius_m)
+        ]
+        
+        id_query = (
+            select(Store.store_id)
+            .join(Store.address)
+            .where(
+                and_(
+                    or_(*geohash_conditions),
+                    distance <= radius_m
+                )
+            )
+        )
+        
+        return await self._fetch_page(id_query, distance, False, cursor, 0, limit)
     
     async def search_by_location_and_name(
-        self, 
+        self,
         sido: str,
         sigungu: str, 
         bname: str,
@@ -374,15 +480,13 @@ class StoreRepository(BaseRepository[Store]):
         query = (
             select(Store)
             .join(Store.address)
-            .outerjoin(Store.products) 
             .where(
                 and_(
                     StoreAddress.sido == sido,
                     StoreAddress.sigungu == sigungu,
                     StoreAddress.bname == bname,
-                    or_(
-                        Store.store_name.like(f"%{search_name}%"),
-                        StoreProductInfo.product_name.like(f"%{search_name}%")
+                    Store.store_id.in_(
+                        StoreSearchIndexRepository.match_store_ids_query(search_name)
                     )
                 )
             )
@@ -399,65 +503,41 @@ class StoreRepository(BaseRepository[Store]):
         result = await self.session.execute(query)
         return result.scalars().unique().all()
     
-    async def search_by_location_and_name_with_favorites(
+    async def search_store_ids_by_location_and_name(
         self, 
         sido: str,
         sigungu: str, 
         bname: List[str],
         search_name: str,
-        customer_email: str,
         offset: int = 0,
-        limit: int = 4
-    ) -> tuple[List[tuple[Store, bool]], bool]:
-        """주소와 이름으로 가게/상품 검색 (즐겨찾기 정보 포함)"""
-        favorite_stores_query = (
-            select(CustomerFavorite.store_id)
-            .where(CustomerFavorite.customer_email == customer_email)
-        )
-        
-        query = (
-            select(Store, Store.store_id.in_(favorite_stores_query))
+        limit: int = 4,
+        cursor: Optional[Tuple] = None
+    ) -> tuple[List[Row], bool]:
+        """주소와 이름으로 가게/상품 검색해 가게 ID 페이지 조회 (가게 이름 순)"""
+        id_query = (
+            select(Store.store_id)
             .join(Store.address)
-            .outerjoin(Store.products) 
             .where(
                 and_(
                     StoreAddress.sido == sido,
                     StoreAddress.sigungu == sigungu,
                     StoreAddress.bname.in_(bname),
-                    or_(
-                        Store.store_name.like(f"%{search_name}%"),
-                        StoreProductInfo.product_name.like(f"%{search_name}%")
+                    Store.store_id.in_(
+                        StoreSearchIndexRepository.match_store_ids_query(search_name)
                     )
                 )
             )
-            .options(
-                selectinload(Store.address),
-                selectinload(Store.sns_info),
-                selectinload(Store.operation_info),
-                selectinload(Store.images),
-                selectinload(Store.products).selectinload(StoreProductInfo.nutrition_info)
-            )
-            .order_by(Store.store_name)
-            .distinct()
         )
-        # 페이지네이션 적용
-        paginated_query = query.offset(offset).limit(limit+1)
-        result = await self.session.execute(paginated_query)
-        items = result.unique().all()
         
-        has_next = len(items) > limit
-    
-        return items[:limit], not has_next
+        return await self._fetch_page(id_query, Store.store_name, False, cursor, offset, limit)
     
     async def search_by_name(self, search_name: str) -> List[Store]:
         """이름으로 가게/상품 검색"""
         query = (
             select(Store)
-            .outerjoin(Store.products)
             .where(
-                or_(
-                    Store.store_name.like(f"%{search_name}%"),
-                    StoreProductInfo.product_name.like(f"%{search_name}%")
+                Store.store_id.in_(
+                    StoreSearchIndexRepository.match_store_ids_query(search_name)
                 )
             )
             .options(
@@ -473,58 +553,35 @@ class StoreRepository(BaseRepository[Store]):
         result = await self.session.execute(query)
         return result.scalars().unique().all()
     
-    async def search_by_name_with_favorites(self, search_name: str, customer_email: str, offset: int = 0, limit: int = 4) -> tuple[List[tuple[Store, bool]], bool]:
-        """이름으로 가게/상품 검색 (즐겨찾기 정보 포함)"""
-        favorite_stores_query = (
-            select(CustomerFavorite.store_id)
-            .where(CustomerFavorite.customer_email == customer_email)
-        )
-        
-        query = (
-            select(Store, Store.store_id.in_(favorite_stores_query))
-            .outerjoin(Store.products)
+    async def search_store_ids_by_name(
+        self,
+        search_name: str,
+        offset: int = 0,
+        limit: int = 4,
+        cursor: Optional[Tuple] = None
+    ) -> tuple[List[Row], bool]:
+        """이름으로 가게/상품 검색해 가게 ID 페이지 조회 (가게 이름 순)"""
+        id_query = (
+            select(Store.store_id)
             .where(
-                or_(
-                    Store.store_name.like(f"%{search_name}%"),
-                    StoreProductInfo.product_name.like(f"%{search_name}%")
+                Store.store_id.in_(
+                    StoreSearchIndexRepository.match_store_ids_query(search_name)
                 )
             )
-            .options(
-                selectinload(Store.address),
-                selectinload(Store.sns_info),
-                selectinload(Store.operation_info),
-                selectinload(Store.images),
-                selectinload(Store.products).selectinload(StoreProductInfo.nutrition_info)
-            )
-            .order_by(Store.store_name)
-            .distinct()
         )
-        # 페이지네이션 적용
-        paginated_query = query.offset(offset).limit(limit+1)
-        result = await self.session.execute(paginated_query)
-        items = result.unique().all()
         
-        has_next = len(items) > limit
+        return await self._fetch_page(id_query, Store.store_name, False, cursor, offset, limit)
     
-        return items[:limit], not has_next
-    
-    async def get_favorite_stores_with_full_info(self, customer_email: str) -> List[Store]:
-        """고객이 즐겨찾기한 가게들을 모든 관련 정보와 함께 조회"""
+    async def get_favorite_store_ids(self, customer_email: str) -> List[str]:
+        """고객이 즐겨찾기한 가게 ID 목록을 가게 이름 순으로 조회"""
         query = (
-            select(Store)
+            select(Store.store_id)
             .join(CustomerFavorite, Store.store_id == CustomerFavorite.store_id)
             .where(CustomerFavorite.customer_email == customer_email)
-            .options(
-                selectinload(Store.address),
-                selectinload(Store.sns_info),
-                selectinload(Store.operation_info),
-                selectinload(Store.images),
-                selectinload(Store.products).selectinload(StoreProductInfo.nutrition_info)
-            )
             .order_by(Store.store_name)
         )
         result = await self.session.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
     
     async def has_active_orders(self, store_id: str) -> bool:
         """가게에 진행 중인 주문이 있는지 확인"""
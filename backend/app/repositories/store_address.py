@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models.store_address import StoreAddress
 from repositories.base import BaseRepository
+from utils.geo_utils import build_coordinate_values
 
 
 class StoreAddressRepository(BaseRepository[StoreAddress]):
@@ -62,7 +63,8 @@ class StoreAddressRepository(BaseRepository[StoreAddress]):
             sigungu=sigungu,
             bname=bname,
             lat=lat,
-            lng=lng
+            lng=lng,
+            **build_coordinate_values(lat, lng)
         )
     
     async def update_address_with_coordinates(self, address_id: int, 
@@ -75,5 +77,6 @@ class StoreAddressRepository(BaseRepository[StoreAddress]):
             sigungu=sigungu,
             bname=bname,
             lat=lat,
-            lng=lng
+            lng=lng,
+            **build_coordinate_values(lat, lng)
         )
\ No newline at end of file
@@ -5,6 +5,7 @@ from sqlalchemy import select, and_
 from database.models.store_image import StoreImage
 from repositories.base import BaseRepository
 from core.object_storage import object_storage
+from services.store_card import mark_store_cards_dirty
 
 class StoreImageRepository(BaseRepository[StoreImage]):
     """가게 이미지 Repository"""
@@ -34,6 +35,7 @@ class StoreImageRepository(BaseRepository[StoreImage]):
     ) -> StoreImage:
         """이미지 생성"""
         
+        mark_store_cards_dirty(self.session, store_id)
         return await self.create(
             store_id=store_id,
             image_id=image_id,
@@ -79,6 +81,7 @@ class StoreImageRepository(BaseRepository[StoreImage]):
             
             # 변경사항 플러시
             await self.session.flush()
+            mark_store_cards_dirty(self.session, store_id)
             
             # 생성된 이미지들 새로고침
             for image in created_images:
@@ -113,6 +116,7 @@ class StoreImageRepository(BaseRepository[StoreImage]):
         # 변경사항을 세션에 반영
         await self.session.flush()
         await self.session.refresh(image)
+        mark_store_cards_dirty(self.session, image.store_id)
         
         return image
     
@@ -126,6 +130,7 @@ class StoreImageRepository(BaseRepository[StoreImage]):
         if image.is_main:
             raise ValueError("대표 이미지는 삭제할 수 없습니다.")
         
+        mark_store_cards_dirty(self.session, image.store_id)
         return await self.delete(image_id)
     
     async def get_main_images_for_stores(self, store_ids: List[str]) -> Dict[str, Optional[str]]:
@@ -1,10 +1,13 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import time, datetime, timezone, timedelta
-from sqlalchemy import update as sql_update, select
+from sqlalchemy import update as sql_update, select, func, not_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models.store_operation_info import StoreOperationInfo
+from database.models.store_payment_info import StorePaymentInfo
 from repositories.base import BaseRepository
+from repositories.store_payment_info import StorePaymentInfoRepository
+from services.store_card import mark_store_cards_dirty
 
 # KST 타임존 설정
 KST = timezone(timedelta(hours=9))
@@ -30,6 +33,28 @@ class StoreOperationInfoRepository(BaseRepository[StoreOperationInfo]):
             day_of_week=day_of_week
         )
     
+    async def count_open_stores_by_time(self, day_of_week: int, time_field: str) -> Dict[time, int]:
+        """
+        요일의 운영 가게 수를 시각별로 집계 (동적 스케줄 등록용)
+        
+        Args:
+            day_of_week: 요일
+            time_field: 기준 시각 컬럼 (pickup_end_time, close_time 등)
+        
+        Returns:
+            {시각: 가게 수}
+        """
+        time_column = getattr(StoreOperationInfo, time_field)
+        result = await self.session.execute(
+            select(time_column, func.count())
+            .where(
+                StoreOperationInfo.day_of_week == day_of_week,
+                StoreOperationInfo.is_open_enabled.is_(True)
+            )
+            .group_by(time_column)
+        )
+        return dict(result.all())
+    
     async def create_initial_operation_info(
         self,
         store_id: str,
@@ -60,6 +85,7 @@ class StoreOperationInfoRepository(BaseRepository[StoreOperationInfo]):
                 created_info.append(operation_info)
             
             await self.session.flush()
+            mark_store_cards_dirty(self.session, store_id)
             
             # 생성된 정보들 새로고침
             for info in created_info:
@@ -85,7 +111,10 @@ class StoreOperationInfoRepository(BaseRepository[StoreOperationInfo]):
             update_data["is_currently_open"] = is_currently_open
         
         if update_data:
-            return await self.update(operation_id, **update_data)
+            updated_info = await self.update(operation_id, **update_data)
+            if updated_info:
+                mark_store_cards_dirty(self.session, updated_info.store_id)
+            return updated_info
         
         return await self.get_by_pk(operation_id)
     
@@ -117,6 +146,38 @@ class StoreOperationInfoRepository(BaseRepository[StoreOperationInfo]):
         
         return updated_infos
     
+    async def sync_open_status_for_day(self, day_of_week: int) -> Tuple[int, int]:
+        """
+        요일의 운영 상태(is_currently_open)를 오픈 활성화 여부로 한 번에 갱신 (결제 정보가 완전한 가게만)
+        
+        Returns:
+            (갱신된 운영 정보 수, 결제 정보가 없어 건너뛴 운영 정보 수)
+        """
+        payment_complete = StorePaymentInfoRepository.complete_info_condition()
+        
+        result = await self.session.execute(
+            sql_update(StoreOperationInfo)
+            .where(
+                StoreOperationInfo.store_id == StorePaymentInfo.store_id,
+                StoreOperationInfo.day_of_week == day_of_week,
+                payment_complete
+            )
+            .values(is_currently_open=StoreOperationInfo.is_open_enabled)
+            .execution_options(synchronize_session=False)
+        )
+        
+        skipped_count = await self.session.scalar(
+            select(func.count())
+            .select_from(StoreOperationInfo)
+            .outerjoin(StorePaymentInfo, StorePaymentInfo.store_id == StoreOperationInfo.store_id)
+            .where(
+                StoreOperationInfo.day_of_week == day_of_week,
+                not_(payment_complete)
+            )
+        )
+        
+        return result.rowcount, skipped_count
+    
     async def get_today_operation_info(self, store_id: str) -> Optional[StoreOperationInfo]:
         """오늘의 운영 정보 조회"""
         today = datetime.now(KST).weekday()
@@ -199,6 +260,7 @@ class StoreOperationInfoRepository(BaseRepository[StoreOperationInfo]):
         
         if updated_info:
             await self.session.flush()
+            mark_store_cards_dirty(self.session, store_id)
             return updated_info
         else:
             return None
\ No newline at end of file
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Optional, List, Dict
+from sqlalchemy import select, and_, func
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models.store_payment_info import StorePaymentInfo
@@ -14,6 +16,20 @@ class StorePaymentInfoRepository(BaseRepository[StorePaymentInfo]):
         """가게 ID로 결제 정보 조회"""
         return await self.get_by_pk(store_id)
     
+    async def get_secret_keys(self, store_ids: List[str]) -> Dict[str, str]:
+        """여러 가게의 포트원 secret key를 한 번에 조회 (secret key가 없는 가게는 제외)"""
+        if not store_ids:
+            return {}
+        
+        result = await self.session.execute(
+            select(StorePaymentInfo.store_id, StorePaymentInfo.portone_secret_key)
+            .where(
+                StorePaymentInfo.store_id.in_(store_ids),
+                StorePaymentInfo.portone_secret_key.isnot(None)
+            )
+        )
+        return {store_id: secret_key for store_id, secret_key in result.all() if secret_key}
+    
     async def exists_by_store_id(self, store_id: str) -> bool:
         """가게의 결제 정보 존재 여부 확인"""
         return await self.exists(store_id=store_id)
@@ -34,6 +50,15 @@ class StorePaymentInfoRepository(BaseRepository[StorePaymentInfo]):
             return await self.update(store_id, **update_data)
         return await self.get_by_pk(store_id)
     
+    @staticmethod
+    def complete_info_condition() -> ColumnElement[bool]:
+        """결제 정보가 완전한지 확인하는 SQL 조건 (has_complete_info와 같은 기준, 외부 조인에서도 사용 가능)"""
+        return and_(
+            func.coalesce(StorePaymentInfo.portone_store_id, "") != "",
+            func.coalesce(StorePaymentInfo.portone_channel_id, "") != "",
+            func.coalesce(StorePaymentInfo.portone_secret_key, "") != ""
+        )
+    
     async def has_complete_info(self, store_id: str) -> bool:
         """결제 정보가 완전한지 확인"""
         payment_info = await self.get_by_pk(store_id)
@@ -0,0 +1,137 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func, values, column, String, Integer
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+
+from database.models.store_product_daily_stat import StoreProductDailyStat
+from database.models.order_current_item import OrderCurrentItem
+from database.models.store_product_info import StoreProductInfo
+from schemas.order import OrderStatus
+from repositories.base import BaseRepository
+
+
+# 주문 상태별 집계 컬럼 접두사
+STATUS_COLUMN_PREFIXES = {
+    OrderStatus.reservation: "reserved",
+    OrderStatus.accept: "accepted",
+    OrderStatus.complete: "completed",
+    OrderStatus.cancel: "cancelled",
+}
+
+COUNTER_COLUMNS = [
+    f"{prefix}_{suffix}"
+    for prefix in STATUS_COLUMN_PREFIXES.values()
+    for suffix in ("quantity", "amount")
+]
+
+
+# (product_id, quantity, total_amount, 이전 상태 (신규 주문이면 None), 변경된 상태)
+OrderTransition = Tuple[str, int, int, Optional[OrderStatus], OrderStatus]
+
+
+class StoreProductDailyStatRepository(BaseRepository[StoreProductDailyStat]):
+    """상품별 당일 주문 집계 Repository"""
+    
+    def __init__(self, session: AsyncSession):
+        super().__init__(StoreProductDailyStat, session)
+    
+    async def apply_transitions(self, transitions: List[OrderTransition]) -> None:
+        """
+        주문 상태 변경을 집계에 반영 (이전 상태 수량/금액 차감, 변경된 상태에 가산)
+        
+        상품별로 합산한 뒤 한 문장(INSERT ... ON CONFLICT DO UPDATE)으로 반영하므로
+        주문 상태 변경과 같은 트랜잭션에서 호출
+        """
+        deltas: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTER_COLUMNS, 0))
+        
+        for product_id, quantity, amount, previous_status, status in transitions:
+            if previous_status == status:
+                continue
+            
+            product_deltas = deltas[product_id]
+            if previous_status is not None:
+                prefix = STATUS_COLUMN_PREFIXES[OrderStatus(previous_status)]
+                product_deltas[f"{prefix}_quantity"] -= quantity
+                product_deltas[f"{prefix}_amount"] -= amount
+            
+            prefix = STATUS_COLUMN_PREFIXES[OrderStatus(status)]
+            product_deltas[f"{prefix}_quantity"] += quantity
+            product_deltas[f"{prefix}_amount"] += amount
+        
+        if not deltas:
+            return
+        
+        delta_values = (
+            values(
+                column("product_id", String),
+                *(column(name, Integer) for name in COUNTER_COLUMNS),
+                name="deltas"
+            )
+            .data([
+                (product_id, *(product_deltas[name] for name in COUNTER_COLUMNS))
+                for product_id, product_deltas in deltas.items()
+            ])
+        )
+        
+        # 집계 행이 없는 상품은 가게 ID와 함께 새로 생성
+        insert_stmt = insert(StoreProductDailyStat).from_select(
+            ["product_id", "store_id", *COUNTER_COLUMNS],
+            select(
+                delta_values.c.product_id,
+                StoreProductInfo.store_id,
+                *(delta_values.c[name] for name in COUNTER_COLUMNS)
+            )
+            .join(StoreProductInfo, StoreProductInfo.product_id == delta_values.c.product_id)
+        )
+        query = insert_stmt.on_conflict_do_update(
+            index_elements=[StoreProductDailyStat.product_id],
+            set_={
+                **{
+                    name: getattr(StoreProductDailyStat, name) + insert_stmt.excluded[name]
+                    for name in COUNTER_COLUMNS
+                },
+                "updated_at": func.now()
+            }
+        )
+        await self.session.execute(query)
+    
+    async def get_store_product_stats(self, store_id: str) -> List[Row]:
+        """
+        가게의 상품과 당일 주문 집계를 한 번에 조회
+        
+        Returns:
+            (StoreProductInfo, StoreProductDailyStat 또는 None) 목록 (상품 이름순)
+        """
+        query = (
+            select(StoreProductInfo, StoreProductDailyStat)
+            .outerjoin(StoreProductDailyStat, StoreProductDailyStat.product_id == StoreProductInfo.product_id)
+            .where(StoreProductInfo.store_id == store_id)
+            .order_by(StoreProductInfo.product_name)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+    
+    async def rebuild_from_current_orders(self) -> None:
+        """
+        남아있는 당일 주문으로 집계를 다시 생성 (자정 주문 마이그레이션 후 호출)
+        
+        히스토리로 이동된 주문의 집계는 사라지고, 이동 중 새로 들어온 주문의 집계는 유지됨
+        """
+        await self.session.execute(delete(StoreProductDailyStat))
+        
+        counter_sums = []
+        for order_status, prefix in STATUS_COLUMN_PREFIXES.items():
+            status_filter = OrderCurrentItem.status == order_status
+            counter_sums.append(func.coalesce(func.sum(OrderCurrentItem.quantity).filter(status_filter), 0))
+            counter_sums.append(func.coalesce(func.sum(OrderCurrentItem.total_amount).filter(status_filter), 0))
+        
+        await self.session.execute(
+            insert(StoreProductDailyStat).from_select(
+                ["product_id", "store_id", *COUNTER_COLUMNS],
+                select(OrderCurrentItem.product_id, StoreProductInfo.store_id, *counter_sums)
+                .join(StoreProductInfo, StoreProductInfo.product_id == OrderCurrentItem.product_id)
+                .group_by(OrderCurrentItem.product_id, StoreProductInfo.store_id)
+            )
+        )
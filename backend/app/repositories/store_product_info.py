@@ -1,12 +1,19 @@
 from typing import List, Optional, Tuple, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update, values, column, String, Integer
 from sqlalchemy.orm import selectinload
 from enum import Enum
 
 from database.models.store_product_info import StoreProductInfo
 from database.models.product_nutrition import ProductNutrition
 from repositories.base import BaseRepository
+from services.store_card import mark_store_cards_dirty
+from services.redis_cache import HotStockCache
+from services.hot_stock import (
+    record_hot_stock_reservation,
+    release_hot_stock_on_commit,
+    adjust_hot_stock_on_commit
+)
 
 
 class StockUpdateResult(Enum):
@@ -20,6 +27,13 @@ class StoreProductInfoRepository(BaseRepository[StoreProductInfo]):
     def __init__(self, session: AsyncSession):
         super().__init__(StoreProductInfo, session)
     
+    async def update(self, pk_value: str, **kwargs) -> Optional[StoreProductInfo]:
+        """상품 정보 업데이트 (가게 카드 갱신 대상으로 기록)"""
+        product = await super().update(pk_value, **kwargs)
+        if product:
+            mark_store_cards_dirty(self.session, product.store_id)
+        return product
+    
     async def get_by_product_id(self, product_id: str) -> Optional[StoreProductInfo]:
         """상품 ID로 조회"""
         return await self.get_by_pk(product_id)
@@ -42,29 +56,134 @@ class StoreProductInfoRepository(BaseRepository[StoreProductInfo]):
             order_by=["-sale", "product_name"]
         )
     
-    async def adjust_purchased_stock(self, product_id: str, quantity: int) -> StockUpdateResult:
-        """소비자가 상품을 사고/환불 할 때 업데이트"""
-        product = await self.get_by_pk(product_id)
-        if quantity < 0 and product.current_stock < quantity:
-            return StockUpdateResult.INSUFFICIENT_STOCK
+    async def reserve_stock(self, product_id: str, quantity: int) -> Optional[StoreProductInfo]:
+        """
+        재고가 충분할 때만 구매 수량을 증가 (단일 UPDATE)
         
-        success = await self.update_lock(
-            product_id,
-            conditions={"version": product.version},
-            purchased_quantity=product.purchased_quantity + quantity,
-            version=product.version + 1
+        재고 확인과 차감을 한 문장에서 처리하므로 동시 구매 시에도
+        재시도 없이 행 잠금 순서대로 처리됨
+        hot 상품은 Redis 카운터에서 차감하고 DB에는 나중에 일괄 반영
+        (트랜잭션이 커밋되지 않으면 카운터에 다시 복구됨)
+        
+        Returns:
+            갱신된 상품 또는 None (상품이 없거나 재고 부족)
+        """
+        product = await self._reserve_in_db(product_id, quantity, exclude_hot=True)
+        if product:
+            return product
+        
+        # 갱신되지 않은 경우만 상품을 조회해 hot 상품인지 확인 (일반 상품 구매는 Redis를 거치지 않음)
+        product = await self.session.get(StoreProductInfo, product_id)
+        if not product or not product.is_hot_stock:
+            return None
+        
+        # 카운터가 아직 생성되지 않았으면 None이 반환되어 DB에서 처리
+        reserved = await HotStockCache.reserve(product_id, quantity)
+        if reserved is None:
+            return await self._reserve_in_db(product_id, quantity, exclude_hot=False)
+        if not reserved:
+            return None
+        
+        record_hot_stock_reservation(self.session, product_id, quantity)
+        return product
+    
+    async def _reserve_in_db(self, product_id: str, quantity: int, exclude_hot: bool) -> Optional[StoreProductInfo]:
+        conditions = [
+            StoreProductInfo.product_id == product_id,
+            StoreProductInfo.initial_stock
+            - StoreProductInfo.purchased_quantity
+            + StoreProductInfo.admin_adjustment >= quantity
+        ]
+        if exclude_hot:
+            conditions.append(StoreProductInfo.is_hot_stock == False)
+        
+        query = (
+            update(StoreProductInfo)
+            .where(*conditions)
+            .values(
+                purchased_quantity=StoreProductInfo.purchased_quantity + quantity,
+                version=StoreProductInfo.version + 1
+            )
+            .returning(StoreProductInfo)
+            .execution_options(synchronize_session="fetch")
         )
+        result = await self.session.execute(query)
+        product = result.scalar_one_or_none()
         
-        if success:
-            return StockUpdateResult.SUCCESS
-        else:
-            return StockUpdateResult.LOCK_CONFLICT
+        # 가게 카드는 재고 유무만 바뀔 때 갱신 (이번 구매로 품절된 경우)
+        if product and product.current_stock <= 0:
+            mark_store_cards_dirty(self.session, product.store_id)
+        return product
+    
+    async def release_stock(self, product_id: str, quantity: int) -> bool:
+        """
+        구매 취소/환불 시 구매 수량을 감소 (단일 UPDATE)
+        
+        hot 상품은 트랜잭션이 커밋된 후 Redis 카운터에 복구하고 DB에는 나중에 일괄 반영
+        
+        Returns:
+            성공 여부 (상품이 없으면 False)
+        """
+        if await self._release_in_db(product_id, quantity, exclude_hot=True):
+            return True
+        
+        product = await self.session.get(StoreProductInfo, product_id)
+        if not product:
+            return False
+        
+        if product.is_hot_stock and await HotStockCache.is_hot(product_id):
+            release_hot_stock_on_commit(self.session, product_id, quantity)
+            return True
+        
+        return await self._release_in_db(product_id, quantity, exclude_hot=False)
+    
+    async def _release_in_db(self, product_id: str, quantity: int, exclude_hot: bool) -> bool:
+        conditions = [StoreProductInfo.product_id == product_id]
+        if exclude_hot:
+            conditions.append(StoreProductInfo.is_hot_stock == False)
+        
+        query = (
+            update(StoreProductInfo)
+            .where(*conditions)
+            .values(
+                purchased_quantity=StoreProductInfo.purchased_quantity - quantity,
+                version=StoreProductInfo.version + 1
+            )
+            .returning(
+                StoreProductInfo.store_id,
+                (
+                    StoreProductInfo.initial_stock
+                    - StoreProductInfo.purchased_quantity
+                    + StoreProductInfo.admin_adjustment
+                ).label("current_stock")
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+        
+        if row is None:
+            return False
+        
+        # 가게 카드는 재고 유무만 바뀔 때 갱신 (품절 상태였다가 재고가 생긴 경우)
+        if row.current_stock > 0 >= row.current_stock - quantity:
+            mark_store_cards_dirty(self.session, row.store_id)
+        return True
+    
+    async def adjust_purchased_stock(self, product_id: str, quantity: int) -> StockUpdateResult:
+        """소비자가 상품을 사고/환불 할 때 업데이트"""
+        if quantity > 0:
+            product = await self.reserve_stock(product_id, quantity)
+            return StockUpdateResult.SUCCESS if product else StockUpdateResult.INSUFFICIENT_STOCK
+        
+        await self.release_stock(product_id, -quantity)
+        return StockUpdateResult.SUCCESS
     
     async def adjust_admin_stock(self, product_id: str, adjustment: int) -> StockUpdateResult:
         """판매자가 재고를 조절할 때 업데이트"""
         product = await self.get_by_pk(product_id)
         
-        new_total_stock = product.current_stock + adjustment
+        new_total_stock = await self.get_available_stock(product) + adjustment
         if new_total_stock < 0:
             return StockUpdateResult.INSUFFICIENT_STOCK
         
@@ -76,6 +195,9 @@ class StoreProductInfoRepository(BaseRepository[StoreProductInfo]):
         )
         
         if success:
+            if product.is_hot_stock:
+                adjust_hot_stock_on_commit(self.session, product_id, adjustment)
+            mark_store_cards_dirty(self.session, product.store_id)
             return StockUpdateResult.SUCCESS
         
         return StockUpdateResult.LOCK_CONFLICT
@@ -94,10 +216,141 @@ class StoreProductInfoRepository(BaseRepository[StoreProductInfo]):
         )
         
         if success:
+            if product.is_hot_stock:
+                adjust_hot_stock_on_commit(self.session, product_id, new_stock - product.initial_stock)
+            mark_store_cards_dirty(self.session, product.store_id)
             return StockUpdateResult.SUCCESS
         
         return StockUpdateResult.LOCK_CONFLICT
     
+    async def set_stocks(self, new_stocks: Dict[str, int]) -> List[str]:
+        """
+        여러 상품의 재고를 한 문장으로 설정 (예약된 재고 일괄 업데이트용)
+        
+        UPDATE ... FROM (VALUES ...)로 initial_stock을 바꾸고 version을 올림
+        
+        Args:
+            new_stocks: {상품 ID: 변경할 재고}
+        
+        Returns:
+            재고가 설정된 상품 ID 목록 (없는 상품은 제외)
+        """
+        if not new_stocks:
+            return []
+        
+        new_stock_values = (
+            values(column("product_id", String), column("new_stock", Integer), name="new_stocks")
+            .data(list(new_stocks.items()))
+        )
+        
+        # hot 상품 카운터 보정을 위해 변경 전 재고를 함께 반환 (대상 상품 잠금)
+        previous = (
+            select(StoreProductInfo.product_id, StoreProductInfo.initial_stock)
+            .where(StoreProductInfo.product_id.in_(list(new_stocks)))
+            .with_for_update()
+            .cte("previous")
+        )
+        
+        result = await self.session.execute(
+            update(StoreProductInfo)
+            .where(
+                StoreProductInfo.product_id == new_stock_values.c.product_id,
+                StoreProductInfo.product_id == previous.c.product_id
+            )
+            .values(
+                initial_stock=new_stock_values.c.new_stock,
+                version=StoreProductInfo.version + 1
+            )
+            .returning(
+                StoreProductInfo.product_id,
+                StoreProductInfo.store_id,
+                StoreProductInfo.is_hot_stock,
+                StoreProductInfo.initial_stock,
+                previous.c.initial_stock.label("previous_stock")
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        
+        # hot 상품 카운터는 트랜잭션이 커밋된 후에만 보정 (커밋 실패 후 재실행 시 중복 반영 방지)
+        for row in rows:
+            if row.is_hot_stock:
+                adjust_hot_stock_on_commit(self.session, row.product_id, row.initial_stock - row.previous_stock)
+        
+        mark_store_cards_dirty(self.session, *{row.store_id for row in rows})
+        return [row.product_id for row in rows]
+    
+    async def get_available_stock(self, product: StoreProductInfo) -> int:
+        """구매 가능 재고 조회 (hot 상품은 Redis 카운터 기준)"""
+        if product.is_hot_stock:
+            available = await HotStockCache.get_available(product.product_id)
+            if available is not None:
+                return available
+        return product.current_stock
+    
+    async def get_hot_product_stocks(self) -> Dict[str, int]:
+        """hot 모드 상품들의 DB 기준 현재 재고 조회"""
+        query = (
+            select(
+                StoreProductInfo.product_id,
+                StoreProductInfo.initial_stock
+                - StoreProductInfo.purchased_quantity
+                + StoreProductInfo.admin_adjustment
+            )
+            .where(StoreProductInfo.is_hot_stock == True)
+        )
+        result = await self.session.execute(query)
+        return {product_id: stock for product_id, stock in result.all()}
+    
+    async def apply_purchased_deltas(self, deltas: Dict[str, int]) -> List[str]:
+        """
+        Redis 카운터에 쌓인 구매 수량 변화량을 한 문장으로 DB에 반영
+        
+        Args:
+            deltas: product_id별 purchased_quantity 변화량
+        
+        Returns:
+            갱신된 상품들의 store_id 목록
+        """
+        if not deltas:
+            return []
+        
+        delta_values = (
+            values(
+                column("product_id", String),
+                column("delta", Integer),
+                name="deltas"
+            )
+            .data(list(deltas.items()))
+        )
+        query = (
+            update(StoreProductInfo)
+            .where(StoreProductInfo.product_id == delta_values.c.product_id)
+            .values(
+                purchased_quantity=StoreProductInfo.purchased_quantity + delta_values.c.delta,
+                version=StoreProductInfo.version + 1
+            )
+            .returning(
+                StoreProductInfo.store_id,
+                (
+                    StoreProductInfo.initial_stock
+                    - StoreProductInfo.purchased_quantity
+                    + StoreProductInfo.admin_adjustment
+                ).label("current_stock"),
+                delta_values.c.delta
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        rows = result.all()
+        
+        # 가게 카드는 재고 유무가 바뀐 상품의 가게만 갱신
+        mark_store_cards_dirty(self.session, *{
+            row.store_id for row in rows
+            if (row.current_stock > 0) != (row.current_stock + row.delta > 0)
+        })
+        return list({row.store_id for row in rows})
+    
     async def get_with_nutrition_info(self, product_id: str) -> Optional[StoreProductInfo]:
         """영양 정보와 함께 상품 조회"""
         query = (
@@ -170,6 +423,7 @@ class StoreProductInfoRepository(BaseRepository[StoreProductInfo]):
             
             # 3. 모든 변경사항 커밋
             await self.session.flush()
+            mark_store_cards_dirty(self.session, store_id)
             
             # 4. 상품 객체 새로고침 (영양 정보 포함)
             await self.session.refresh(product, ["nutrition_info"])
@@ -0,0 +1,107 @@
+from typing import List
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from database.models.store import Store
+from database.models.store_product_info import StoreProductInfo
+from database.models.store_search_index import StoreSearchDocument, StoreSearchToken
+from repositories.base import BaseRepository
+from utils.search_tokenizer import (
+    normalize_search_text,
+    to_choseong,
+    is_choseong_query,
+    build_document,
+    build_document_tokens,
+    build_query_tokens
+)
+
+
+class StoreSearchIndexRepository(BaseRepository[StoreSearchDocument]):
+    """가게/상품 이름 n-gram 검색 색인 Repository"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(StoreSearchDocument, session)
+
+    async def refresh_store(self, store_id: str) -> None:
+        """
+        가게 이름과 상품 이름으로 검색 문서와 토큰을 다시 생성
+
+        가게 등록, 가게 이름 변경, 상품 등록/수정 후 같은 트랜잭션에서 호출
+        """
+        store_name_result = await self.session.execute(
+            select(Store.store_name).where(Store.store_id == store_id)
+        )
+        store_name = store_name_result.scalar_one_or_none()
+        if store_name is None:
+            return
+
+        product_names_result = await self.session.execute(
+            select(StoreProductInfo.product_name).where(StoreProductInfo.store_id == store_id)
+        )
+        names = [store_name, *product_names_result.scalars().all()]
+
+        search_text = build_document(names)
+        tokens = build_document_tokens(search_text)
+
+        await self.session.execute(
+            delete(StoreSearchToken).where(StoreSearchToken.store_id == store_id)
+        )
+        if tokens:
+            await self.session.execute(
+                insert(StoreSearchToken).values(
+                    [{"token": token, "store_id": store_id} for token in tokens]
+                )
+            )
+
+        document_values = {
+            "search_text": search_text,
+            "choseong_text": to_choseong(search_text),
+            "updated_at": func.now()
+        }
+        await self.session.execute(
+            insert(StoreSearchDocument)
+            .values(store_id=store_id, **document_values)
+            .on_conflict_do_update(
+                index_elements=[StoreSearchDocument.store_id],
+                set_=document_values
+            )
+        )
+        await self.session.flush()
+
+    @staticmethod
+    def match_store_ids_query(search_name: str) -> Select:
+        """
+        검색어와 일치하는 store_id 서브쿼리 생성
+
+        n-gram 역색인으로 모든 토큰을 가진 후보를 찾은 뒤,
+        후보 문서에서만 부분 문자열 일치를 확인
+        초성으로만 이루어진 검색어는 초성 텍스트와 비교
+        """
+        normalized = normalize_search_text(search_name)
+        if not normalized:
+            return select(Store.store_id)
+
+        query_tokens: List[str] = build_query_tokens(normalized)
+
+        candidate_query = (
+            select(StoreSearchToken.store_id)
+            .where(StoreSearchToken.token.in_(query_tokens))
+            .group_by(StoreSearchToken.store_id)
+            .having(func.count() == len(query_tokens))
+        )
+
+        text_column = (
+            StoreSearchDocument.choseong_text
+            if is_choseong_query(normalized)
+            else StoreSearchDocument.search_text
+        )
+
+        return (
+            select(StoreSearchDocument.store_id)
+            .where(
+                StoreSearchDocument.store_id.in_(candidate_query),
+                text_column.contains(normalized, autoescape=True)
+            )
+        )
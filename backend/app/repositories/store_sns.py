@@ -1,11 +1,12 @@
 from typing import Optional, Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update as sql_update
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from database.models.store_sns import StoreSNS
 from database.models.store import Store
 from repositories.base import BaseRepository
+from services.store_card import mark_store_cards_dirty
 
 
 class StoreSNSRepository(BaseRepository[StoreSNS]):
@@ -27,6 +28,7 @@ class StoreSNSRepository(BaseRepository[StoreSNS]):
         homepage: Optional[str] = None
     ) -> StoreSNS:
         """SNS 정보 생성 또는 업데이트"""
+        mark_store_cards_dirty(self.session, store_id)
         existing = await self.get_by_store_id(store_id)
         
         if existing:
@@ -64,6 +66,7 @@ class StoreSNSRepository(BaseRepository[StoreSNS]):
         if not existing:
             return None
         
+        mark_store_cards_dirty(self.session, store_id)
         update_data = {}
         for platform in ["instagram", "facebook", "x", "homepage"]:
             if platform in sns_data:
@@ -77,6 +80,7 @@ class StoreSNSRepository(BaseRepository[StoreSNS]):
         """가게 ID로 SNS 정보 삭제"""
         sns_info = await self.get_by_store_id(store_id)
         if sns_info:
+            mark_store_cards_dirty(self.session, store_id)
             return await self.delete(sns_info.sns_id)
         return False
     
@@ -104,19 +108,11 @@ class StoreSNSRepository(BaseRepository[StoreSNS]):
             # 업데이트할 값이 없으면 현재 데이터만 조회해서 반환
             return await self.get_by_store_id(store_id)
         
-        # UPDATE 실행 후 RETURNING 사용
-        query = (
-            sql_update(StoreSNS)
-            .where(StoreSNS.store_id == store_id)
-            .values(**update_values)
-            .returning(StoreSNS)
-        )
+        # UPDATE ... RETURNING 한 문장으로 갱신
+        updated_rows = await self.bulk_update_where(update_values, store_id=store_id)
         
-        result = await self.session.execute(query)
-        updated_sns = result.scalar_one_or_none()
-        
-        if updated_sns:
-            await self.session.flush()
-            return updated_sns
+        if updated_rows:
+            mark_store_cards_dirty(self.session, store_id)
+            return updated_rows[0]
         else:
             return None
\ No newline at end of file
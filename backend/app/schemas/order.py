@@ -44,8 +44,10 @@ class CustomerOrderItemResponse(OrderItemResponse):
     main_image_url: Optional[str] = Field(None, description="대표 이미지 URL")
         
 class CustomerOrderListResponse(BaseModel):
-    orders: List[CustomerOrderItemResponse] = Field(default_factory=list, description="주문 목록")
-    total: int = Field(..., description="전체 주문 수")
+    orders: List[CustomerOrderItemResponse] = Field(default_factory=list, description="주문 목록 (예약 시간 내림차순)")
+    total: int = Field(..., description="이번 페이지의 주문 수")
+    is_end: bool = Field(..., description="마지막 페이지 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     
 class CustomerTodayOrderItemResponse(CustomerOrderItemResponse):
     pickup_start_time: str = Field(..., description="가게 픽업 시작 시간 (HH:MM)")
@@ -84,6 +86,11 @@ class DashboardStockItem(BaseModel):
     initial_stock: int = Field(..., description="설정된 최초 재고 수량")
     purchased_stock: int = Field(..., description="현재까지 구매된 수량 (수락 전 + 수락 + 완료 - 취소)")
     adjustment_stock: int = Field(..., description="관리자가 설정한 총 재고 수량")
+    reserved_quantity: int = Field(0, description="당일 수락 대기 중인 주문 수량")
+    accepted_quantity: int = Field(0, description="당일 수락된 주문 수량")
+    completed_quantity: int = Field(0, description="당일 픽업 완료된 주문 수량")
+    cancelled_quantity: int = Field(0, description="당일 취소된 주문 수량")
+    sales_amount: int = Field(0, description="당일 매출 (수락 + 픽업 완료 금액)")
     
     class Config:
         from_attributes = True
@@ -105,6 +112,8 @@ class SettlementItem(BaseModel):
 class SettlementDayGroup(BaseModel):
     date: str = Field(..., description="날짜 KST (YYYY-MM-DD)")
     items: List[SettlementItem] = Field(default_factory=list, description="해당 날짜의 정산 아이템들")
+    completed_amount: int = Field(0, description="해당 날짜의 픽업 완료 금액 합계")
+    canceled_amount: int = Field(0, description="해당 날짜의 취소 금액 합계")
 
 
 class SettlementResponse(BaseModel):
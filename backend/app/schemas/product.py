@@ -60,4 +60,16 @@ class ProductStockReservationResponse(BaseModel):
     product_id: str = Field(..., description="상품 고유 ID")
     initial_stock: int = Field(..., description="초기 재고 수량")
     new_stock: int = Field(..., description="변경할 재고 수량")
-    reserved_at: datetime = Field(..., description="예약 일시")
\ No newline at end of file
+    reserved_at: datetime = Field(..., description="예약 일시")
+
+
+class ProductHotStockRequest(BaseModel):
+    """상품 hot 모드 설정 스키마"""
+    is_hot_stock: bool = Field(..., description="재고를 Redis 카운터로 관리할지 여부 (주문이 몰리는 상품)")
+
+
+class ProductHotStockResponse(BaseModel):
+    """상품 hot 모드 설정 응답 스키마"""
+    product_id: str = Field(..., description="상품 고유 ID")
+    is_hot_stock: bool = Field(..., description="재고를 Redis 카운터로 관리하는지 여부")
+    current_stock: int = Field(..., description="현재 재고 수량")
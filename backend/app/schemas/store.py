@@ -56,6 +56,19 @@ class PaginatedStoreResponse(BaseModel):
     """페이지네이션이 적용된 가게 목록 응답"""
     stores: List[StoreDetailResponseForCustomer] = Field(..., description="가게 목록")
     is_end: bool = Field(..., description="마지막 페이지 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
+
+
+class NearbyStoreResponse(StoreDetailResponseForCustomer):
+    """고객용 주변 가게 정보 (거리 포함)"""
+    distance_m: int = Field(..., description="기준 좌표로부터의 거리 (미터)")
+
+
+class PaginatedNearbyStoreResponse(BaseModel):
+    """커서 페이지네이션이 적용된 주변 가게 목록 응답"""
+    stores: List[NearbyStoreResponse] = Field(..., description="가까운 순 가게 목록")
+    is_end: bool = Field(..., description="마지막 페이지 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     
 class StoreCloseStateResponse(BaseModel):
     """가게 마감 성공 메시지"""
@@ -1,10 +1,10 @@
+from datetime import datetime, timedelta, timezone
 from loguru import logger
 
 from database.session import get_session
 from repositories.cart_item import CartItemRepository
-from repositories.store_product_info import StoreProductInfoRepository, StockUpdateResult
-from config.settings import settings
-from database.session import get_db
+from services.payment_scheduler import PaymentSchedulerService
+from services.redis_cache import PaymentTimeoutQueue
 
 class CartRecoveryService:
     """서버 재부팅 시 장바구니 재고 복구 서비스"""
@@ -12,73 +12,40 @@ class CartRecoveryService:
     @classmethod
     async def recover_abandoned_carts(cls) -> int:
         """
-        서버 재부팅 시 모든 장바구니 아이템의 재고를 복구하고 삭제
+        서버 재부팅 시 결제 타임아웃 대기열에 없는 장바구니 아이템을 대기열에 다시 등록
+        
+        대기열은 Redis에 남아 있으므로 진행 중인 결제는 그대로 두고,
+        대기열 유실 등으로 빠진 아이템만 원래 마감 시각으로 등록해 스위퍼가 재고를 복구하도록 함
+        
+        결제 확인은 대기열에서 먼저 빠진 뒤 주문을 생성하므로, 결제 시간 제한(+ 스위퍼 처리 제한 시간)이
+        지나지 않은 아이템과 이미 주문이 생성된 아이템은 다시 등록하지 않음 (재고 중복 복구 방지)
+        리더 워커에서만 실행됨 (LeaderRecoveryTask)
         
         Returns:
-            복구된 장바구니 아이템 수
+            다시 등록된 장바구니 아이템 수
         """
-        recovered_count = 0
-        
         try:
             async with get_session() as session:
                 cart_repo = CartItemRepository(session)
-                product_repo = StoreProductInfoRepository(session)
-                
-                cart_items = await cart_repo.get_many(load_relations=["product"])
-                
-                if not cart_items:
-                    logger.info("복구할 장바구니 아이템이 없습니다.")
-                    return 0
-                
-                logger.info(f"복구 대상 장바구니 아이템 수: {len(cart_items)}")
-                
-                for cart_item in cart_items:
-                    try:
-                        max_retries = settings.MAX_RETRY_LOCK
-                        for attempt in range(max_retries):
-                            result = await product_repo.adjust_purchased_stock(
-                                cart_item.product_id, 
-                                -cart_item.quantity
-                            )
-                            
-                            if result == StockUpdateResult.SUCCESS:
-                                logger.info(
-                                    f"재고 복구 성공 - Payment ID: {cart_item.payment_id}, "
-                                    f"Product ID: {cart_item.product_id}, 수량: {cart_item.quantity}"
-                                )
-                                break
-                            elif result == StockUpdateResult.LOCK_CONFLICT:
-                                if attempt < max_retries - 1:
-                                    logger.warning(
-                                        f"재고 복구 재시도 {attempt + 1}/{max_retries} - "
-                                        f"Payment ID: {cart_item.payment_id}"
-                                    )
-                                    continue
-                            
-                            if attempt == max_retries - 1:
-                                logger.error(
-                                    f"재고 복구 실패 - Payment ID: {cart_item.payment_id}, "
-                                    f"Product ID: {cart_item.product_id}, Result: {result}"
-                                )
-                                continue
-                        
-                        deleted = await cart_repo.delete(cart_item.payment_id)
-                        if deleted:
-                            recovered_count += 1
-                            logger.info(f"장바구니 아이템 삭제 완료 - Payment ID: {cart_item.payment_id}")
-                        else:
-                            logger.error(f"장바구니 아이템 삭제 실패 - Payment ID: {cart_item.payment_id}")
-                            
-                    except Exception as e:
-                        logger.error(
-                            f"장바구니 복구 처리 중 오류 - Payment ID: {cart_item.payment_id}, "
-                            f"Error: {str(e)}"
-                        )
-                        continue
-                
-                await session.commit()
-                logger.info(f"장바구니 재고 복구 완료 - 총 {recovered_count}개 아이템 처리")
-                
+                created_before = datetime.now(timezone.utc) - timedelta(
+                    minutes=PaymentSchedulerService.PAYMENT_TIMEOUT_MINUTES,
+                    seconds=PaymentSchedulerService.SWEEP_LEASE_SECONDS
+                )
+                cart_items = await cart_repo.get_abandoned(created_before)
+            
+            if not cart_items:
+                logger.info("복구할 장바구니 아이템이 없습니다.")
+                return 0
+            
+            recovered_count = await PaymentTimeoutQueue.schedule_missing({
+                cart_item.payment_id: PaymentSchedulerService.get_deadline(cart_item.created_at)
+                for cart_item in cart_items
+            })
+            
+            logger.info(
+                f"장바구니 재고 복구 등록 완료 - 전체 {len(cart_items)}개 중 {recovered_count}개 아이템 등록"
+            )
+        
         except Exception as e:
             logger.error(f"장바구니 재고 복구 서비스 오류: {str(e)}")
             raise
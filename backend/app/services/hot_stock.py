@@ -0,0 +1,251 @@
+import asyncio
+from collections import defaultdict
+from typing import Coroutine, Dict, Set
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from database.session import get_session
+from services.redis_cache import HotStockCache
+
+
+RESERVED_HOT_STOCKS_KEY = "reserved_hot_stocks"
+RELEASED_HOT_STOCKS_KEY = "released_hot_stocks"
+ADJUSTED_HOT_STOCKS_KEY = "adjusted_hot_stocks"
+SYNC_HOT_PRODUCTS_KEY = "sync_hot_products"
+
+# 커밋/롤백 후 실행되는 카운터 반영 작업 (가비지 컬렉션 방지용 참조)
+_pending_tasks: Set[asyncio.Task] = set()
+
+# StoreProductInfoRepository는 이 모듈의 세션 기록 함수를 사용하므로 함수 안에서 import
+
+
+class HotStockService:
+    """hot 상품 Redis 재고 카운터와 DB 재고 동기화 서비스
+    
+    hot 상품의 구매/취소는 Redis 카운터에서 처리되고,
+    purchased_quantity 변화량은 주기적으로 DB에 일괄 반영(write-behind)됨
+    """
+    
+    @classmethod
+    async def flush_pending(cls) -> int:
+        """
+        Redis에 쌓인 구매 수량 변화량을 DB에 일괄 반영
+        
+        Returns:
+            반영된 상품 수
+        """
+        product_ids = await HotStockCache.get_product_ids()
+        deltas = await HotStockCache.drain_pending(product_ids)
+        
+        if not deltas:
+            return 0
+        
+        from repositories.store_product_info import StoreProductInfoRepository
+        
+        try:
+            async with get_session() as session:
+                product_repo = StoreProductInfoRepository(session)
+                await product_repo.apply_purchased_deltas(deltas)
+        except Exception as e:
+            # 반영하지 못한 변화량은 다음 주기에 다시 반영
+            await HotStockCache.restore_pending(deltas)
+            logger.error(f"hot 상품 재고 반영 실패 - 상품 수: {len(deltas)}, Error: {str(e)}")
+            raise
+        
+        return len(deltas)
+    
+    @classmethod
+    async def sync_hot_products(cls) -> None:
+        """
+        DB의 hot 모드 설정과 Redis 카운터를 맞춤
+        
+        - hot 모드인데 카운터가 없는 상품: DB 현재 재고로 카운터 생성
+        - hot 모드가 해제된 상품: 남은 변화량을 DB에 반영하고 카운터 삭제
+        
+        카운터가 생기기 전까지는 DB 단일 UPDATE로 재고가 처리됨
+        """
+        from repositories.store_product_info import StoreProductInfoRepository
+        
+        async with get_session() as session:
+            product_repo = StoreProductInfoRepository(session)
+            hot_stocks = await product_repo.get_hot_product_stocks()
+            
+            cached_ids = set(await HotStockCache.get_product_ids())
+            disabled_ids = [product_id for product_id in cached_ids if product_id not in hot_stocks]
+            
+            deltas = await HotStockCache.remove(disabled_ids)
+            await product_repo.apply_purchased_deltas(deltas)
+            
+            seeded_count = await HotStockCache.seed(
+                {product_id: stock for product_id, stock in hot_stocks.items() if product_id not in cached_ids}
+            )
+        
+        if seeded_count or disabled_ids:
+            logger.info(
+                f"hot 상품 재고 카운터 동기화 - 생성: {seeded_count}개, 해제: {len(disabled_ids)}개"
+            )
+    
+    @classmethod
+    async def reset_counters(cls, session) -> None:
+        """
+        재고 초기화 직후 hot 상품 카운터를 초기화된 DB 재고로 덮어씀
+        
+        초기화로 purchased_quantity가 0이 되므로 미반영 변화량도 함께 삭제
+        """
+        from repositories.store_product_info import StoreProductInfoRepository
+        
+        product_repo = StoreProductInfoRepository(session)
+        hot_stocks = await product_repo.get_hot_product_stocks()
+        await HotStockCache.reset(hot_stocks)
+        
+        logger.info(f"hot 상품 재고 카운터 초기화 - {len(hot_stocks)}개")
+    
+    @classmethod
+    async def recover_on_startup(cls) -> None:
+        """
+        서버 시작 시 hot 상품 카운터 복구
+        
+        Redis에 남아 있는 변화량을 먼저 DB에 반영한 뒤,
+        카운터가 없는 hot 상품은 DB 재고로 다시 생성
+        """
+        await cls.flush_pending()
+        await cls.sync_hot_products()
+
+
+def _record(session, key: str, product_id: str, quantity: int) -> None:
+    info = getattr(session, "sync_session", session).info
+    info.setdefault(key, defaultdict(int))[product_id] += quantity
+
+
+def record_hot_stock_reservation(session, product_id: str, quantity: int) -> None:
+    """
+    Redis 카운터에서 이미 차감한 hot 상품 재고를 세션에 기록
+    
+    카운터 차감은 트랜잭션 안에서 재고 확인과 함께 이뤄지므로,
+    트랜잭션이 커밋되지 않고 끝나면 카운터에 다시 복구됨 (커밋되면 기록은 버려짐)
+    
+    Args:
+        session: AsyncSession 또는 Session
+        product_id: 상품 ID
+        quantity: 차감한 수량
+    """
+    _record(session, RESERVED_HOT_STOCKS_KEY, product_id, quantity)
+
+
+def release_hot_stock_on_commit(session, product_id: str, quantity: int) -> None:
+    """
+    hot 상품 재고 복구를 세션에 기록
+    
+    트랜잭션이 커밋된 후에만 카운터에 복구됨 (롤백되면 기록은 버려짐)
+    
+    Args:
+        session: AsyncSession 또는 Session
+        product_id: 상품 ID
+        quantity: 복구할 수량
+    """
+    _record(session, RELEASED_HOT_STOCKS_KEY, product_id, quantity)
+
+
+def adjust_hot_stock_on_commit(session, product_id: str, delta: int) -> None:
+    """
+    판매자 조절/재고 설정으로 바뀐 hot 상품 재고를 세션에 기록
+    
+    트랜잭션이 커밋된 후에만 카운터에 반영됨 (롤백되면 기록은 버려짐)
+    
+    Args:
+        session: AsyncSession 또는 Session
+        product_id: 상품 ID
+        delta: 구매 가능 재고 변화량
+    """
+    _record(session, ADJUSTED_HOT_STOCKS_KEY, product_id, delta)
+
+
+def sync_hot_stock_on_commit(session) -> None:
+    """
+    상품의 hot 모드 변경을 세션에 기록
+    
+    트랜잭션이 커밋된 후 카운터를 바로 생성/삭제함 (롤백되면 기록은 버려짐)
+    
+    Args:
+        session: AsyncSession 또는 Session
+    """
+    info = getattr(session, "sync_session", session).info
+    info[SYNC_HOT_PRODUCTS_KEY] = True
+
+
+async def _sync() -> None:
+    try:
+        await HotStockService.sync_hot_products()
+    except Exception as e:
+        logger.error(f"hot 상품 재고 카운터 동기화 실패: {e}")
+
+
+async def _release(quantities: Dict[str, int]) -> None:
+    """카운터에 재고 복구 (그 사이 hot 모드가 해제되어 카운터가 없는 상품은 DB에 반영)"""
+    try:
+        missing = {}
+        for product_id, quantity in quantities.items():
+            if quantity and not await HotStockCache.release(product_id, quantity):
+                missing[product_id] = -quantity
+        
+        if missing:
+            from repositories.store_product_info import StoreProductInfoRepository
+            
+            async with get_session() as session:
+                await StoreProductInfoRepository(session).apply_purchased_deltas(missing)
+    except Exception as e:
+        logger.error(f"hot 상품 재고 복구 실패 - {dict(quantities)}: {e}")
+
+
+async def _adjust(deltas: Dict[str, int]) -> None:
+    """카운터에 재고 변화량 반영 (카운터가 없으면 다음 생성 시 DB 재고로 만들어짐)"""
+    try:
+        for product_id, delta in deltas.items():
+            if delta:
+                await HotStockCache.adjust(product_id, delta)
+    except Exception as e:
+        logger.error(f"hot 상품 재고 조절 반영 실패 - {dict(deltas)}: {e}")
+
+
+def _schedule(coroutine: Coroutine) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coroutine.close()
+        return
+    
+    task = loop.create_task(coroutine)
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_hot_stocks_after_commit(session: Session) -> None:
+    session.info.pop(RESERVED_HOT_STOCKS_KEY, None)
+    released = session.info.pop(RELEASED_HOT_STOCKS_KEY, None)
+    adjusted = session.info.pop(ADJUSTED_HOT_STOCKS_KEY, None)
+    sync = session.info.pop(SYNC_HOT_PRODUCTS_KEY, False)
+    
+    if released:
+        _schedule(_release(released))
+    if adjusted:
+        _schedule(_adjust(adjusted))
+    if sync:
+        _schedule(_sync())
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _revert_hot_stocks_after_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # 커밋되었다면 after_commit에서 이미 기록을 비웠으므로, 남은 기록은 롤백되거나 커밋 없이 닫힌 트랜잭션의 것
+    if transaction.parent is not None:
+        return
+    
+    session.info.pop(RELEASED_HOT_STOCKS_KEY, None)
+    session.info.pop(ADJUSTED_HOT_STOCKS_KEY, None)
+    session.info.pop(SYNC_HOT_PRODUCTS_KEY, None)
+    reserved = session.info.pop(RESERVED_HOT_STOCKS_KEY, None)
+    
+    if reserved:
+        _schedule(_release(reserved))
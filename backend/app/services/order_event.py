@@ -0,0 +1,119 @@
+import asyncio
+import json
+from typing import AsyncIterator, List, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core.redis import RedisClient
+from schemas.order import OrderItemResponse, OrderStatus
+
+
+PENDING_ORDER_EVENTS_KEY = "pending_order_events"
+
+# 커밋 후 실행되는 발행 작업 (가비지 컬렉션 방지용 참조)
+_pending_tasks: Set[asyncio.Task] = set()
+
+
+class OrderEventChannel:
+    """가게별 주문 이벤트 Redis Pub/Sub 채널
+    
+    store_orders:{store_id} 채널로 주문 상태 변경(reservation, accept, complete, cancel)을 발행
+    """
+    
+    CHANNEL_PREFIX = "store_orders:"
+    KEEPALIVE_SECONDS = 15
+    
+    @staticmethod
+    def _channel(store_id: str) -> str:
+        return f"{OrderEventChannel.CHANNEL_PREFIX}{store_id}"
+    
+    @staticmethod
+    async def publish(events: List[Tuple[str, str]]) -> None:
+        """(store_id, 이벤트 JSON) 목록 발행"""
+        if not events:
+            return
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for store_id, data in events:
+            pipe.publish(OrderEventChannel._channel(store_id), data)
+        await pipe.execute()
+    
+    @staticmethod
+    async def stream(store_id: str, is_disconnected) -> AsyncIterator[str]:
+        """
+        가게 채널을 구독하여 SSE 형식으로 이벤트 전달
+        
+        이벤트가 없을 때는 KEEPALIVE_SECONDS마다 주석 라인을 보내 연결을 유지
+        
+        Args:
+            store_id: 가게 ID
+            is_disconnected: 클라이언트 연결 종료 여부를 반환하는 코루틴 함수
+        """
+        redis = await RedisClient.get_client()
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(OrderEventChannel._channel(store_id))
+        
+        try:
+            yield ": connected\n\n"
+            
+            while not await is_disconnected():
+                message = await pubsub.get_message(timeout=OrderEventChannel.KEEPALIVE_SECONDS)
+                
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                yield f"event: order\ndata: {message['data']}\n\n"
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+
+def publish_order_event(session, order: OrderItemResponse) -> None:
+    """
+    주문 상태 변경 이벤트를 세션에 기록
+    
+    트랜잭션이 커밋되면 가게 채널로 발행됨 (롤백되면 기록은 버려짐)
+    
+    Args:
+        session: AsyncSession 또는 Session
+        order: 변경된 주문 (status가 이벤트 종류)
+    """
+    data = json.dumps({
+        "event": order.status.value if isinstance(order.status, OrderStatus) else order.status,
+        "order": order.model_dump(mode="json")
+    }, ensure_ascii=False)
+    
+    info = getattr(session, "sync_session", session).info
+    info.setdefault(PENDING_ORDER_EVENTS_KEY, []).append((order.store_id, data))
+
+
+async def _publish(events: List[Tuple[str, str]]) -> None:
+    try:
+        await OrderEventChannel.publish(events)
+    except Exception as e:
+        logger.error(f"주문 이벤트 발행 실패: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_order_events_after_commit(session: Session) -> None:
+    events = session.info.pop(PENDING_ORDER_EVENTS_KEY, None)
+    if not events:
+        return
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    task = loop.create_task(_publish(events))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_order_events_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_ORDER_EVENTS_KEY, None)
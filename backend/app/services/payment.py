@@ -16,9 +16,9 @@ class PaymentService:
         포트원에서 결제를 검증하고 결제 상태를 업데이트합니다.
         """
 
-        # 가게별 secret key를 사용하여 PortOneClient 생성
-        portone_client = PortOneClient(secret_key=secret_key)
-        actual_payment = portone_client.get_payment(payment_id)
+        # 가게별 secret key로 캐싱된 PortOneClient 사용
+        portone_client = await PortOneClient.get_client(secret_key)
+        actual_payment = await portone_client.get_payment(payment_id)
         details = PortOneClient.extract_payment_details(actual_payment)
             
         return {
@@ -32,11 +32,11 @@ class PaymentService:
         결제를 환불 처리합니다.
         """
         
-        # 가게별 secret key를 사용하여 PortOneClient 생성
-        portone_client = PortOneClient(secret_key=secret_key)
+        # 가게별 secret key로 캐싱된 PortOneClient 사용
+        portone_client = await PortOneClient.get_client(secret_key)
         
         # 포트원 환불 요청
-        refund_result = portone_client.cancel_payment(
+        refund_result = await portone_client.cancel_payment(
             payment_id=payment_id,
             reason=reason
         )
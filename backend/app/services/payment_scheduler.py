@@ -1,119 +1,127 @@
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Dict, List
 from loguru import logger
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from pytz import timezone as pytz_timezone
 
 from database.session import get_session
-from services.scheduler import scheduler as app_scheduler
-from repositories.store_product_info import StockUpdateResult, StoreProductInfoRepository
-from repositories.order_current_item import OrderCurrentItemRepository
-from config.settings import settings
+from repositories.cart_item import CartItemRepository
+from repositories.store_product_info import StoreProductInfoRepository
+from services.redis_cache import PaymentTimeoutQueue
 
-KST = pytz_timezone('Asia/Seoul')
 
 class PaymentSchedulerService:
-    """결제 시간 제한 관리 서비스"""
+    """결제 시간 제한 관리 서비스
+    
+    결제 마감 시각은 Redis Sorted Set에 기록되고, 스위퍼가 마감된 결제를 원자적으로 가져가
+    재고 복구와 장바구니 삭제를 일괄 처리함 (워커 수, 서버 재시작과 무관하게 동작)
+    """
     
     PAYMENT_TIMEOUT_MINUTES = 5
+    SWEEP_BATCH_SIZE = 100
+    SWEEP_LEASE_SECONDS = 60
     
     @classmethod
-    def _get_scheduler(cls) -> AsyncIOScheduler:
-        """현재 실행 중인 스케줄러 인스턴스 반환"""
-        return app_scheduler.scheduler
+    def get_deadline(cls, created_at: datetime) -> float:
+        """결제 시작 시각 기준 마감 시각 (epoch 초)"""
+        return (created_at + timedelta(minutes=cls.PAYMENT_TIMEOUT_MINUTES)).timestamp()
     
     @classmethod
-    async def schedule_payment_timeout(
-        cls,
-        payment_id: str,
-        product_id: str,
-        quantity: int
-    ) -> bool:
+    async def schedule_payment_timeout(cls, payment_id: str) -> bool:
         """
-        결제 타임아웃 스케줄 등록
-        5분 후에 재고 복구 및 장바구니 삭제 작업을 실행하도록 스케줄링
+        결제 타임아웃 등록
+        5분 후 스위퍼가 재고 복구 및 장바구니 삭제를 처리하도록 대기열에 추가
         
         Args:
             payment_id: 결제 ID
-            product_id: 상품 ID
-            quantity: 구매 수량
-            
+        
         Returns:
             성공 여부
         """
         try:
-            scheduler = cls._get_scheduler()
-            job_id = f"payment_timeout_{payment_id}"
-            
-            run_time = datetime.now(KST) + timedelta(minutes=cls.PAYMENT_TIMEOUT_MINUTES)
-            
-            async def restore_stock():
-                """재고 복구 및 장바구니 삭제 작업"""
-                logger.info(f"결제 타임아웃으로 재고 복구 시작 - Payment ID: {payment_id}")
-                
-                async with get_session() as session:
-                    product_repo = StoreProductInfoRepository(session)
-                    cart_repo = OrderCurrentItemRepository(session)
-                    
-                    max_retries = settings.MAX_RETRY_LOCK
-                    for attempt in range(max_retries):
-                        result = await product_repo.adjust_purchased_stock(product_id, -quantity)
-                        
-                        if result == StockUpdateResult.SUCCESS:
-                            logger.info(f"재고 복구 성공 - Product ID: {product_id}, 수량: {quantity}")
-                            break
-                        
-                        if attempt == max_retries - 1:
-                            logger.error(f"재고 복구 실패 - Product ID: {product_id}, 수량: {quantity}")
-                            return
-                    
-                    try:
-                        await cart_repo.delete(payment_id)
-                        logger.info(f"장바구니에서 삭제 완료 - Payment ID: {payment_id}")
-                    except Exception as e:
-                        logger.error(f"장바구니 삭제 실패 - Payment ID: {payment_id}, Error: {str(e)}")
+            deadline = cls.get_deadline(datetime.now(timezone.utc))
+            await PaymentTimeoutQueue.schedule(payment_id, deadline)
             
-            scheduler.add_job(
-                func=restore_stock,
-                trigger='date',
-                run_date=run_time,
-                id=job_id,
-                name=f"Payment timeout for {payment_id}",
-                misfire_grace_time=60,
-                replace_existing=True
-            )
-            
-            logger.info(f"결제 타임아웃 스케줄 등록 - Payment ID: {payment_id}, 실행 시간: {run_time}")
+            logger.info(f"결제 타임아웃 등록 - Payment ID: {payment_id}, 마감 시각: {deadline}")
             return True
-            
+        
         except Exception as e:
-            logger.error(f"결제 타임아웃 스케줄 등록 실패 - Payment ID: {payment_id}, Error: {str(e)}")
+            logger.error(f"결제 타임아웃 등록 실패 - Payment ID: {payment_id}, Error: {str(e)}")
             return False
     
     @classmethod
-    def remove_payment_schedule(cls, payment_id: str) -> bool:
+    async def remove_payment_schedule(cls, payment_id: str) -> bool:
         """
-        특정 결제의 스케줄 삭제
+        특정 결제의 타임아웃 취소
+        
+        스위퍼와 동시에 호출되어도 둘 중 한 곳에서만 성공함
         
         Args:
             payment_id: 결제 ID
-            
+        
         Returns:
-            성공 여부
+            성공 여부 (이미 마감된 결제면 False)
         """
         try:
-            scheduler = cls._get_scheduler()
-            job_id = f"payment_timeout_{payment_id}"
-            
-            job = scheduler.get_job(job_id)
-            if not job:
-                logger.warning(f"삭제할 스케줄이 없음 - Payment ID: {payment_id}")
+            if not await PaymentTimeoutQueue.cancel(payment_id):
+                logger.warning(f"취소할 결제 타임아웃이 없음 - Payment ID: {payment_id}")
                 return False
             
-            scheduler.remove_job(job_id)
-            logger.info(f"결제 스케줄 삭제 완료 - Payment ID: {payment_id}")
+            logger.info(f"결제 타임아웃 취소 완료 - Payment ID: {payment_id}")
             return True
-            
+        
         except Exception as e:
-            logger.error(f"결제 스케줄 삭제 실패 - Payment ID: {payment_id}, Error: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error(f"결제 타임아웃 취소 실패 - Payment ID: {payment_id}, Error: {str(e)}")
+            return False
+    
+    @classmethod
+    async def sweep_expired_payments(cls) -> int:
+        """
+        마감된 결제를 배치 단위로 가져가 재고 복구 및 장바구니 삭제
+        
+        처리 중 실패한 배치는 처리 제한 시간이 지난 뒤 다시 처리됨
+        
+        Returns:
+            재고가 복구된 장바구니 항목 수
+        """
+        now = datetime.now(timezone.utc).timestamp()
+        restored_count = 0
+        
+        while True:
+            payment_ids = await PaymentTimeoutQueue.claim_due(
+                now, cls.SWEEP_LEASE_SECONDS, cls.SWEEP_BATCH_SIZE
+            )
+            if not payment_ids:
+                break
+            
+            restored_count += await cls._restore_expired(payment_ids)
+            await PaymentTimeoutQueue.ack(payment_ids)
+            
+            if len(payment_ids) < cls.SWEEP_BATCH_SIZE:
+                break
+        
+        return restored_count
+    
+    @classmethod
+    async def _restore_expired(cls, payment_ids: List[str]) -> int:
+        """마감된 결제의 장바구니를 한 번에 삭제하고, 실제로 삭제된 수량만큼 상품별로 재고 복구"""
+        async with get_session() as session:
+            cart_repo = CartItemRepository(session)
+            product_repo = StoreProductInfoRepository(session)
+            
+            # 결제 확인으로 이미 삭제된 장바구니는 결과에 포함되지 않음
+            deleted_items = await cart_repo.delete_by_payment_ids_and_return(payment_ids)
+            
+            quantities: Dict[str, int] = defaultdict(int)
+            for item in deleted_items:
+                quantities[item.product_id] += item.quantity
+            
+            for product_id, quantity in quantities.items():
+                if not await product_repo.release_stock(product_id, quantity):
+                    logger.error(f"재고 복구 실패 - Product ID: {product_id}, 수량: {quantity}")
+        
+        if deleted_items:
+            logger.info(
+                f"결제 타임아웃 재고 복구 - 장바구니: {len(deleted_items)}개, 상품: {len(quantities)}개"
+            )
+        
+        return len(deleted_items)
@@ -1,5 +1,19 @@
+import asyncio
+from typing import List, Set
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
 from core.redis import RedisClient
 
+
+PENDING_QR_COMPLETIONS_KEY = "pending_qr_completions"
+
+# 커밋 후 실행되는 완료 알림 작업 (가비지 컬렉션 방지용 참조)
+_pending_tasks: Set[asyncio.Task] = set()
+
+
 class QRCallbackCache:
     """QR 콜백 처리를 위한 Redis 캐시 유틸리티"""
     
@@ -17,10 +31,43 @@ class QRCallbackCache:
     
     @staticmethod
     async def set_completed_status(payment_id: str) -> None:
-        """결제 완료 상태 설정"""
+        """결제 완료 상태 설정 후 같은 이름의 채널로 완료 알림 발행"""
         redis = await RedisClient.get_client()
         key = f"{QRCallbackCache.QR_CALLBACK_PREFIX}{payment_id}"
-        await redis.set(key, QRCallbackCache.COMPLETED_STATUS, ex=QRCallbackCache.TTL_SECONDS)
+        pipe = redis.pipeline(transaction=True)
+        pipe.set(key, QRCallbackCache.COMPLETED_STATUS, ex=QRCallbackCache.TTL_SECONDS)
+        pipe.publish(key, QRCallbackCache.COMPLETED_STATUS)
+        await pipe.execute()
+    
+    @staticmethod
+    async def wait_for_completed(payment_id: str, timeout: float) -> bool:
+        """
+        완료 알림을 기다림 (폴링 없이 채널 구독)
+        
+        구독 전에 이미 완료된 경우를 놓치지 않도록 구독 후 현재 상태를 한 번 확인
+        
+        Returns:
+            timeout 안에 완료되었는지 여부
+        """
+        redis = await RedisClient.get_client()
+        key = f"{QRCallbackCache.QR_CALLBACK_PREFIX}{payment_id}"
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(key)
+        
+        try:
+            if await redis.get(key) == QRCallbackCache.COMPLETED_STATUS:
+                return True
+            
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while (remaining := deadline - loop.time()) > 0:
+                message = await pubsub.get_message(timeout=remaining)
+                if message and message["data"] == QRCallbackCache.COMPLETED_STATUS:
+                    return True
+            return False
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
     
     @staticmethod
     async def get_status(payment_id: str) -> str | None:
@@ -34,4 +81,49 @@ class QRCallbackCache:
         """상태 삭제"""
         redis = await RedisClient.get_client()
         key = f"{QRCallbackCache.QR_CALLBACK_PREFIX}{payment_id}"
-        await redis.delete(key)
\ No newline at end of file
+        await redis.delete(key)
+
+
+def set_completed_status_on_commit(session, payment_id: str) -> None:
+    """
+    QR 결제 완료 알림을 세션에 기록
+    
+    트랜잭션이 커밋되면 완료 상태를 설정하고 알림을 발행함 (롤백되면 기록은 버려짐)
+    판매자 화면이 알림을 받은 직후 주문을 조회해도 완료 상태가 보이도록 커밋 후에 발행
+    
+    Args:
+        session: AsyncSession 또는 Session
+        payment_id: 결제 ID
+    """
+    info = getattr(session, "sync_session", session).info
+    info.setdefault(PENDING_QR_COMPLETIONS_KEY, []).append(payment_id)
+
+
+async def _set_completed(payment_ids: List[str]) -> None:
+    for payment_id in payment_ids:
+        try:
+            await QRCallbackCache.set_completed_status(payment_id)
+        except Exception as e:
+            # 알림 실패는 critical하지 않으므로 무시, 판매자 대기는 TTL_SECONDS 후 자동 타임아웃됨
+            logger.error(f"QR 완료 알림 발행 실패 - Payment ID: {payment_id}, Error: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _set_qr_completed_after_commit(session: Session) -> None:
+    payment_ids = session.info.pop(PENDING_QR_COMPLETIONS_KEY, None)
+    if not payment_ids:
+        return
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    task = loop.create_task(_set_completed(payment_ids))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_qr_completions_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_QR_COMPLETIONS_KEY, None)
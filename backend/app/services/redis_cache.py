@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Iterable
 import json
 from app.core.redis import RedisClient
 
@@ -146,4 +146,592 @@ class SearchHistoryCache:
         else:
             await redis.set(key, json.dumps(history), ex=7*24*60*60)
             
-        return True
\ No newline at end of file
+        return True
+
+
+class StoreCardCache:
+    """가게 카드(고객용 가게 상세 정보) 캐시 관련 유틸리티 클래스
+    
+    카드는 가게별 버전과 전체 epoch를 함께 저장하며,
+    현재 버전/epoch와 다르면 만료된 카드로 취급
+    """
+    
+    CARD_PREFIX = "store_card:"
+    VERSION_PREFIX = "store_card_version:"
+    EPOCH_KEY = "store_card_epoch"
+    
+    @staticmethod
+    async def get_cards(store_ids: List[str]) -> Tuple[Dict[str, dict], Dict[str, Tuple[int, int]]]:
+        """
+        여러 가게 카드를 한 번에 조회
+        
+        Args:
+            store_ids: 가게 ID 목록
+        
+        Returns:
+            (유효한 카드 dict, 카드가 없거나 만료된 가게의 (버전, epoch) dict)
+        """
+        if not store_ids:
+            return {}, {}
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        pipe.mget([f"{StoreCardCache.CARD_PREFIX}{store_id}" for store_id in store_ids])
+        pipe.mget([f"{StoreCardCache.VERSION_PREFIX}{store_id}" for store_id in store_ids])
+        pipe.get(StoreCardCache.EPOCH_KEY)
+        cards_json, versions, epoch = await pipe.execute()
+        
+        epoch = int(epoch or 0)
+        cards = {}
+        misses = {}
+        for store_id, card_json, version in zip(store_ids, cards_json, versions):
+            version = int(version or 0)
+            if card_json:
+                cached = json.loads(card_json)
+                if cached.get("version") == version and cached.get("epoch") == epoch:
+                    cards[store_id] = cached["card"]
+                    continue
+            misses[store_id] = (version, epoch)
+        
+        return cards, misses
+    
+    @staticmethod
+    async def set_cards(
+        cards: Dict[str, dict],
+        snapshots: Dict[str, Tuple[int, int]],
+        ttl: int = RedisClient.SHORT_CACHE_TTL
+    ) -> None:
+        """
+        조회 시점의 (버전, epoch)와 함께 가게 카드 저장
+        
+        카드를 만드는 동안 가게가 수정되면 버전이 올라가므로
+        저장된 카드는 다음 조회에서 자동으로 만료 처리됨
+        
+        Args:
+            cards: store_id별 카드
+            snapshots: get_cards가 반환한 store_id별 (버전, epoch)
+            ttl: Time To Live (초 단위, 기본값: 1시간)
+        """
+        if not cards:
+            return
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for store_id, card in cards.items():
+            version, epoch = snapshots.get(store_id, (0, 0))
+            pipe.set(
+                f"{StoreCardCache.CARD_PREFIX}{store_id}",
+                json.dumps({"version": version, "epoch": epoch, "card": card}, ensure_ascii=False),
+                ex=ttl
+            )
+        await pipe.execute()
+    
+    @staticmethod
+    async def invalidate(store_ids: Iterable[str]) -> None:
+        """
+        가게 버전을 올려 기존 카드를 만료
+        
+        Args:
+            store_ids: 가게 ID 목록
+        """
+        store_ids = list(store_ids)
+        if not store_ids:
+            return
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for store_id in store_ids:
+            pipe.incr(f"{StoreCardCache.VERSION_PREFIX}{store_id}")
+        await pipe.execute()
+    
+    @staticmethod
+    async def invalidate_all() -> None:
+        """epoch를 올려 모든 가게 카드를 만료"""
+        redis = await RedisClient.get_client()
+        await redis.incr(StoreCardCache.EPOCH_KEY)
+
+
+class FavoriteCache:
+    """소비자 즐겨찾기 가게 Set 캐시 관련 유틸리티 클래스
+    
+    즐겨찾기가 없는 소비자도 캐싱할 수 있도록 Set에 빈 문자열 표식을 함께 저장
+    """
+    
+    FAVORITES_PREFIX = "favorites:"
+    LOADED_MARKER = ""
+    
+    # 캐시가 있을 때만 반영 (없으면 다음 조회 시 DB에서 다시 생성)
+    _UPDATE_IF_LOADED_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return redis.call(ARGV[1], KEYS[1], ARGV[2])
+    end
+    return -1
+    """
+    
+    @staticmethod
+    async def get_flags(customer_email: str, store_ids: List[str]) -> Optional[List[bool]]:
+        """
+        여러 가게의 즐겨찾기 여부를 SMISMEMBER 한 번으로 조회
+        
+        Args:
+            customer_email: 소비자 이메일
+            store_ids: 가게 ID 목록
+        
+        Returns:
+            store_ids 순서의 즐겨찾기 여부 목록 또는 None (캐시 없음)
+        """
+        redis = await RedisClient.get_client()
+        key = f"{FavoriteCache.FAVORITES_PREFIX}{customer_email}"
+        
+        if not store_ids:
+            return [] if await redis.exists(key) else None
+        
+        pipe = redis.pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.smismember(key, store_ids)
+        exists, flags = await pipe.execute()
+        
+        if not exists:
+            return None
+        return [bool(flag) for flag in flags]
+    
+    @staticmethod
+    async def set_favorites(customer_email: str, store_ids: List[str], ttl: int = RedisClient.DEFAULT_CACHE_TTL) -> None:
+        """
+        DB에서 조회한 즐겨찾기 가게 목록으로 Set 캐시 생성
+        
+        Args:
+            customer_email: 소비자 이메일
+            store_ids: 즐겨찾기 가게 ID 목록
+            ttl: Time To Live (초 단위, 기본값: 24시간)
+        """
+        redis = await RedisClient.get_client()
+        key = f"{FavoriteCache.FAVORITES_PREFIX}{customer_email}"
+        
+        pipe = redis.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.sadd(key, FavoriteCache.LOADED_MARKER, *store_ids)
+        pipe.expire(key, ttl)
+        await pipe.execute()
+    
+    @staticmethod
+    async def add_favorite(customer_email: str, store_id: str) -> None:
+        """즐겨찾기 추가를 Set 캐시에 반영"""
+        redis = await RedisClient.get_client()
+        key = f"{FavoriteCache.FAVORITES_PREFIX}{customer_email}"
+        await redis.eval(FavoriteCache._UPDATE_IF_LOADED_SCRIPT, 1, key, "SADD", store_id)
+    
+    @staticmethod
+    async def remove_favorite(customer_email: str, store_id: str) -> None:
+        """즐겨찾기 삭제를 Set 캐시에 반영"""
+        redis = await RedisClient.get_client()
+        key = f"{FavoriteCache.FAVORITES_PREFIX}{customer_email}"
+        await redis.eval(FavoriteCache._UPDATE_IF_LOADED_SCRIPT, 1, key, "SREM", store_id)
+
+
+class HotStockCache:
+    """hot 상품 재고 카운터 관련 유틸리티 클래스
+    
+    hot_stock:{product_id}          : 현재 구매 가능한 재고
+    hot_stock_pending:{product_id}  : 아직 DB purchased_quantity에 반영되지 않은 구매 수량 변화량
+    hot_stock_products              : 카운터가 있는 상품 ID Set
+    """
+    
+    COUNTER_PREFIX = "hot_stock:"
+    PENDING_PREFIX = "hot_stock_pending:"
+    PRODUCTS_KEY = "hot_stock_products"
+    
+    # 반환값: -2 카운터 없음, -1 재고 부족, 0 이상 남은 재고
+    _RESERVE_SCRIPT = """
+    local stock = redis.call('GET', KEYS[1])
+    if not stock then
+        return -2
+    end
+    local quantity = tonumber(ARGV[1])
+    if tonumber(stock) < quantity then
+        return -1
+    end
+    redis.call('INCRBY', KEYS[2], quantity)
+    return redis.call('DECRBY', KEYS[1], quantity)
+    """
+    
+    # 반환값: 0 카운터 없음, 1 성공
+    _RELEASE_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return 0
+    end
+    local quantity = tonumber(ARGV[1])
+    redis.call('INCRBY', KEYS[1], quantity)
+    redis.call('DECRBY', KEYS[2], quantity)
+    return 1
+    """
+    
+    # 반환값: 0 카운터 없음, 1 성공
+    _ADJUST_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return 0
+    end
+    redis.call('INCRBY', KEYS[1], tonumber(ARGV[1]))
+    return 1
+    """
+    
+    # 카운터가 없을 때만 생성 (아직 DB에 반영되지 않은 변화량만큼 차감)
+    _SEED_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return 0
+    end
+    local pending = tonumber(redis.call('GET', KEYS[2]) or '0')
+    redis.call('SET', KEYS[1], tonumber(ARGV[1]) - pending)
+    redis.call('SADD', KEYS[3], ARGV[2])
+    return 1
+    """
+    
+    # 카운터 삭제와 미반영 변화량 조회를 원자적으로 처리
+    _REMOVE_SCRIPT = """
+    local pending = redis.call('GET', KEYS[2])
+    redis.call('DEL', KEYS[1], KEYS[2])
+    redis.call('SREM', KEYS[3], ARGV[1])
+    return pending
+    """
+    
+    @staticmethod
+    def _keys(product_id: str) -> Tuple[str, str]:
+        return (
+            f"{HotStockCache.COUNTER_PREFIX}{product_id}",
+            f"{HotStockCache.PENDING_PREFIX}{product_id}"
+        )
+    
+    @staticmethod
+    async def reserve(product_id: str, quantity: int) -> Optional[bool]:
+        """
+        카운터에서 재고를 원자적으로 차감
+        
+        Returns:
+            True (성공), False (재고 부족), None (카운터 없음)
+        """
+        redis = await RedisClient.get_client()
+        result = await redis.eval(
+            HotStockCache._RESERVE_SCRIPT, 2, *HotStockCache._keys(product_id), quantity
+        )
+        if result == -2:
+            return None
+        return result >= 0
+    
+    @staticmethod
+    async def release(product_id: str, quantity: int) -> bool:
+        """
+        카운터에 재고를 복구
+        
+        Returns:
+            성공 여부 (카운터가 없으면 False)
+        """
+        redis = await RedisClient.get_client()
+        result = await redis.eval(
+            HotStockCache._RELEASE_SCRIPT, 2, *HotStockCache._keys(product_id), quantity
+        )
+        return result == 1
+    
+    @staticmethod
+    async def adjust(product_id: str, delta: int) -> bool:
+        """
+        판매자 조절/설정 수량 변경을 카운터에 반영 (DB에 바로 반영되는 변경)
+        
+        Returns:
+            성공 여부 (카운터가 없으면 False)
+        """
+        redis = await RedisClient.get_client()
+        counter_key, _ = HotStockCache._keys(product_id)
+        result = await redis.eval(HotStockCache._ADJUST_SCRIPT, 1, counter_key, delta)
+        return result == 1
+    
+    @staticmethod
+    async def get_available(product_id: str) -> Optional[int]:
+        """카운터의 구매 가능 재고 조회 (카운터가 없으면 None)"""
+        redis = await RedisClient.get_client()
+        counter_key, _ = HotStockCache._keys(product_id)
+        stock = await redis.get(counter_key)
+        return int(stock) if stock is not None else None
+    
+    @staticmethod
+    async def seed(product_stocks: Dict[str, int]) -> int:
+        """
+        DB의 현재 재고로 카운터가 없는 상품의 카운터 생성
+        
+        Args:
+            product_stocks: product_id별 DB current_stock
+        
+        Returns:
+            새로 생성된 카운터 수
+        """
+        if not product_stocks:
+            return 0
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for product_id, stock in product_stocks.items():
+            pipe.eval(
+                HotStockCache._SEED_SCRIPT, 3,
+                *HotStockCache._keys(product_id), HotStockCache.PRODUCTS_KEY,
+                stock, product_id
+            )
+        return sum(await pipe.execute())
+    
+    @staticmethod
+    async def reset(product_stocks: Dict[str, int]) -> None:
+        """
+        재고 초기화 후 카운터를 DB 재고로 덮어쓰고 미반영 변화량 삭제
+        
+        Args:
+            product_stocks: product_id별 초기화된 current_stock
+        """
+        if not product_stocks:
+            return
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=True)
+        for product_id, stock in product_stocks.items():
+            counter_key, pending_key = HotStockCache._keys(product_id)
+            pipe.set(counter_key, stock)
+            pipe.delete(pending_key)
+            pipe.sadd(HotStockCache.PRODUCTS_KEY, product_id)
+        await pipe.execute()
+    
+    @staticmethod
+    async def is_hot(product_id: str) -> bool:
+        """카운터가 있는 상품인지 확인"""
+        redis = await RedisClient.get_client()
+        return bool(await redis.sismember(HotStockCache.PRODUCTS_KEY, product_id))
+    
+    @staticmethod
+    async def get_product_ids() -> List[str]:
+        """카운터가 있는 상품 ID 목록 조회"""
+        redis = await RedisClient.get_client()
+        return list(await redis.smembers(HotStockCache.PRODUCTS_KEY))
+    
+    @staticmethod
+    async def drain_pending(product_ids: List[str]) -> Dict[str, int]:
+        """
+        미반영 변화량을 꺼내고 0으로 초기화 (GETDEL)
+        
+        Returns:
+            product_id별 변화량 (0은 제외)
+        """
+        if not product_ids:
+            return {}
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for product_id in product_ids:
+            pipe.getdel(f"{HotStockCache.PENDING_PREFIX}{product_id}")
+        values = await pipe.execute()
+        
+        return {
+            product_id: int(value)
+            for product_id, value in zip(product_ids, values)
+            if value is not None and int(value) != 0
+        }
+    
+    @staticmethod
+    async def restore_pending(deltas: Dict[str, int]) -> None:
+        """DB 반영에 실패한 변화량을 되돌림"""
+        if not deltas:
+            return
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for product_id, delta in deltas.items():
+            pipe.incrby(f"{HotStockCache.PENDING_PREFIX}{product_id}", delta)
+        await pipe.execute()
+    
+    @staticmethod
+    async def remove(product_ids: List[str]) -> Dict[str, int]:
+        """
+        hot 모드가 해제된 상품의 카운터 삭제
+        
+        Returns:
+            삭제 시점까지의 product_id별 미반영 변화량 (호출하는 쪽에서 DB에 반영)
+        """
+        if not product_ids:
+            return {}
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for product_id in product_ids:
+            pipe.eval(
+                HotStockCache._REMOVE_SCRIPT, 3,
+                *HotStockCache._keys(product_id), HotStockCache.PRODUCTS_KEY,
+                product_id
+            )
+        values = await pipe.execute()
+        
+        return {
+            product_id: int(value)
+            for product_id, value in zip(product_ids, values)
+            if value is not None and int(value) != 0
+        }
+
+
+class PaymentTimeoutQueue:
+    """결제 타임아웃 대기열 (Redis Sorted Set)
+    
+    payment_timeouts             : 결제 마감 시각(epoch 초)을 score로 가진 결제 ID
+    payment_timeouts_processing  : 스위퍼가 가져가 처리 중인 결제 ID (score는 처리 제한 시각)
+    
+    처리 제한 시각이 지나도록 완료 처리되지 않은 결제(처리 중 서버 종료 등)는 다시 가져감
+    """
+    
+    PENDING_KEY = "payment_timeouts"
+    PROCESSING_KEY = "payment_timeouts_processing"
+    
+    # 마감된 결제와 처리 제한 시각이 지난 결제를 처리 중으로 옮기고 반환
+    _CLAIM_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local lease_until = tonumber(ARGV[2])
+    local limit = tonumber(ARGV[3])
+    local claimed = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, limit)
+    if #claimed < limit then
+        local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, limit - #claimed)
+        for _, payment_id in ipairs(due) do
+            redis.call('ZREM', KEYS[1], payment_id)
+            table.insert(claimed, payment_id)
+        end
+    end
+    for _, payment_id in ipairs(claimed) do
+        redis.call('ZADD', KEYS[2], lease_until, payment_id)
+    end
+    return claimed
+    """
+    
+    @staticmethod
+    async def schedule(payment_id: str, deadline: float) -> None:
+        """결제 마감 시각 등록"""
+        redis = await RedisClient.get_client()
+        await redis.zadd(PaymentTimeoutQueue.PENDING_KEY, {payment_id: deadline})
+    
+    @staticmethod
+    async def schedule_missing(deadlines: Dict[str, float]) -> int:
+        """
+        대기열에 없는 결제만 마감 시각 등록 (이미 등록된 결제는 유지)
+        
+        Returns:
+            새로 등록된 결제 수
+        """
+        if not deadlines:
+            return 0
+        
+        redis = await RedisClient.get_client()
+        pipe = redis.pipeline(transaction=False)
+        for payment_id in deadlines:
+            pipe.zscore(PaymentTimeoutQueue.PROCESSING_KEY, payment_id)
+        processing_scores = await pipe.execute()
+        
+        missing = {
+            payment_id: deadline
+            for (payment_id, deadline), score in zip(deadlines.items(), processing_scores)
+            if score is None
+        }
+        if not missing:
+            return 0
+        
+        return await redis.zadd(PaymentTimeoutQueue.PENDING_KEY, missing, nx=True)
+    
+    @staticmethod
+    async def cancel(payment_id: str) -> bool:
+        """
+        결제 마감 대기 취소 (결제 확인 시 호출)
+        
+        Returns:
+            취소 여부 (이미 마감되어 스위퍼가 가져간 결제면 False)
+        """
+        redis = await RedisClient.get_client()
+        return await redis.zrem(PaymentTimeoutQueue.PENDING_KEY, payment_id) == 1
+    
+    @staticmethod
+    async def claim_due(now: float, lease_seconds: int, limit: int) -> List[str]:
+        """
+        마감된 결제를 원자적으로 가져감 (여러 워커가 동시에 호출해도 한 곳에서만 처리)
+        
+        Args:
+            now: 현재 시각 (epoch 초)
+            lease_seconds: 처리 제한 시간 (지나면 다른 스위퍼가 다시 가져감)
+            limit: 최대 개수
+        """
+        redis = await RedisClient.get_client()
+        return await redis.eval(
+            PaymentTimeoutQueue._CLAIM_SCRIPT, 2,
+            PaymentTimeoutQueue.PENDING_KEY, PaymentTimeoutQueue.PROCESSING_KEY,
+            now, now + lease_seconds, limit
+        )
+    
+    @staticmethod
+    async def ack(payment_ids: List[str]) -> None:
+        """처리가 끝난 결제를 처리 중 목록에서 삭제"""
+        if not payment_ids:
+            return
+        
+        redis = await RedisClient.get_client()
+        await redis.zrem(PaymentTimeoutQueue.PROCESSING_KEY, *payment_ids)
+
+
+class SchedulerLeaderLease:
+    """스케줄러 리더 임대 (Redis 키 + TTL)
+    
+    scheduler_leader : 리더 워커의 ID (TTL이 지나면 다른 워커가 리더가 됨)
+    
+    리더는 TTL보다 짧은 주기로 임대를 갱신하고, 갱신에 실패하면 리더에서 물러남
+    """
+    
+    LEADER_KEY = "scheduler_leader"
+    
+    # 본인이 가진 임대일 때만 TTL 갱신
+    _RENEW_SCRIPT = """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+    
+    # 본인이 가진 임대일 때만 삭제
+    _RELEASE_SCRIPT = """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        return redis.call('DEL', KEYS[1])
+    end
+    return 0
+    """
+    
+    @staticmethod
+    async def acquire(worker_id: str, ttl_seconds: int) -> bool:
+        """리더가 없으면 임대 획득"""
+        redis = await RedisClient.get_client()
+        return bool(await redis.set(
+            SchedulerLeaderLease.LEADER_KEY, worker_id, nx=True, px=ttl_seconds * 1000
+        ))
+    
+    @staticmethod
+    async def renew(worker_id: str, ttl_seconds: int) -> bool:
+        """
+        임대 갱신
+        
+        Returns:
+            갱신 여부 (다른 워커가 리더가 되었으면 False)
+        """
+        redis = await RedisClient.get_client()
+        result = await redis.eval(
+            SchedulerLeaderLease._RENEW_SCRIPT, 1, SchedulerLeaderLease.LEADER_KEY,
+            worker_id, ttl_seconds * 1000
+        )
+        return result == 1
+    
+    @staticmethod
+    async def release(worker_id: str) -> None:
+        """임대 반납 (종료 시 다른 워커가 바로 리더가 될 수 있도록)"""
+        redis = await RedisClient.get_client()
+        await redis.eval(
+            SchedulerLeaderLease._RELEASE_SCRIPT, 1, SchedulerLeaderLease.LEADER_KEY, worker_id
+        )
+    
+    @staticmethod
+    async def get_leader() -> Optional[str]:
+        """현재 리더 워커 ID 조회"""
+        redis = await RedisClient.get_client()
+        return await redis.get(SchedulerLeaderLease.LEADER_KEY)
@@ -0,0 +1,274 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from database.session import get_session
+from repositories.order_current_item import OrderCurrentItemRepository
+from repositories.order_history_item import OrderHistoryItemRepository
+from repositories.refund_failure import RefundFailureRepository
+from repositories.store_payment_info import StorePaymentInfoRepository
+from repositories.store_product_info import StoreProductInfoRepository
+from schemas.order import OrderStatus
+from services.email import email_service
+from services.order_event import publish_order_event
+from services.payment import PaymentService
+from utils.store_utils import convert_order_to_response
+
+
+# 환불과 함께 취소할 수 있는 주문 상태
+REFUNDABLE_STATUSES = [OrderStatus.reservation, OrderStatus.accept]
+
+
+class RefundExecutor:
+    """주문 일괄 환불 실행기
+    
+    1. 가게별 결제 설정을 한 번에 조회하고, 대상 주문은 REFUND_DB_BATCH_SIZE건씩 처리
+    2. 배치마다 주문을 잠그고 아직 취소할 수 있는 주문만 다시 선별한 뒤 포트원 환불 요청 (동시에 최대 REFUND_CONCURRENCY건)
+    3. 환불된 주문은 같은 트랜잭션에서 주문 취소/재고 복구 후 커밋
+    4. 취소된 주문은 커밋 후 가게 주문 채널로 이벤트 발행
+    5. 실패한 환불은 refund_failures에 기록하고 재시도 작업에서 다시 처리
+    6. 취소 안내 이메일은 커밋 이후 전송
+    
+    환불 대상(target)은 다음 키를 가진 딕셔너리:
+        payment_id, store_id, store_name, customer_id, product_id, quantity, total_amount,
+        cancel_reason, release_stock, refunded (선택, 포트원 환불이 이미 끝난 경우 True)
+    """
+    
+    MAX_RETRY_ATTEMPTS = 5
+    RETRY_BATCH_SIZE = 500
+    
+    @staticmethod
+    def build_target(order, cancel_reason: str, release_stock: bool) -> Dict[str, Any]:
+        """주문(product, product.store 관계 포함)으로 환불 대상 생성"""
+        return {
+            "payment_id": order.payment_id,
+            "store_id": order.product.store_id,
+            "store_name": order.product.store.store_name,
+            "customer_id": order.customer_id,
+            "product_id": order.product_id,
+            "quantity": order.quantity,
+            "total_amount": order.total_amount,
+            "cancel_reason": cancel_reason,
+            "release_stock": release_stock
+        }
+    
+    @classmethod
+    async def refund(cls, targets: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        환불 대상을 일괄 환불 처리
+        
+        Returns:
+            {"refunded": 성공 건수, "failed": 실패 건수, "refund_amount": 총 환불 금액}
+        """
+        if not targets:
+            return {"refunded": 0, "failed": 0, "refund_amount": 0}
+        
+        async with get_session(auto_commit=False) as session:
+            secret_keys = await StorePaymentInfoRepository(session).get_secret_keys(
+                list({target["store_id"] for target in targets})
+            )
+        
+        # 처리가 끝난 대상 (취소 반영 완료 또는 더 이상 환불할 수 없는 주문)
+        finished, cancelled, failures = [], [], []
+        for start in range(0, len(targets), settings.REFUND_DB_BATCH_SIZE):
+            batch = targets[start:start + settings.REFUND_DB_BATCH_SIZE]
+            batch_finished, batch_cancelled, batch_failures = await cls._refund_batch(batch, secret_keys)
+            finished.extend(batch_finished)
+            cancelled.extend(batch_cancelled)
+            failures.extend(batch_failures)
+        
+        failure_repo = RefundFailureRepository()
+        await failure_repo.delete_by_payment_ids([target["payment_id"] for target in finished])
+        await failure_repo.record_failures(failures)
+        
+        await cls._send_cancel_emails(cancelled)
+        
+        return {
+            "refunded": len(cancelled),
+            "failed": len(failures),
+            "refund_amount": sum(target["total_amount"] for target in cancelled)
+        }
+    
+    @classmethod
+    async def retry_failed_refunds(cls) -> Dict[str, int]:
+        """기록된 환불 실패 내역을 다시 처리"""
+        failures = await RefundFailureRepository().get_retryable(
+            cls.MAX_RETRY_ATTEMPTS, cls.RETRY_BATCH_SIZE
+        )
+        
+        targets = [
+            failure.model_dump(include={
+                "payment_id", "store_id", "store_name", "customer_id", "product_id",
+                "quantity", "total_amount", "cancel_reason", "release_stock", "refunded"
+            })
+            for failure in failures
+        ]
+        return await cls.refund(targets)
+    
+    @classmethod
+    async def _refund_batch(
+        cls,
+        batch: List[Dict[str, Any]],
+        secret_keys: Dict[str, str]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        배치 단위로 주문을 잠그고 환불한 뒤 취소 처리
+        
+        주문을 먼저 잠그므로 환불하는 동안 픽업 완료/고객 취소가 끼어들지 못하고,
+        그사이 이미 처리된 주문은 환불하지 않음 (히스토리로 이동된 주문은 상태만 다시 확인)
+        커밋에 실패하면 환불된 대상은 환불 완료 상태로 실패 내역에 기록되어 재시도 시 취소 반영만 다시 수행
+        
+        Returns:
+            (처리가 끝난 대상, 그중 실제로 취소된 대상, 실패 내역)
+        """
+        history_repo = OrderHistoryItemRepository()
+        history_statuses = [order_status.value for order_status in REFUNDABLE_STATUSES]
+        payment_ids = [target["payment_id"] for target in batch]
+        
+        skipped, refunded, failures = [], [], []
+        cancelled_ids = set()
+        missing_ids_by_reason: Dict[str, List[str]] = {}
+        
+        try:
+            async with get_session() as session:
+                order_repo = OrderCurrentItemRepository(session)
+                product_repo = StoreProductInfoRepository(session)
+                
+                current_ids = set(await order_repo.lock_orders(payment_ids, REFUNDABLE_STATUSES))
+                history_ids = set(await history_repo.get_payment_ids(
+                    [payment_id for payment_id in payment_ids if payment_id not in current_ids],
+                    history_statuses
+                ))
+                
+                refundable = []
+                for target in batch:
+                    if target["payment_id"] in current_ids or target["payment_id"] in history_ids:
+                        refundable.append(target)
+                    else:
+                        skipped.append(target)
+                        logger.warning(f"이미 처리된 주문이라 환불하지 않음 - 주문: {target['payment_id']}")
+                
+                refunded, failures = await cls._request_refunds(refundable, secret_keys)
+                
+                targets_by_reason = defaultdict(list)
+                for target in refunded:
+                    targets_by_reason[target["cancel_reason"]].append(target)
+                
+                quantities: Dict[str, int] = defaultdict(int)
+                for cancel_reason, reason_targets in targets_by_reason.items():
+                    reason_ids = [target["payment_id"] for target in reason_targets]
+                    release_ids = {target["payment_id"] for target in reason_targets if target["release_stock"]}
+                    
+                    cancelled_rows = await order_repo.cancel_orders(
+                        reason_ids, cancel_reason, REFUNDABLE_STATUSES
+                    )
+                    for row in cancelled_rows:
+                        cancelled_ids.add(row.payment_id)
+                        if row.payment_id in release_ids:
+                            quantities[row.product_id] += row.quantity
+                    
+                    missing_ids_by_reason[cancel_reason] = [
+                        payment_id for payment_id in reason_ids if payment_id not in cancelled_ids
+                    ]
+                
+                # 가게 주문 채널로 취소 이벤트 발행 (커밋 후)
+                for order in await order_repo.get_orders_with_store_relation(list(cancelled_ids)):
+                    publish_order_event(session, convert_order_to_response(order))
+                
+                # 재고 복구는 같은 트랜잭션에서 처리 (hot 상품 카운터는 커밋된 후에만 복구되므로
+                # 커밋에 실패한 배치를 재시도해도 중복 복구되지 않음)
+                for product_id, quantity in quantities.items():
+                    if not await product_repo.release_stock(product_id, quantity):
+                        logger.error(f"재고 복구 실패 - Product ID: {product_id}, 수량: {quantity}")
+            
+            # 히스토리로 이동된 주문
+            for cancel_reason, reason_ids in missing_ids_by_reason.items():
+                cancelled_ids.update(
+                    await history_repo.cancel_orders(reason_ids, cancel_reason, history_statuses)
+                )
+        
+        except Exception as e:
+            logger.error(f"환불 주문 취소 반영 실패 - {len(batch)}건, Error: {str(e)}")
+            failed_ids = {failure["payment_id"] for failure in failures}
+            refunded_ids = {target["payment_id"] for target in refunded}
+            skipped_ids = {target["payment_id"] for target in skipped}
+            failures.extend(
+                {
+                    **target,
+                    "refunded": bool(target.get("refunded")) or target["payment_id"] in refunded_ids,
+                    "error": f"주문 취소 반영 실패: {str(e)}"
+                }
+                for target in batch
+                if target["payment_id"] not in failed_ids and target["payment_id"] not in skipped_ids
+            )
+            return skipped, [], failures
+        
+        cancelled = [target for target in refunded if target["payment_id"] in cancelled_ids]
+        return skipped + refunded, cancelled, failures
+    
+    @classmethod
+    async def _request_refunds(
+        cls,
+        targets: List[Dict[str, Any]],
+        secret_keys: Dict[str, str]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """포트원 환불 요청 (동시 요청 수 제한), 환불된 대상과 실패 내역 반환"""
+        semaphore = asyncio.Semaphore(settings.REFUND_CONCURRENCY)
+        
+        async def refund_one(target: Dict[str, Any]) -> Optional[str]:
+            if target.get("refunded"):
+                return None
+            
+            secret_key = secret_keys.get(target["store_id"])
+            if not secret_key:
+                return "가게의 결제 설정이 완료되지 않았습니다"
+            
+            async with semaphore:
+                try:
+                    refund_result = await PaymentService.process_refund(
+                        payment_id=target["payment_id"],
+                        secret_key=secret_key,
+                        reason=target["cancel_reason"]
+                    )
+                except Exception as e:
+                    return str(e)
+            
+            if not refund_result.get("success"):
+                return refund_result.get("error", "알 수 없는 오류")
+            return None
+        
+        errors = await asyncio.gather(*(refund_one(target) for target in targets))
+        
+        refunded, failures = [], []
+        for target, error in zip(targets, errors):
+            if error is None:
+                refunded.append(target)
+            else:
+                failures.append({**target, "error": error})
+                logger.error(f"[{target['store_name']}] 주문 {target['payment_id']} 환불 실패: {error}")
+        
+        return refunded, failures
+    
+    @classmethod
+    async def _send_cancel_emails(cls, targets: List[Dict[str, Any]]) -> None:
+        """취소 안내 이메일 전송 (동시 전송 수 제한)"""
+        if not targets or not email_service.is_configured():
+            return
+        
+        semaphore = asyncio.Semaphore(settings.REFUND_CONCURRENCY)
+        
+        async def send(target: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    await email_service.send_template(
+                        recipient_email=target["customer_id"],
+                        store_name=target["store_name"],
+                        template_type="seller_cancel"
+                    )
+                except Exception as e:
+                    logger.error(f"취소 안내 이메일 전송 실패 - 주문: {target['payment_id']}, Error: {str(e)}")
+        
+        await asyncio.gather(*(send(target) for target in targets))
@@ -8,6 +8,9 @@ store_operation_status_update_task : 가게 운영 상태 업데이트 / 4시 25
 store_auto_complete_order_task, AutoCancelReservationOrdersTask : 픽업 마감 시, 주문 취소 및 환불 스케줄링 등록 / 4시 30분
 store_auto_cancel_reservation_order_task, AutoCompleteOrdersTask : 가게 마감 시, 주문 승인 스케줄링 등록 / 4시 35분
 user_withdraw_process_task : 사용자 탈퇴 처리 스케줄링 / 4시 40분
+hot_stock_flush_task : hot 상품 재고 변화량 DB 반영 / 5초마다
+payment_timeout_sweep_task : 마감된 결제 재고 복구 / 5초마다
+refund_retry_task : 자동 환불 실패 재시도 / 30분마다
 """
 from .order_migration import scheduled_task as order_migration_task, OrderMigrationTask
 from .product_stock_update import scheduled_task as product_stock_update_task, ProductStockUpdateTask
@@ -18,6 +21,9 @@ from .store_operation_status_update import scheduled_task as store_operation_sta
 from .auto_complete_orders import scheduled_task as store_auto_complete_order_task, AutoCompleteOrdersTask
 from .auto_cancel_reservation_orders import scheduled_task as store_auto_cancel_reservation_order_task, AutoCancelReservationOrdersTask
 from .user_withdraw_process import scheduled_task as user_withdraw_process_task, UserWithdrawProcessTask
+from .hot_stock_flush import scheduled_task as hot_stock_flush_task, HotStockFlushTask
+from .payment_timeout_sweep import scheduled_task as payment_timeout_sweep_task, PaymentTimeoutSweepTask
+from .refund_retry import scheduled_task as refund_retry_task, RefundRetryTask
 
 __all__ = [
     'order_migration_task',
@@ -29,6 +35,9 @@ __all__ = [
     'store_auto_cancel_reservation_order_task',
     'user_withdraw_process_task',
     'product_stock_update_task',
+    'hot_stock_flush_task',
+    'payment_timeout_sweep_task',
+    'refund_retry_task',
     'OrderMigrationTask',
     'InventoryResetTask',
     'UncompletedOrderRefundTask',
@@ -37,5 +46,8 @@ __all__ = [
     'AutoCompleteOrdersTask',
     'AutoCancelReservationOrdersTask',
     'UserWithdrawProcessTask',
-    'ProductStockUpdateTask'
+    'ProductStockUpdateTask',
+    'HotStockFlushTask',
+    'PaymentTimeoutSweepTask',
+    'RefundRetryTask'
 ]
\ No newline at end of file
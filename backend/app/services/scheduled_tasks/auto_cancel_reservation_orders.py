@@ -1,17 +1,13 @@
 import logging
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone, timedelta, time
 from typing import Dict, Any, List
 from collections import defaultdict
 
 from database.session import get_session
 from repositories.order_current_item import OrderCurrentItemRepository
 from repositories.store_operation_info import StoreOperationInfoRepository
-from repositories.store_product_info import StoreProductInfoRepository, StockUpdateResult
-from repositories.store_payment_info import StorePaymentInfoRepository
 from schemas.order import OrderStatus
-from services.payment import PaymentService
-from services.email import email_service
-from config.settings import settings
+from services.refund_executor import RefundExecutor
 
 
 logger = logging.getLogger(__name__)
@@ -19,12 +15,14 @@ logger = logging.getLogger(__name__)
 # KST 타임존 설정
 KST = timezone(timedelta(hours=9))
 
+CANCEL_REASON = "‘조기 마감’ 으로 주문이 취소되었어요."
+
 
 class AutoCancelReservationOrdersTask:
     """픽업 마감 시간(pickup_end_time)에 reservation 상태 주문을 취소하고 환불하는 스케줄 작업"""
 
-    # 픽업 마감을 스케줄링 등록하기 위한 리스트
-    _registered_job_ids: List[str] = []
+    # 동적 스케줄 작업 ID 접두사 (영구 작업 저장소에서 이 접두사로 조회/삭제)
+    JOB_ID_PREFIX = "auto_cancel_refund_"
 
     @staticmethod
     async def cancel_and_refund_store_reservation_orders(store_id: str, store_name: str):
@@ -32,209 +30,205 @@ class AutoCancelReservationOrdersTask:
         logger.info(f"[{store_name}] 픽업 마감 - reservation 주문 자동 취소/환불 시작...")
         start_time = datetime.now(timezone.utc)
 
-        cancelled_count = 0
-        error_count = 0
-        total_refund_amount = 0
-
         try:
-            async with get_session() as session:
+            async with get_session(auto_commit=False) as session:
                 order_repo = OrderCurrentItemRepository(session)
-                product_repo = StoreProductInfoRepository(session)
-                payment_info_repo = StorePaymentInfoRepository(session)
-                
-                payment_info = await payment_info_repo.get_by_store_id(store_id)
-
-                if not payment_info or not payment_info.portone_secret_key:
-                    logger.error(f"[{store_name}] 결제 설정이 없어 환불 처리 불가")
-                    return
 
                 all_orders = await order_repo.get_store_current_orders_with_relations(store_id)
 
-                reservation_orders = [
-                    order for order in all_orders
+                targets = [
+                    RefundExecutor.build_target(order, cancel_reason=CANCEL_REASON, release_stock=True)
+                    for order in all_orders
                     if order.status == OrderStatus.reservation
                 ]
 
-                if not reservation_orders:
-                    logger.info(f"[{store_name}] 취소/환불 처리할 reservation 주문이 없습니다")
-                    return
-
-                # 각 주문을 취소하고 환불 처리
-                for order in reservation_orders:
-                    try:
-                        refund_result = await PaymentService.process_refund(
-                            payment_id=order.payment_id,
-                            secret_key=payment_info.portone_secret_key,
-                            reason="‘조기 마감’ 으로 주문이 취소되었어요."
-                        )
-
-                        if refund_result.get("success"):
-                            await order_repo.cancel_order(
-                                payment_id=order.payment_id,
-                                cancel_reason="‘조기 마감’ 으로 주문이 취소되었어요."
-                            )
-                            
-                            max_retries = settings.MAX_RETRY_LOCK
-                            for attempt in range(max_retries):
-                                result = await product_repo.adjust_purchased_stock(order.product_id, -order.quantity)
-                                
-                                if result == StockUpdateResult.SUCCESS:
-                                    break
-                                
-                                if attempt == max_retries - 1:
-                                    continue
-
-                            if email_service.is_configured():
-                                await email_service.send_template(
-                                    recipient_email=order.customer_id,
-                                    store_name=store_name,
-                                    template_type="seller_cancel"
-                                )
-                            
-                            cancelled_count += 1
-                            total_refund_amount += order.total_amount
-
-                            logger.info(
-                                f"[{store_name}] 주문 자동 취소/환불 완료 - "
-                                f"주문ID: {order.payment_id}, "
-                                f"고객: {order.customer_id}, "
-                                f"상품: {order.product.product_name}, "
-                                f"금액: {order.total_amount:,}원"
-                            )
-                        else:
-                            error_count += 1
-                            logger.error(
-                                f"[{store_name}] 주문 {order.payment_id} 환불 실패: "
-                                f"{refund_result.get('error', '알 수 없는 오류')}"
-                            )
-
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(
-                            f"[{store_name}] 주문 {order.payment_id} 취소/환불 처리 중 오류: {str(e)}"
-                        )
-
-                # 작업 완료 통계
-                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                logger.info(
-                    f"[{store_name}] 픽업 마감 주문 자동 취소/환불 처리 완료: "
-                    f"성공 {cancelled_count}건, 실패 {error_count}건, "
-                    f"총 환불 금액 {total_refund_amount:,}원 "
-                    f"(소요시간: {elapsed_time:.2f}초)"
-                )
+            if not targets:
+                logger.info(f"[{store_name}] 취소/환불 처리할 reservation 주문이 없습니다")
+                return
+
+            # 동시 환불 후 배치 단위로 주문 취소/재고 복구 반영
+            result = await RefundExecutor.refund(targets)
+
+            # 작업 완료 통계
+            elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            logger.info(
+                f"[{store_name}] 픽업 마감 주문 자동 취소/환불 처리 완료: "
+                f"성공 {result['refunded']}건, 실패 {result['failed']}건, "
+                f"총 환불 금액 {result['refund_amount']:,}원 "
+                f"(소요시간: {elapsed_time:.2f}초)"
+            )
 
         except Exception as e:
             logger.error(f"[{store_name}] 주문 자동 취소/환불 처리 중 오류 발생: {e}", exc_info=True)
 
     @staticmethod
-    async def register_daily_schedules(scheduler):
-        """매일 새벽 5시에 실행: 오늘의 모든 가게 픽업 마감 시간 스케줄 등록"""
-        logger.info("=== 픽업 마감 시간 동적 스케줄 등록 시작 ===")
+    async def cancel_and_refund_due_reservation_orders(pickup_end_minute: str, day_of_week: int):
+        """
+        픽업 마감 시각(분 단위)이 같은 모든 가게의 reservation 주문을 한 번에 취소/환불
+
+        대상 주문은 한 번의 쿼리로 조회하고, 환불은 RefundExecutor가 동시 요청 수를 제한해 처리
+        """
+        logger.info(f"[{pickup_end_minute}] 픽업 마감 - reservation 주문 자동 취소/환불 시작...")
         start_time = datetime.now(timezone.utc)
 
         try:
-            AutoCancelReservationOrdersTask._remove_existing_jobs(scheduler)
-
             async with get_session(auto_commit=False) as session:
-                operation_repo = StoreOperationInfoRepository(session)
-
-                now_kst = datetime.now(KST)
-                today_day_of_week = now_kst.weekday()
-
-                logger.info(
-                    f"KST 기준 - 현재: {now_kst.strftime('%Y-%m-%d %H:%M:%S')}, "
-                    f"오늘 요일: {today_day_of_week}"
-                )   
-                
-                all_operations = await operation_repo.get_many(
-                    filters={
-                        "day_of_week": today_day_of_week,
-                        "is_open_enabled": True
-                    },
-                    load_relations=["store"]
+                order_repo = OrderCurrentItemRepository(session)
+
+                due_orders = await order_repo.get_due_store_orders(
+                    day_of_week, "pickup_end_time", time.fromisoformat(pickup_end_minute), [OrderStatus.reservation]
                 )
 
-                if not all_operations:
-                    logger.info("오늘 운영하는 가게가 없습니다")
-                    return
+                targets = [
+                    RefundExecutor.build_target(order, cancel_reason=CANCEL_REASON, release_stock=True)
+                    for order in due_orders
+                ]
 
-                stores_by_pickup_end_time = defaultdict(list)
-                for operation in all_operations:
-                    pickup_end_time_key = operation.pickup_end_time.strftime("%H:%M")
-                    stores_by_pickup_end_time[pickup_end_time_key].append(operation)
+            if not targets:
+                logger.info(f"[{pickup_end_minute}] 취소/환불 처리할 reservation 주문이 없습니다")
+                return
 
-                logger.info(
-                    f"총 {len(all_operations)}개 가게, "
-                    f"{len(stores_by_pickup_end_time)}개의 서로 다른 픽업 마감 시간"
-                )
+            result = await RefundExecutor.refund(targets)
 
-                registered_count = 0
-                for pickup_end_time_str, operations in stores_by_pickup_end_time.items():
-                    for operation in operations:
-                        try:
-                            job_id = f"auto_cancel_refund_{operation.store_id}_{today_day_of_week}"
-
-                            run_datetime = datetime.combine(
-                                now_kst.date(),
-                                operation.pickup_end_time
-                            ).replace(tzinfo=KST)
-
-                            if run_datetime <= now_kst:
-                                logger.debug(
-                                    f"[{operation.store.store_name}] 픽업 마감 시간({pickup_end_time_str})이 "
-                                    f"이미 지나 스케줄 등록 생략"
-                                )
-                                continue
-
-                            store_name = operation.store.store_name
-                            scheduler.scheduler.add_job(
-                                func=AutoCancelReservationOrdersTask.cancel_and_refund_store_reservation_orders,
-                                trigger='date',
-                                run_date=run_datetime,
-                                id=job_id,
-                                name=f"[{store_name}] 픽업 마감 시 주문 자동 취소/환불",
-                                misfire_grace_time=1800,
-                                replace_existing=True,
-                                args=[operation.store_id, store_name],
-                            )
-
-                            AutoCancelReservationOrdersTask._registered_job_ids.append(job_id)
-                            registered_count += 1
-
-                            logger.info(
-                                f"[{operation.store.store_name}] 스케줄 등록 완료 - "
-                                f"픽업 마감: {pickup_end_time_str}, "
-                                f"실행예정: {run_datetime.strftime('%Y-%m-%d %H:%M:%S KST')}"
-                            )
-
-                        except Exception as e:
-                            logger.error(
-                                f"[{operation.store.store_name}] 스케줄 등록 실패: {str(e)}",
-                                exc_info=True
-                            )
-
-                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                logger.info(
-                    f"=== 픽업 마감 동적 스케줄 등록 완료: {registered_count}개 작업 등록됨 "
-                    f"(소요시간: {elapsed_time:.2f}초) ==="
-                )
+            elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            logger.info(
+                f"[{pickup_end_minute}] 픽업 마감 주문 자동 취소/환불 처리 완료: "
+                f"{len({target['store_id'] for target in targets})}개 가게, "
+                f"성공 {result['refunded']}건, 실패 {result['failed']}건, "
+                f"총 환불 금액 {result['refund_amount']:,}원 "
+                f"(소요시간: {elapsed_time:.2f}초)"
+            )
+
+        except Exception as e:
+            logger.error(f"[{pickup_end_minute}] 주문 자동 취소/환불 처리 중 오류 발생: {e}", exc_info=True)
+
+    @staticmethod
+    async def register_daily_schedules():
+        """매일 새벽 실행: 오늘의 픽업 마감 시각(분 단위)마다 스케줄 하나씩 등록"""
+        logger.info("=== 픽업 마감 시간 동적 스케줄 등록 시작 ===")
+        start_time = datetime.now(timezone.utc)
+
+        try:
+            # 순환 import 방지 (scheduler가 이 모듈을 import)
+            from services.scheduler import scheduler
+
+            # 기존에 등록된 스케줄링 작업들 삭제 (시간이 바뀔 수도 있어서)
+            await AutoCancelReservationOrdersTask._remove_existing_jobs(scheduler)
+
+            now_kst = datetime.now(KST)
+            today_day_of_week = now_kst.weekday()
+
+            logger.info(
+                f"KST 기준 - 현재: {now_kst.strftime('%Y-%m-%d %H:%M:%S')}, "
+                f"오늘 요일: {today_day_of_week}"
+            )
+
+            store_counts_by_minute = await AutoCancelReservationOrdersTask._count_stores_by_minute(today_day_of_week)
+
+            if not store_counts_by_minute:
+                logger.info("오늘 운영하는 가게가 없습니다")
+                return
+
+            logger.info(
+                f"총 {sum(store_counts_by_minute.values())}개 가게, "
+                f"{len(store_counts_by_minute)}개의 서로 다른 픽업 마감 시간"
+            )
+
+            # 같은 분에 마감되는 가게들은 작업 하나로 처리
+            registered_count = 0
+            for minute_str, store_count in sorted(store_counts_by_minute.items()):
+                try:
+                    if await AutoCancelReservationOrdersTask._add_minute_job(
+                        scheduler, now_kst, today_day_of_week, minute_str, store_count
+                    ):
+                        registered_count += 1
+
+                except Exception as e:
+                    logger.error(f"[{minute_str}] 스케줄 등록 실패: {str(e)}", exc_info=True)
+
+            elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            logger.info(
+                f"=== 픽업 마감 동적 스케줄 등록 완료: {registered_count}개 작업 등록됨 "
+                f"(소요시간: {elapsed_time:.2f}초) ==="
+            )
 
         except Exception as e:
             logger.error(f"동적 스케줄 등록 중 오류 발생: {e}", exc_info=True)
 
     @staticmethod
-    def _remove_existing_jobs(scheduler):
-        """기존에 등록된 동적 작업들 삭제"""
-        removed_count = 0
-        for job_id in AutoCancelReservationOrdersTask._registered_job_ids:
+    async def reschedule_minutes(day_of_week: int, minutes: List[time]):
+        """
+        운영 시간이 바뀐 가게의 픽업 마감 시각(분 단위) 작업을 다시 등록 (이미 등록된 작업은 교체)
+
+        오늘 요일이 아니면 다음 새벽 등록 작업에서 반영되므로 생략
+        """
+        now_kst = datetime.now(KST)
+        if not minutes or day_of_week != now_kst.weekday():
+            return
+
+        # 순환 import 방지 (scheduler가 이 모듈을 import)
+        from services.scheduler import scheduler
+
+        store_counts_by_minute = await AutoCancelReservationOrdersTask._count_stores_by_minute(day_of_week)
+
+        for minute_str in sorted({minute.strftime("%H:%M") for minute in minutes}):
+            store_count = store_counts_by_minute.get(minute_str)
+            if not store_count:
+                continue
+
             try:
-                scheduler.scheduler.remove_job(job_id)
-                removed_count += 1
-            except Exception:
-                # 작업이 이미 실행되었거나 없는 경우 무시
-                pass
+                await AutoCancelReservationOrdersTask._add_minute_job(scheduler, now_kst, day_of_week, minute_str, store_count)
+            except Exception as e:
+                logger.error(f"[{minute_str}] 스케줄 재등록 실패: {str(e)}", exc_info=True)
 
-        AutoCancelReservationOrdersTask._registered_job_ids.clear()
+    @staticmethod
+    async def _count_stores_by_minute(day_of_week: int) -> Dict[str, int]:
+        """요일의 운영 가게 수를 픽업 마감 시각(HH:MM)별로 집계"""
+        async with get_session(auto_commit=False) as session:
+            operation_repo = StoreOperationInfoRepository(session)
+            store_counts = await operation_repo.count_open_stores_by_time(day_of_week, "pickup_end_time")
+
+        store_counts_by_minute = defaultdict(int)
+        for pickup_end_time, store_count in store_counts.items():
+            store_counts_by_minute[pickup_end_time.strftime("%H:%M")] += store_count
+        return store_counts_by_minute
+
+    @staticmethod
+    async def _add_minute_job(scheduler, now_kst: datetime, day_of_week: int, minute_str: str, store_count: int) -> bool:
+        """픽업 마감 시각(HH:MM) 작업 등록, 시각이 이미 지났으면 등록하지 않고 False 반환"""
+        job_id = f"{AutoCancelReservationOrdersTask.JOB_ID_PREFIX}{minute_str.replace(':', '')}_{day_of_week}"
+
+        run_datetime = datetime.combine(
+            now_kst.date(),
+            time.fromisoformat(minute_str)
+        ).replace(tzinfo=KST)
+
+        if run_datetime <= now_kst:
+            logger.debug(f"[{minute_str}] 픽업 마감 시간이 이미 지나 스케줄 등록 생략")
+            return False
+
+        await scheduler.add_persistent_job(
+            func=AutoCancelReservationOrdersTask.cancel_and_refund_due_reservation_orders,
+            trigger='date',
+            run_date=run_datetime,
+            id=job_id,
+            name=f"[{minute_str}] 픽업 마감 시 주문 자동 취소/환불 ({store_count}개 가게)",
+            misfire_grace_time=1800,
+            replace_existing=True,
+            args=[minute_str, day_of_week],
+        )
+
+        logger.info(
+            f"[{minute_str}] 스케줄 등록 완료 - 가게 {store_count}개, "
+            f"실행예정: {run_datetime.strftime('%Y-%m-%d %H:%M:%S KST')}"
+        )
+
+        return True
+
+    @staticmethod
+    async def _remove_existing_jobs(scheduler):
+        """작업 저장소에 남아있는 기존 동적 작업들 삭제"""
+        removed_count = await scheduler.remove_persistent_jobs(AutoCancelReservationOrdersTask.JOB_ID_PREFIX)
 
         if removed_count > 0:
             logger.info(f"기존 픽업 마감 동적 스케줄 {removed_count}개 삭제됨")
@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone, timedelta, time
 from typing import Dict, Any, List
 from collections import defaultdict
 
@@ -7,6 +7,8 @@ from database.session import get_session
 from repositories.order_current_item import OrderCurrentItemRepository
 from repositories.store_operation_info import StoreOperationInfoRepository
 from schemas.order import OrderStatus
+from services.order_event import publish_order_event
+from utils.store_utils import convert_order_to_response
 
 
 logger = logging.getLogger(__name__)
@@ -18,8 +20,11 @@ KST = timezone(timedelta(hours=9))
 class AutoCompleteOrdersTask:
     """가게 마감 시간(close_time)에 accept 상태 주문을 complete로 자동 변경하는 스케줄 작업"""
 
-    # 가게 마감을 스케줄링 등록하기 위한 리스트
-    _registered_job_ids: List[str] = []
+    # 동적 스케줄 작업 ID 접두사 (영구 작업 저장소에서 이 접두사로 조회/삭제)
+    JOB_ID_PREFIX = "auto_complete_"
+
+    # 한 문장으로 완료 처리하는 주문 수
+    COMPLETE_BATCH_SIZE = 500
 
     @staticmethod
     async def complete_store_accepted_orders(store_id: str, store_name: str):
@@ -47,9 +52,14 @@ class AutoCompleteOrdersTask:
 
                 for order in accepted_orders:
                     try:
-                        await order_repo.complete_order(order.payment_id)
+                        completed_order = await order_repo.complete_order(order.payment_id)
+                        if not completed_order:
+                            continue
                         completed_count += 1
 
+                        # 가게 주문 채널로 완료 이벤트 발행 (커밋 후)
+                        publish_order_event(session, convert_order_to_response(completed_order))
+
                         logger.info(
                             f"[{store_name}] 주문 자동 완료 - "
                             f"주문ID: {order.payment_id}, "
@@ -73,117 +83,180 @@ class AutoCompleteOrdersTask:
             logger.error(f"[{store_name}] 주문 자동 완료 처리 중 오류 발생: {e}", exc_info=True)
 
     @staticmethod
-    async def register_daily_schedules(scheduler):
-        """매일 새벽 5시에 실행: 오늘의 모든 가게 마감 시간 스케줄 등록"""
-        logger.info("=== 가게 마감 시간 동적 스케줄 등록 시작 ===")
+    async def complete_due_accepted_orders(close_minute: str, day_of_week: int):
+        """
+        마감 시각(분 단위)이 같은 모든 가게의 accept 주문을 한 번에 complete로 변경
+
+        대상 주문은 한 번의 쿼리로 조회하고, COMPLETE_BATCH_SIZE건씩 한 문장으로 완료 처리
+        """
+        logger.info(f"[{close_minute}] 가게 마감 - accept 주문 자동 완료 시작...")
         start_time = datetime.now(timezone.utc)
 
         try:
-            # 기존에 등록된 스케줄링 작업들 삭제 (시간이 바뀔 수도 있어서)
-            AutoCompleteOrdersTask._remove_existing_jobs(scheduler)
-
-            async with get_session(auto_commit=False) as session:
-                operation_repo = StoreOperationInfoRepository(session)
-
-                now_kst = datetime.now(KST)
-                today_day_of_week = now_kst.weekday()
+            async with get_session() as session:
+                order_repo = OrderCurrentItemRepository(session)
 
-                logger.info(
-                    f"KST 기준 - 현재: {now_kst.strftime('%Y-%m-%d %H:%M:%S')}, "
-                    f"오늘 요일: {today_day_of_week}"
-                )
-      
-                all_operations = await operation_repo.get_many(
-                    filters={
-                        "day_of_week": today_day_of_week,
-                        "is_open_enabled": True
-                    },
-                    load_relations=["store"]
+                due_orders = await order_repo.get_due_store_orders(
+                    day_of_week, "close_time", time.fromisoformat(close_minute), [OrderStatus.accept]
                 )
 
-                if not all_operations:
-                    logger.info("오늘 운영하는 가게가 없습니다")
+                if not due_orders:
+                    logger.info(f"[{close_minute}] 완료 처리할 accept 주문이 없습니다")
                     return
 
-                # 가게 마감 시간 별로 가게 그룹화
-                stores_by_close_time = defaultdict(list)
-                for operation in all_operations:
-                    close_time_key = operation.close_time.strftime("%H:%M")
-                    stores_by_close_time[close_time_key].append(operation)
-
-                logger.info(f"총 {len(all_operations)}개 가게, {len(stores_by_close_time)}개의 서로 다른 마감 시간")
-
-                # 각 마감 시간별로 스케줄 등록
-                registered_count = 0
-                for close_time_str, operations in stores_by_close_time.items():
-                    for operation in operations:
-                        try:
-                            job_id = f"auto_complete_{operation.store_id}_{today_day_of_week}"
-
-                            # 오늘 날짜 + close_time으로 정확한 실행 시간 계산
-                            run_datetime = datetime.combine(
-                                now_kst.date(),
-                                operation.close_time
-                            ).replace(tzinfo=KST)
-
-                            # 이미 지난 시간이면 등록하지 않음
-                            if run_datetime <= now_kst:
-                                logger.debug(
-                                    f"[{operation.store.store_name}] 마감 시간({close_time_str})이 "
-                                    f"이미 지나 스케줄 등록 생략"
-                                )
-                                continue
-
-                            store_name = operation.store.store_name
-                            
-                            scheduler.scheduler.add_job(
-                                func=AutoCompleteOrdersTask.complete_store_accepted_orders,
-                                trigger='date',
-                                run_date=run_datetime,
-                                id=job_id,
-                                name=f"[{store_name}] 마감 시 주문 자동 완료",
-                                misfire_grace_time=1800,
-                                replace_existing=True,
-                                args=[operation.store_id, store_name],
-                            )
-
-                            AutoCompleteOrdersTask._registered_job_ids.append(job_id)
-                            registered_count += 1
-
-                            logger.info(
-                                f"[{operation.store.store_name}] 스케줄 등록 완료 - "
-                                f"마감시간: {close_time_str}, "
-                                f"실행예정: {run_datetime.strftime('%Y-%m-%d %H:%M:%S KST')}"
-                            )
-
-                        except Exception as e:
-                            logger.error(
-                                f"[{operation.store.store_name}] 스케줄 등록 실패: {str(e)}",
-                                exc_info=True
-                            )
+                completed_count = 0
+                batch_size = AutoCompleteOrdersTask.COMPLETE_BATCH_SIZE
+                for start in range(0, len(due_orders), batch_size):
+                    completed_rows = await order_repo.complete_orders(
+                        [order.payment_id for order in due_orders[start:start + batch_size]]
+                    )
+                    completed_count += len(completed_rows)
+
+                    # 가게 주문 채널로 완료 이벤트 발행 (커밋 후)
+                    completed_orders = await order_repo.get_orders_with_store_relation(
+                        [row.payment_id for row in completed_rows]
+                    )
+                    for order in completed_orders:
+                        publish_order_event(session, convert_order_to_response(order))
 
                 elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
                 logger.info(
-                    f"=== 동적 스케줄 등록 완료: {registered_count}개 작업 등록됨 "
-                    f"(소요시간: {elapsed_time:.2f}초) ==="
+                    f"[{close_minute}] 가게 마감 주문 자동 완료 처리 완료: "
+                    f"{len({order.product.store_id for order in due_orders})}개 가게, "
+                    f"성공 {completed_count}건, 생략 {len(due_orders) - completed_count}건 "
+                    f"(소요시간: {elapsed_time:.2f}초)"
                 )
 
+        except Exception as e:
+            logger.error(f"[{close_minute}] 주문 자동 완료 처리 중 오류 발생: {e}", exc_info=True)
+
+    @staticmethod
+    async def register_daily_schedules():
+        """매일 새벽 실행: 오늘의 가게 마감 시각(분 단위)마다 스케줄 하나씩 등록"""
+        logger.info("=== 가게 마감 시간 동적 스케줄 등록 시작 ===")
+        start_time = datetime.now(timezone.utc)
+
+        try:
+            # 순환 import 방지 (scheduler가 이 모듈을 import)
+            from services.scheduler import scheduler
+
+            # 기존에 등록된 스케줄링 작업들 삭제 (시간이 바뀔 수도 있어서)
+            await AutoCompleteOrdersTask._remove_existing_jobs(scheduler)
+
+            now_kst = datetime.now(KST)
+            today_day_of_week = now_kst.weekday()
+
+            logger.info(
+                f"KST 기준 - 현재: {now_kst.strftime('%Y-%m-%d %H:%M:%S')}, "
+                f"오늘 요일: {today_day_of_week}"
+            )
+
+            store_counts_by_minute = await AutoCompleteOrdersTask._count_stores_by_minute(today_day_of_week)
+
+            if not store_counts_by_minute:
+                logger.info("오늘 운영하는 가게가 없습니다")
+                return
+
+            logger.info(
+                f"총 {sum(store_counts_by_minute.values())}개 가게, "
+                f"{len(store_counts_by_minute)}개의 서로 다른 가게 마감 시간"
+            )
+
+            # 같은 분에 마감되는 가게들은 작업 하나로 처리
+            registered_count = 0
+            for minute_str, store_count in sorted(store_counts_by_minute.items()):
+                try:
+                    if await AutoCompleteOrdersTask._add_minute_job(
+                        scheduler, now_kst, today_day_of_week, minute_str, store_count
+                    ):
+                        registered_count += 1
+
+                except Exception as e:
+                    logger.error(f"[{minute_str}] 스케줄 등록 실패: {str(e)}", exc_info=True)
+
+            elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            logger.info(
+                f"=== 동적 스케줄 등록 완료: {registered_count}개 작업 등록됨 "
+                f"(소요시간: {elapsed_time:.2f}초) ==="
+            )
+
         except Exception as e:
             logger.error(f"동적 스케줄 등록 중 오류 발생: {e}", exc_info=True)
 
     @staticmethod
-    def _remove_existing_jobs(scheduler):
-        """기존에 등록된 동적 작업들 삭제"""
-        removed_count = 0
-        for job_id in AutoCompleteOrdersTask._registered_job_ids:
+    async def reschedule_minutes(day_of_week: int, minutes: List[time]):
+        """
+        운영 시간이 바뀐 가게의 가게 마감 시각(분 단위) 작업을 다시 등록 (이미 등록된 작업은 교체)
+
+        오늘 요일이 아니면 다음 새벽 등록 작업에서 반영되므로 생략
+        """
+        now_kst = datetime.now(KST)
+        if not minutes or day_of_week != now_kst.weekday():
+            return
+
+        # 순환 import 방지 (scheduler가 이 모듈을 import)
+        from services.scheduler import scheduler
+
+        store_counts_by_minute = await AutoCompleteOrdersTask._count_stores_by_minute(day_of_week)
+
+        for minute_str in sorted({minute.strftime("%H:%M") for minute in minutes}):
+            store_count = store_counts_by_minute.get(minute_str)
+            if not store_count:
+                continue
+
             try:
-                scheduler.scheduler.remove_job(job_id)
-                removed_count += 1
-            except Exception:
-                # 작업이 이미 실행되었거나 없는 경우 무시
-                pass
+                await AutoCompleteOrdersTask._add_minute_job(scheduler, now_kst, day_of_week, minute_str, store_count)
+            except Exception as e:
+                logger.error(f"[{minute_str}] 스케줄 재등록 실패: {str(e)}", exc_info=True)
+
+    @staticmethod
+    async def _count_stores_by_minute(day_of_week: int) -> Dict[str, int]:
+        """요일의 운영 가게 수를 가게 마감 시각(HH:MM)별로 집계"""
+        async with get_session(auto_commit=False) as session:
+            operation_repo = StoreOperationInfoRepository(session)
+            store_counts = await operation_repo.count_open_stores_by_time(day_of_week, "close_time")
+
+        store_counts_by_minute = defaultdict(int)
+        for close_time, store_count in store_counts.items():
+            store_counts_by_minute[close_time.strftime("%H:%M")] += store_count
+        return store_counts_by_minute
 
-        AutoCompleteOrdersTask._registered_job_ids.clear()
+    @staticmethod
+    async def _add_minute_job(scheduler, now_kst: datetime, day_of_week: int, minute_str: str, store_count: int) -> bool:
+        """가게 마감 시각(HH:MM) 작업 등록, 시각이 이미 지났으면 등록하지 않고 False 반환"""
+        job_id = f"{AutoCompleteOrdersTask.JOB_ID_PREFIX}{minute_str.replace(':', '')}_{day_of_week}"
+
+        run_datetime = datetime.combine(
+            now_kst.date(),
+            time.fromisoformat(minute_str)
+        ).replace(tzinfo=KST)
+
+        if run_datetime <= now_kst:
+            logger.debug(f"[{minute_str}] 마감 시간이 이미 지나 스케줄 등록 생략")
+            return False
+
+        await scheduler.add_persistent_job(
+            func=AutoCompleteOrdersTask.complete_due_accepted_orders,
+            trigger='date',
+            run_date=run_datetime,
+            id=job_id,
+            name=f"[{minute_str}] 마감 시 주문 자동 완료 ({store_count}개 가게)",
+            misfire_grace_time=1800,
+            replace_existing=True,
+            args=[minute_str, day_of_week],
+        )
+
+        logger.info(
+            f"[{minute_str}] 스케줄 등록 완료 - 가게 {store_count}개, "
+            f"실행예정: {run_datetime.strftime('%Y-%m-%d %H:%M:%S KST')}"
+        )
+
+        return True
+
+    @staticmethod
+    async def _remove_existing_jobs(scheduler):
+        """작업 저장소에 남아있는 기존 동적 작업들 삭제"""
+        removed_count = await scheduler.remove_persistent_jobs(AutoCompleteOrdersTask.JOB_ID_PREFIX)
 
         if removed_count > 0:
             logger.info(f"기존 동적 스케줄 {removed_count}개 삭제됨")
@@ -0,0 +1,44 @@
+import logging
+from datetime import datetime, timezone
+
+from services.hot_stock import HotStockService
+
+
+logger = logging.getLogger(__name__)
+
+
+class HotStockFlushTask:
+    """hot 상품 재고 변화량을 DB에 반영하는 스케줄 작업"""
+    
+    @staticmethod
+    async def flush_hot_stock():
+        """Redis 재고 카운터의 구매 수량 변화량을 DB에 일괄 반영하고 hot 모드 설정을 동기화"""
+        start_time = datetime.now(timezone.utc)
+        
+        try:
+            flushed_count = await HotStockService.flush_pending()
+            await HotStockService.sync_hot_products()
+            
+            if flushed_count > 0:
+                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+                logger.info(
+                    f"hot 상품 재고 반영 완료: "
+                    f"{flushed_count}개 상품 "
+                    f"(소요시간: {elapsed_time:.2f}초)"
+                )
+        
+        except Exception as e:
+            logger.error(f"hot 상품 재고 반영 중 오류 발생: {e}", exc_info=True)
+
+
+# 스케줄러에 등록할 태스크 정의
+scheduled_task = {
+    "func": HotStockFlushTask.flush_hot_stock,
+    "trigger": "interval",
+    "trigger_args": {
+        "seconds": 5,
+    },
+    "job_id": "flush_hot_stock",
+    "job_name": "hot 상품 재고 DB 반영",
+    "misfire_grace_time": 5,
+}
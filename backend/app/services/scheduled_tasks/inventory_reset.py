@@ -5,6 +5,8 @@ from typing import Dict, Any
 from sqlalchemy import update
 from database.session import get_session
 from database.models.store_product_info import StoreProductInfo
+from services.store_card import mark_all_store_cards_dirty
+from services.hot_stock import HotStockService
 
 
 logger = logging.getLogger(__name__)
@@ -31,8 +33,12 @@ class InventoryResetTask:
                 
                 result = await session.execute(stmt)
                 updated_count = result.rowcount
+                mark_all_store_cards_dirty(session)
                 await session.commit()
                 
+                # hot 상품 Redis 재고 카운터를 초기화된 재고로 맞춤
+                await HotStockService.reset_counters(session)
+                
                 elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
                 logger.info(
                     f"재고 초기화 완료: "
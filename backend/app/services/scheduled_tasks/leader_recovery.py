@@ -0,0 +1,53 @@
+import logging
+
+from services.cart_recovery import CartRecoveryService
+from services.hot_stock import HotStockService
+from repositories.settlement_daily import SettlementDailyRepository
+from repositories.order_history_item import OrderHistoryItemRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderRecoveryTask:
+    """리더가 된 워커에서 한 번 실행하는 복구 작업 (서버 시작/리더 변경 시)"""
+    
+    @staticmethod
+    async def recover():
+        """hot 상품 재고 카운터, 일별 정산 집계, 장바구니 재고 복구 대기열 복구"""
+        try:
+            await HotStockService.recover_on_startup()
+            logger.info("hot 상품 재고 카운터 복구 완료")
+        except Exception as e:
+            logger.error(f"hot 상품 재고 카운터 복구 중 오류 발생: {e}", exc_info=True)
+        
+        try:
+            # 정산 날짜 저장 이전에 이동된 주문도 날짜별 집계 재계산에 포함되도록 먼저 기록
+            backfilled_orders = await OrderHistoryItemRepository().backfill_settlement_dates()
+            if backfilled_orders > 0:
+                logger.info(f"주문 히스토리 정산 날짜 기록 완료: {backfilled_orders}개")
+            
+            rebuilt_rollups = await SettlementDailyRepository().rebuild_if_empty()
+            if rebuilt_rollups > 0:
+                logger.info(f"일별 정산 집계 생성 완료: {rebuilt_rollups}개")
+        except Exception as e:
+            logger.error(f"일별 정산 집계 생성 중 오류 발생: {e}", exc_info=True)
+        
+        try:
+            recovered_carts = await CartRecoveryService.recover_abandoned_carts()
+            if recovered_carts > 0:
+                logger.info(f"장바구니 재고 복구 대기열 등록 완료: {recovered_carts}개 아이템")
+            else:
+                logger.info("복구할 장바구니 아이템이 없습니다")
+        except Exception as e:
+            logger.error(f"장바구니 재고 복구 중 오류 발생: {e}", exc_info=True)
+
+
+# 스케줄러에 등록할 태스크 정의 (리더가 되면 바로 한 번 실행)
+scheduled_task = {
+    "func": LeaderRecoveryTask.recover,
+    "trigger": "date",
+    "job_id": "leader_recovery",
+    "job_name": "리더 시작 복구 작업",
+    "misfire_grace_time": 600,
+}
@@ -7,6 +7,9 @@ from sqlalchemy.orm import selectinload
 from database.session import get_session
 from database.models.store_operation_info import StoreOperationInfo
 from database.models.store_operation_info_modification import StoreOperationInfoModification
+from services.store_card import mark_store_cards_dirty
+from services.scheduled_tasks.auto_cancel_reservation_orders import AutoCancelReservationOrdersTask
+from services.scheduled_tasks.auto_complete_orders import AutoCompleteOrdersTask
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +30,11 @@ class OperationModificationApplyTask:
         applied_count = 0
         error_count = 0
         
+        # 오늘 요일 운영 정보가 바뀐 가게의 픽업 마감/가게 마감 시각 (동적 스케줄 재등록용)
+        today_day_of_week = datetime.now(KST).weekday()
+        pickup_end_times = []
+        close_times = []
+        
         try:
             async with get_session() as session:
                 query = (
@@ -70,6 +78,16 @@ class OperationModificationApplyTask:
                             await session.execute(stmt)
                             
                             if modification.operation_info:
+                                mark_store_cards_dirty(session, modification.operation_info.store_id)
+                                
+                                if modification.operation_info.day_of_week == today_day_of_week:
+                                    pickup_end_times.append(
+                                        update_values.get('pickup_end_time', modification.operation_info.pickup_end_time)
+                                    )
+                                    close_times.append(
+                                        update_values.get('close_time', modification.operation_info.close_time)
+                                    )
+                                
                                 logger.info(
                                     f"운영 정보 변경 적용 완료 - "
                                     f"가게ID: {modification.operation_info.store_id}, "
@@ -108,6 +126,10 @@ class OperationModificationApplyTask:
                 OperationModificationApplyTask._log_apply_statistics(
                     total_count, applied_count, error_count
                 )
+            
+            # 새벽 등록 작업 이후에 적용된 경우에도 바뀐 시각의 작업이 실행되도록 다시 등록
+            await AutoCancelReservationOrdersTask.reschedule_minutes(today_day_of_week, pickup_end_times)
+            await AutoCompleteOrdersTask.reschedule_minutes(today_day_of_week, close_times)
                 
         except Exception as e:
             logger.error(f"가게 운영 정보 변경 예약 적용 중 오류 발생: {e}", exc_info=True)
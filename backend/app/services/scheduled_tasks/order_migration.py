@@ -1,17 +1,56 @@
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import Dict, Any
 
 from database.session import get_session
+from repositories.migration_checkpoint import MigrationCheckpointRepository
 from repositories.order_current_item import OrderCurrentItemRepository
 from repositories.order_history_item import OrderHistoryItemRepository
+from repositories.settlement_daily import SettlementDailyRepository, get_settlement_date
+from repositories.store_product_daily_stat import StoreProductDailyStatRepository
 
 
 logger = logging.getLogger(__name__)
 
 
 class OrderMigrationTask:
-    """주문 데이터를 현재 테이블에서 히스토리 테이블로 마이그레이션하는 스케줄 작업"""
+    """주문 데이터를 현재 테이블에서 히스토리 테이블로 마이그레이션하는 스케줄 작업
+    
+    결제 ID 순으로 BATCH_SIZE개씩 읽어 히스토리에 upsert한 뒤 같은 청크를 삭제하고,
+    청크마다 체크포인트를 기록하므로 중간에 중단되어도 다음 실행에서 중복 없이 이어서 처리함
+    """
+    
+    JOB_NAME = "order_migration"
+    BATCH_SIZE = 500
+    
+    @staticmethod
+    def _to_history_data(order) -> Dict[str, Any]:
+        """당일 주문(product.store, customer.detail 관계 포함)을 히스토리 데이터로 변환"""
+        return {
+            "payment_id": order.payment_id,
+            "customer_id": order.customer_id,
+            "customer_nickname": order.customer.detail.nickname,
+            "customer_phone_number": order.customer.detail.phone_number,
+            "product_id": order.product_id,
+            "product_name": order.product.product_name,
+            "store_id": order.product.store_id,
+            "store_name": order.product.store.store_name,
+            "quantity": order.quantity,
+            "price": order.price,
+            "sale": order.sale,
+            "total_amount": order.total_amount,
+            "status": order.status.value if hasattr(order.status, 'value') else str(order.status),
+            "reservation_at": order.reservation_at,
+            "accepted_at": order.accepted_at,
+            "completed_at": order.completed_at,
+            "canceled_at": order.canceled_at,
+            "cancel_reason": order.cancel_reason,
+            "preferred_menus": order.preferred_menus,
+            "nutrition_types": order.nutrition_types,
+            "allergies": order.allergies,
+            "topping_types": order.topping_types
+        }
     
     @staticmethod
     async def migrate_current_orders_to_history():
@@ -20,84 +59,81 @@ class OrderMigrationTask:
         start_time = datetime.now(timezone.utc)
         
         try:
-            async with get_session() as session:
-                current_order_repo = OrderCurrentItemRepository(session)
-                history_order_repo = OrderHistoryItemRepository()
-                
-                # 먼저 관계 정보를 포함하여 모든 주문을 조회
-                all_current_orders = await current_order_repo.get_all_orders_with_relations()
-                
-                if not all_current_orders:
-                    logger.info("마이그레이션할 주문이 없습니다")
-                    return
-                
-                orders_data = []
-                for order in all_current_orders:
-                    order_dict = {
-                        "payment_id": order.payment_id,
-                        "customer_id": order.customer_id,
-                        "customer_nickname": order.customer.detail.nickname,
-                        "customer_phone_number": order.customer.detail.phone_number,
-                        "product_id": order.product_id,
-                        "product_name": order.product.product_name,
-                        "store_id": order.product.store_id,
-                        "store_name": order.product.store.store_name,
-                        "quantity": order.quantity,
-                        "price": order.price,
-                        "sale": order.sale,
-                        "total_amount": order.total_amount,
-                        "status": order.status.value if hasattr(order.status, 'value') else str(order.status),
-                        "reservation_at": order.reservation_at,
-                        "accepted_at": order.accepted_at,
-                        "completed_at": order.completed_at,
-                        "canceled_at": order.canceled_at,
-                        "cancel_reason": order.cancel_reason,
-                        "preferred_menus": order.preferred_menus,
-                        "nutrition_types": order.nutrition_types,
-                        "allergies": order.allergies,
-                        "topping_types": order.topping_types
-                    }
-                    orders_data.append(order_dict)
+            checkpoint_repo = MigrationCheckpointRepository()
+            history_order_repo = OrderHistoryItemRepository()
+            
+            checkpoint = await checkpoint_repo.start_or_resume(OrderMigrationTask.JOB_NAME)
+            last_payment_id = checkpoint.last_payment_id
+            settlement_dates = set(checkpoint.settlement_dates)
+            
+            if last_payment_id:
+                logger.info(f"중단된 주문 마이그레이션 이어서 처리 - 마지막 결제 ID: {last_payment_id}")
+            
+            archived_count = 0
+            status_counts: Dict[str, int] = defaultdict(int)
+            total_revenue = 0
+            
+            while True:
+                async with get_session(auto_commit=False) as session:
+                    orders = await OrderCurrentItemRepository(session).get_migration_batch(
+                        last_payment_id, OrderMigrationTask.BATCH_SIZE
+                    )
+                    orders_data = [OrderMigrationTask._to_history_data(order) for order in orders]
                 
-                # 데이터 저장 후 삭제
-                archived_count = await history_order_repo.bulk_archive_orders(orders_data)
+                if not orders_data:
+                    break
                 
-                # 저장이 성공한 후에만 삭제
-                await current_order_repo.delete_all_items()
+                # 히스토리에 먼저 저장 (이미 저장된 결제는 건너뜀)
+                await history_order_repo.bulk_archive_orders(orders_data)
                 
-                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                logger.info(
-                    f"주문 마이그레이션 완료: "
-                    f"{archived_count}개의 주문이 히스토리로 이동됨 "
-                    f"(소요시간: {elapsed_time:.2f}초)"
+                chunk_dates = {get_settlement_date(order) for order in orders_data}
+                await checkpoint_repo.add_settlement_dates(
+                    OrderMigrationTask.JOB_NAME, list(chunk_dates - settlement_dates)
                 )
+                settlement_dates |= chunk_dates
                 
-                OrderMigrationTask._log_migration_statistics(orders_data)
+                # 저장이 성공한 후에만 같은 청크를 삭제
+                payment_ids = [order["payment_id"] for order in orders_data]
+                async with get_session() as session:
+                    await OrderCurrentItemRepository(session).delete_by_payment_ids(payment_ids)
                 
+                last_payment_id = payment_ids[-1]
+                await checkpoint_repo.advance(OrderMigrationTask.JOB_NAME, last_payment_id, len(orders_data))
+                
+                archived_count += len(orders_data)
+                for order in orders_data:
+                    status_counts[order["status"]] += 1
+                    total_revenue += order["total_amount"]
+            
+            # 이동된 주문의 일별 정산 집계를 히스토리 기준으로 다시 계산
+            await SettlementDailyRepository().rebuild_dates(sorted(settlement_dates))
+            
+            # 당일 주문 집계를 남아있는 주문 기준으로 다시 생성
+            async with get_session() as session:
+                await StoreProductDailyStatRepository(session).rebuild_from_current_orders()
+            
+            await checkpoint_repo.complete(OrderMigrationTask.JOB_NAME)
+            
+            if not archived_count:
+                logger.info("마이그레이션할 주문이 없습니다")
+                return
+            
+            elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            logger.info(
+                f"주문 마이그레이션 완료: "
+                f"{archived_count}개의 주문이 히스토리로 이동됨 "
+                f"(소요시간: {elapsed_time:.2f}초)"
+            )
+            logger.info(
+                f"마이그레이션 통계 - "
+                f"총 주문수: {archived_count}, "
+                f"총 매출: {total_revenue:,}원, "
+                f"상태별: {dict(status_counts)}"
+            )
+        
         except Exception as e:
             logger.error(f"주문 마이그레이션 중 오류 발생: {e}", exc_info=True)
     
-    @staticmethod
-    def _log_migration_statistics(orders_data: List[Dict[str, Any]]):
-        """마이그레이션 통계 로깅"""
-        if not orders_data:
-            return
-        
-        status_counts = {}
-        total_revenue = 0
-        
-        for order in orders_data:
-            status = order.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-            total_revenue += order.get("total_amount", 0)
-        
-        logger.info(
-            f"마이그레이션 통계 - "
-            f"총 주문수: {len(orders_data)}, "
-            f"총 매출: {total_revenue:,}원, "
-            f"상태별: {status_counts}"
-        )
-    
     @staticmethod
     async def force_migrate_now() -> Dict[str, Any]:
         """수동으로 즉시 마이그레이션 실행 (테스트/관리 목적)"""
@@ -0,0 +1,43 @@
+import logging
+from datetime import datetime, timezone
+
+from services.payment_scheduler import PaymentSchedulerService
+
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentTimeoutSweepTask:
+    """마감된 결제의 재고를 복구하는 스케줄 작업"""
+    
+    @staticmethod
+    async def sweep_expired_payments():
+        """결제 타임아웃 대기열에서 마감된 결제를 가져가 재고 복구 및 장바구니 삭제"""
+        start_time = datetime.now(timezone.utc)
+        
+        try:
+            restored_count = await PaymentSchedulerService.sweep_expired_payments()
+            
+            if restored_count > 0:
+                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+                logger.info(
+                    f"결제 타임아웃 재고 복구 완료: "
+                    f"{restored_count}개 장바구니 "
+                    f"(소요시간: {elapsed_time:.2f}초)"
+                )
+        
+        except Exception as e:
+            logger.error(f"결제 타임아웃 재고 복구 중 오류 발생: {e}", exc_info=True)
+
+
+# 스케줄러에 등록할 태스크 정의
+scheduled_task = {
+    "func": PaymentTimeoutSweepTask.sweep_expired_payments,
+    "trigger": "interval",
+    "trigger_args": {
+        "seconds": 5,
+    },
+    "job_id": "sweep_payment_timeouts",
+    "job_name": "결제 타임아웃 재고 복구",
+    "misfire_grace_time": 5,
+}
@@ -1,10 +1,10 @@
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from database.session import get_session
 from repositories.product_stock_reservation import ProductStockReservationRepository
-from repositories.store_product_info import StoreProductInfoRepository, StockUpdateResult
+from repositories.store_product_info import StoreProductInfoRepository
 
 
 logger = logging.getLogger(__name__)
@@ -13,13 +13,25 @@ logger = logging.getLogger(__name__)
 class ProductStockUpdateTask:
     """예약된 상품 재고를 업데이트하는 스케줄 작업"""
     
+    # 한 문장으로 반영하는 예약 수
+    BATCH_SIZE = 1000
+    
     @staticmethod
-    async def update_reserved_stocks():
+    async def update_reserved_stocks() -> Dict[str, Any]:
+        """
+        예약된 재고를 일괄 반영
+        
+        BATCH_SIZE건씩 UPDATE ... FROM (VALUES ...) 한 문장으로 반영하고, 커밋 후 반영된 예약을 한 번에 삭제
+        실패한 배치의 예약은 남겨두어 다음 실행 때 다시 반영
+        
+        Returns:
+            {"success": 성공 건수, "failed": 실패 건수, "failed_product_ids": 실패한 상품 ID 목록}
+        """
         logger.info("예약된 재고 업데이트 작업 시작...")
         start_time = datetime.now(timezone.utc)
         
         success_count = 0
-        failed_count = 0
+        failed_product_ids: List[str] = []
         
         try:
             reservation_repo = ProductStockReservationRepository()
@@ -28,69 +40,54 @@ class ProductStockUpdateTask:
             
             if not reservations:
                 logger.info("업데이트할 재고 예약 정보가 없습니다.")
-                return
+                return {"success": 0, "failed": 0, "failed_product_ids": []}
             
-            async with get_session() as session:
-                product_repo = StoreProductInfoRepository(session)
+            batch_size = ProductStockUpdateTask.BATCH_SIZE
+            for start in range(0, len(reservations), batch_size):
+                new_stocks = {
+                    reservation.product_id: reservation.new_stock
+                    for reservation in reservations[start:start + batch_size]
+                }
                 
-                for reservation in reservations:
-                    try:
-                        product = await product_repo.get_by_product_id(reservation.product_id)
-                        
-                        if not product:
-                            logger.warning(
-                                f"상품을 찾을 수 없습니다 - "
-                                f"product_id: {reservation.product_id}"
-                            )
-                            await reservation_repo.delete_by_product_id(reservation.product_id)
-                            continue
-                        
-                        result = await product_repo.set_stock(
-                            reservation.product_id, 
-                            reservation.new_stock
-                        )
-                        
-                        if result == StockUpdateResult.SUCCESS:
-                            await reservation_repo.delete_by_product_id(reservation.product_id)
-                            success_count += 1
-                            
-                            logger.info(
-                                f"재고 업데이트 성공 - "
-                                f"product_id: {reservation.product_id}, "
-                                f"initial_stock: {reservation.initial_stock} -> "
-                                f"new_stock: {reservation.new_stock}"
-                            )
-                        else:
-                            failed_count += 1
-                            logger.error(
-                                f"재고 업데이트 실패 - "
-                                f"product_id: {reservation.product_id}, "
-                                f"result: {result}"
-                            )
-                            
-                    except Exception as e:
-                        failed_count += 1
-                        logger.error(
-                            f"재고 업데이트 중 오류 발생 - "
-                            f"product_id: {reservation.product_id}, "
-                            f"error: {e}",
-                            exc_info=True
-                        )
+                try:
+                    async with get_session() as session:
+                        updated_ids = await StoreProductInfoRepository(session).set_stocks(new_stocks)
+                except Exception as e:
+                    failed_product_ids.extend(new_stocks)
+                    logger.error(f"재고 일괄 업데이트 실패 - {len(new_stocks)}건, error: {e}", exc_info=True)
+                    continue
                 
-                await session.commit()
+                updated_id_set = set(updated_ids)
+                missing_ids = [product_id for product_id in new_stocks if product_id not in updated_id_set]
+                if missing_ids:
+                    failed_product_ids.extend(missing_ids)
+                    logger.warning(f"상품을 찾을 수 없습니다 - product_ids: {missing_ids}")
                 
+                # 반영된 예약과 상품이 없어진 예약은 삭제
+                await reservation_repo.delete_by_product_ids(list(new_stocks))
+                success_count += len(updated_ids)
+            
             elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             logger.info(
                 f"예약된 재고 업데이트 완료: "
-                f"성공 {success_count}건, 실패 {failed_count}건 "
+                f"성공 {success_count}건, 실패 {len(failed_product_ids)}건 "
                 f"(소요시간: {elapsed_time:.2f}초)"
             )
             
+            if failed_product_ids:
+                logger.error(f"재고 업데이트 실패 상품 - product_ids: {failed_product_ids}")
+            
             # 업데이트 통계 로깅
-            ProductStockUpdateTask._log_update_statistics(success_count, failed_count)
+            ProductStockUpdateTask._log_update_statistics(success_count, len(failed_product_ids))
             
         except Exception as e:
             logger.error(f"예약된 재고 업데이트 중 오류 발생: {e}", exc_info=True)
+        
+        return {
+            "success": success_count,
+            "failed": len(failed_product_ids),
+            "failed_product_ids": failed_product_ids
+        }
     
     @staticmethod
     def _log_update_statistics(success_count: int, failed_count: int):
@@ -108,10 +105,11 @@ class ProductStockUpdateTask:
         logger.info("수동 재고 업데이트 요청됨")
         
         try:
-            await ProductStockUpdateTask.update_reserved_stocks()
+            result = await ProductStockUpdateTask.update_reserved_stocks()
             return {
                 "success": True,
-                "message": "예약된 재고 업데이트가 성공적으로 완료되었습니다"
+                "message": "예약된 재고 업데이트가 성공적으로 완료되었습니다",
+                "failed_product_ids": result["failed_product_ids"]
             }
         except Exception as e:
             logger.error(f"수동 재고 업데이트 실패: {e}")
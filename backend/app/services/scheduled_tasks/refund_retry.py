@@ -0,0 +1,44 @@
+import logging
+from datetime import datetime, timezone
+
+from services.refund_executor import RefundExecutor
+
+
+logger = logging.getLogger(__name__)
+
+
+class RefundRetryTask:
+    """실패한 자동 환불을 다시 처리하는 스케줄 작업"""
+    
+    @staticmethod
+    async def retry_failed_refunds():
+        """refund_failures에 기록된 환불 실패 내역을 재시도"""
+        start_time = datetime.now(timezone.utc)
+        
+        try:
+            result = await RefundExecutor.retry_failed_refunds()
+            
+            if result["refunded"] > 0 or result["failed"] > 0:
+                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+                logger.info(
+                    f"환불 재시도 완료: "
+                    f"성공 {result['refunded']}건, 실패 {result['failed']}건, "
+                    f"총 환불 금액 {result['refund_amount']:,}원 "
+                    f"(소요시간: {elapsed_time:.2f}초)"
+                )
+        
+        except Exception as e:
+            logger.error(f"환불 재시도 중 오류 발생: {e}", exc_info=True)
+
+
+# 스케줄러에 등록할 태스크 정의
+scheduled_task = {
+    "func": RefundRetryTask.retry_failed_refunds,
+    "trigger": "interval",
+    "trigger_args": {
+        "minutes": 30,
+    },
+    "job_id": "retry_failed_refunds",
+    "job_name": "자동 환불 실패 재시도",
+    "misfire_grace_time": 600,
+}
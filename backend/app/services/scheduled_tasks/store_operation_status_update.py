@@ -1,13 +1,10 @@
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any
-from sqlalchemy import update, select
-from sqlalchemy.orm import joinedload
 
 from database.session import get_session
-from database.models.store_operation_info import StoreOperationInfo
-from database.models.store import Store
-from repositories.store_payment_info import StorePaymentInfoRepository
+from repositories.store_operation_info import StoreOperationInfoRepository
+from services.store_card import mark_all_store_cards_dirty
 
 
 logger = logging.getLogger(__name__)
@@ -34,45 +31,12 @@ class StoreOperationStatusUpdateTask:
                 f"오늘 요일: {now_kst_day_of_week}"
             )
             async with get_session() as session:
-                # 포트원 정보가 있는 가게들만 조회
-                payment_repo = StorePaymentInfoRepository(session)
+                operation_repo = StoreOperationInfoRepository(session)
                 
-                # 오늘 요일의 모든 운영 정보 조회
-                query = (
-                    select(StoreOperationInfo)
-                    .join(Store)
-                    .where(StoreOperationInfo.day_of_week == now_kst_day_of_week)
-                    .options(joinedload(StoreOperationInfo.store))
-                )
-                result = await session.execute(query)
-                operation_infos = result.scalars().all()
-                
-                updated_count = 0
-                skipped_count = 0
-                
-                for op_info in operation_infos:
-                    # 포트원 정보 확인
-                    has_complete_payment = await payment_repo.has_complete_info(op_info.store_id)
-                    
-                    if not has_complete_payment:
-                        logger.debug(
-                            f"포트원 정보가 없는 가게 건너뛰기 - "
-                            f"가게ID: {op_info.store_id}"
-                        )
-                        skipped_count += 1
-                        continue
-                    
-                    # 포트원 정보가 있는 가게만 업데이트
-                    stmt = (
-                        update(StoreOperationInfo)
-                        .where(StoreOperationInfo.operation_id == op_info.operation_id)
-                        .values(is_currently_open=op_info.is_open_enabled)
-                    )
-                    
-                    result = await session.execute(stmt)
-                    if result.rowcount > 0:
-                        updated_count += 1
+                # 포트원 정보가 있는 가게만 한 문장으로 업데이트, 건너뛴 가게 수는 집계 쿼리 한 번으로 조회
+                updated_count, skipped_count = await operation_repo.sync_open_status_for_day(now_kst_day_of_week)
                 
+                mark_all_store_cards_dirty(session)
                 await session.commit()
                 
                 if skipped_count > 0:
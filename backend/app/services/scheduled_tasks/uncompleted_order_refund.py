@@ -1,19 +1,16 @@
 import logging
 from datetime import datetime, timezone
 from typing import Dict, Any
-from collections import defaultdict
 
 from database.session import get_session
 from repositories.order_current_item import OrderCurrentItemRepository
-from repositories.store_payment_info import StorePaymentInfoRepository
-from repositories.store import StoreRepository
-from schemas.order import OrderStatus
-from services.payment import PaymentService
-from services.email import email_service
+from services.refund_executor import RefundExecutor, REFUNDABLE_STATUSES
 
 
 logger = logging.getLogger(__name__)
 
+REFUND_REASON = "영업 시간 종료로 인한 자동 환불"
+
 
 class UncompletedOrderRefundTask:
     """미완료 주문(reservation, accept 상태)을 환불 처리하는 스케줄 작업"""
@@ -24,100 +21,38 @@ class UncompletedOrderRefundTask:
         logger.info("미완료 주문 환불 처리 작업 시작...")
         start_time = datetime.now(timezone.utc)
         
-        refund_count = 0
-        error_count = 0
-        total_refund_amount = 0
-        
         try:
-            async with get_session() as session:
+            async with get_session(auto_commit=False) as session:
                 order_repo = OrderCurrentItemRepository(session)
-                payment_info_repo = StorePaymentInfoRepository(session)
-                store_repo = StoreRepository(session)
                 
                 # reservation과 accept 상태의 모든 주문 조회
                 all_orders = await order_repo.get_all_orders_with_relations()
-                uncompleted_orders = [
-                    order for order in all_orders 
-                    if order.status in [OrderStatus.reservation, OrderStatus.accept]
+                targets = [
+                    RefundExecutor.build_target(order, cancel_reason=REFUND_REASON, release_stock=False)
+                    for order in all_orders
+                    if order.status in REFUNDABLE_STATUSES
                 ]
-                
-                if not uncompleted_orders:
-                    logger.info("환불 처리할 미완료 주문이 없습니다")
-                    return
-                
-                # 가게별로 주문을 그룹화
-                orders_by_store = defaultdict(list)
-                for order in uncompleted_orders:
-                    store_id = order.product.store_id
-                    orders_by_store[store_id].append(order)
-                
-                # 가게별로 환불 처리
-                for store_id, store_orders in orders_by_store.items():
-
-                    payment_info = await payment_info_repo.get_by_store_id(store_id)
-                    
-                    if not payment_info or not payment_info.portone_secret_key:
-                        logger.error(f"가게 {store_id}의 결제 설정이 없어 {len(store_orders)}개 주문 환불 실패")
-                        error_count += len(store_orders)
-                        continue
-                    
-                    for order in store_orders:
-                        try:
-                            # 포트원 환불 처리
-                            refund_result = await PaymentService.process_refund(
-                                payment_id=order.payment_id,
-                                secret_key=payment_info.portone_secret_key,
-                                reason="영업 시간 종료로 인한 자동 환불"
-                            )
-                            
-                            if refund_result.get("success"):
-                                # 주문 취소 처리
-                                quantity = await order_repo.cancel_order(
-                                    payment_id=order.payment_id,
-                                    cancel_reason="영업 시간 종료로 인한 자동 환불"
-                                )
-                                
-                                if email_service.is_configured():
-                                    store = await store_repo.get_by_seller_email(order.product.store_id)
-                                    await email_service.send_template(
-                                        recipient_email=order.customer_id,
-                                        store_name=store["store_name"],
-                                        template_type="seller_cancel"
-                                    )
-                                
-                                refund_count += 1
-                                total_refund_amount += order.total_amount
-                                
-                                logger.info(
-                                    f"주문 {order.payment_id} 환불 완료 - "
-                                    f"고객: {order.customer_id}, "
-                                    f"상품: {order.product.product_name}, "
-                                    f"금액: {order.total_amount:,}원"
-                                )
-                            else:
-                                error_count += 1
-                                logger.error(
-                                    f"주문 {order.payment_id} 환불 실패: "
-                                    f"{refund_result.get('error', '알 수 없는 오류')}"
-                                )
-                                
-                        except Exception as e:
-                            error_count += 1
-                            logger.error(f"주문 {order.payment_id} 환불 처리 중 오류: {str(e)}")
-                
-                # 작업 완료 통계
-                elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                logger.info(
-                    f"미완료 주문 환불 처리 완료: "
-                    f"성공 {refund_count}건, 실패 {error_count}건, "
-                    f"총 환불 금액 {total_refund_amount:,}원 "
-                    f"(소요시간: {elapsed_time:.2f}초)"
-                )
-                
-                UncompletedOrderRefundTask._log_refund_statistics(
-                    refund_count, error_count, total_refund_amount
-                )
-                
+            
+            if not targets:
+                logger.info("환불 처리할 미완료 주문이 없습니다")
+                return
+            
+            # 가게별로 묶어 동시 환불 후 배치 단위로 주문 취소 반영
+            result = await RefundExecutor.refund(targets)
+            
+            # 작업 완료 통계
+            elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            logger.info(
+                f"미완료 주문 환불 처리 완료: "
+                f"성공 {result['refunded']}건, 실패 {result['failed']}건, "
+                f"총 환불 금액 {result['refund_amount']:,}원 "
+                f"(소요시간: {elapsed_time:.2f}초)"
+            )
+            
+            UncompletedOrderRefundTask._log_refund_statistics(
+                result["refunded"], result["failed"], result["refund_amount"]
+            )
+        
         except Exception as e:
             logger.error(f"미완료 주문 환불 처리 중 오류 발생: {e}", exc_info=True)
     
@@ -1,18 +1,35 @@
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any
+from typing import Awaitable, Callable, Dict, Any, List, Tuple
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.object_storage import object_storage
 from database.session import get_session
 from repositories.seller_withdraw_reservation import SellerWithdrawReservationRepository
 from repositories.customer_withdraw_reservation import CustomerWithdrawReservationRepository
 from repositories.seller import SellerRepository
 from repositories.customer import CustomerRepository
+from repositories.customer_detail import CustomerDetailRepository
+from repositories.customer_favorite import CustomerFavoriteRepository
+from repositories.customer_preferences import (
+    CustomerPreferredMenuRepository,
+    CustomerNutritionTypeRepository,
+    CustomerAllergyRepository,
+    CustomerToppingTypeRepository
+)
+from repositories.cart_item import CartItemRepository
 from repositories.store import StoreRepository
 from repositories.store_product_info import StoreProductInfoRepository
 from repositories.store_payment_info import StorePaymentInfoRepository
 from repositories.store_operation_info import StoreOperationInfoRepository
+from repositories.store_operation_info_modification import StoreOperationInfoModificationRepository
+from repositories.product_nutrition import ProductNutritionRepository
 from repositories.store_image import StoreImageRepository
 from repositories.store_sns import StoreSNSRepository
+from services.store_card import mark_store_cards_dirty
 
 
 logger = logging.getLogger(__name__)
@@ -20,9 +37,18 @@ logger = logging.getLogger(__name__)
 # KST 타임존 설정
 KST = timezone(timedelta(hours=9))
 
+# 사용자 묶음을 삭제하고 삭제된 가게 이미지 키 목록을 반환하는 함수
+DeleteUsers = Callable[[AsyncSession, List[str]], Awaitable[List[str]]]
+
 
 class UserWithdrawProcessTask:
-    """사용자 탈퇴 예약 정보를 기반으로 계정 및 관련 데이터를 삭제하는 스케줄 작업"""
+    """사용자 탈퇴 예약 정보를 기반으로 계정 및 관련 데이터를 삭제하는 스케줄 작업
+    
+    1. 탈퇴 예약된 판매자/소비자 ID를 한 번에 모은 뒤, 판매자와 소비자는 별도 세션에서 동시에 처리
+    2. 관련 테이블은 FK 순서대로 테이블마다 DELETE ... WHERE ... IN (...) 한 문장으로 삭제
+    3. 전체를 하나의 savepoint로 먼저 삭제하고, 실패하면 사용자별 savepoint로 다시 삭제해 실패한 사용자만 건너뜀
+    4. 커밋 이후 처리된 탈퇴 예약을 삭제하고, 가게 이미지는 S3 delete_objects로 일괄 삭제
+    """
 
     @staticmethod
     async def process_scheduled_withdrawals():
@@ -30,8 +56,10 @@ class UserWithdrawProcessTask:
         logger.info("=== 예약된 사용자 탈퇴 처리 시작 ===")
         start_time = datetime.now(timezone.utc)
         
-        seller_count = await UserWithdrawProcessTask._process_seller_withdrawals()
-        customer_count = await UserWithdrawProcessTask._process_customer_withdrawals()
+        seller_count, customer_count = await asyncio.gather(
+            UserWithdrawProcessTask._process_seller_withdrawals(),
+            UserWithdrawProcessTask._process_customer_withdrawals()
+        )
         
         elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
         logger.info(
@@ -40,11 +68,97 @@ class UserWithdrawProcessTask:
             f"(소요시간: {elapsed_time:.2f}초) ==="
         )
 
+    @staticmethod
+    async def _delete_in_savepoints(
+        session: AsyncSession,
+        user_ids: List[str],
+        delete_users: DeleteUsers,
+        user_type: str
+    ) -> Tuple[List[str], List[str]]:
+        """
+        사용자 묶음을 savepoint 안에서 삭제
+        
+        전체 삭제에 실패하면 사용자별 savepoint로 다시 삭제하여 실패한 사용자만 롤백
+        
+        Returns:
+            (삭제된 사용자 ID 목록, 삭제된 가게 이미지 키 목록)
+        """
+        try:
+            async with session.begin_nested():
+                image_keys = await delete_users(session, user_ids)
+            return user_ids, image_keys
+        except Exception as e:
+            logger.warning(f"{user_type} {len(user_ids)}명 일괄 삭제 실패, 사용자별로 다시 처리합니다: {str(e)}")
+        
+        deleted_ids, image_keys = [], []
+        for user_id in user_ids:
+            try:
+                async with session.begin_nested():
+                    image_keys.extend(await delete_users(session, [user_id]))
+                deleted_ids.append(user_id)
+            except Exception as e:
+                logger.error(f"{user_type} {user_id} 탈퇴 처리 중 오류 발생: {str(e)}", exc_info=True)
+        
+        return deleted_ids, image_keys
+
+    @staticmethod
+    async def _delete_sellers(session: AsyncSession, seller_emails: List[str]) -> List[str]:
+        """판매자와 가게 관련 데이터를 FK 순서대로 삭제, 삭제된 가게 이미지 키 목록 반환"""
+        store_repo = StoreRepository(session)
+        product_repo = StoreProductInfoRepository(session)
+        operation_info_repo = StoreOperationInfoRepository(session)
+        
+        stores = await store_repo.get_many(filters={"seller_email": seller_emails})
+        store_ids = [store.store_id for store in stores]
+        image_keys = []
+        
+        if store_ids:
+            products = await product_repo.get_many(filters={"store_id": store_ids})
+            product_ids = [product.product_id for product in products]
+            if product_ids:
+                await ProductNutritionRepository(session).bulk_delete_where(product_id=product_ids)
+                await CartItemRepository(session).bulk_delete_where(product_id=product_ids)
+                await product_repo.bulk_delete_where(product_id=product_ids)
+            
+            operation_infos = await operation_info_repo.get_many(filters={"store_id": store_ids})
+            operation_ids = [op_info.operation_id for op_info in operation_infos]
+            if operation_ids:
+                await StoreOperationInfoModificationRepository(session).bulk_delete_where(operation_id=operation_ids)
+                await operation_info_repo.bulk_delete_where(operation_id=operation_ids)
+            
+            await StorePaymentInfoRepository(session).bulk_delete_where(store_id=store_ids)
+            await StoreSNSRepository(session).bulk_delete_where(store_id=store_ids)
+            await CustomerFavoriteRepository(session).bulk_delete_where(store_id=store_ids)
+            
+            images = await StoreImageRepository(session).bulk_delete_where(store_id=store_ids)
+            image_keys = [image.image_id for image in images]
+            
+            # 상품 일별 집계, 검색 색인은 ON DELETE CASCADE로 함께 삭제
+            await store_repo.bulk_delete_where(store_id=store_ids)
+            mark_store_cards_dirty(session, *store_ids)
+        
+        await SellerRepository(session).bulk_delete_where(email=seller_emails)
+        return image_keys
+
+    @staticmethod
+    async def _delete_customers(session: AsyncSession, customer_emails: List[str]) -> List[str]:
+        """소비자와 소비자 관련 데이터를 FK 순서대로 삭제"""
+        for repo_class in (
+            CustomerDetailRepository,
+            CustomerPreferredMenuRepository,
+            CustomerNutritionTypeRepository,
+            CustomerAllergyRepository,
+            CustomerToppingTypeRepository,
+            CustomerFavoriteRepository
+        ):
+            await repo_class(session).bulk_delete_where(customer_email=customer_emails)
+        
+        await CustomerRepository(session).bulk_delete_where(email=customer_emails)
+        return []
+
     @staticmethod
     async def _process_seller_withdrawals() -> int:
         """판매자 탈퇴 처리"""
-        processed_count = 0
-        
         try:
             seller_withdraw_repo = SellerWithdrawReservationRepository()
             all_reservations = await seller_withdraw_repo.get_many()
@@ -55,80 +169,52 @@ class UserWithdrawProcessTask:
             
             logger.info(f"총 {len(all_reservations)}건의 판매자 탈퇴 예약 발견")
             
+            reservation_ids_by_email = defaultdict(list)
+            for reservation in all_reservations:
+                reservation_ids_by_email[reservation.seller_email].append(reservation.id)
+            
             async with get_session() as session:
-                seller_repo = SellerRepository(session)
-                store_repo = StoreRepository(session)
-                product_repo = StoreProductInfoRepository(session)
-                payment_info_repo = StorePaymentInfoRepository(session)
-                operation_info_repo = StoreOperationInfoRepository(session)
-                image_repo = StoreImageRepository(session)
-                sns_repo = StoreSNSRepository(session)
-                
-                for reservation in all_reservations:
-                    try:
-                        seller_email = reservation.seller_email
-                        logger.info(f"판매자 {seller_email} 탈퇴 처리 시작")
-                        
-                        seller = await seller_repo.get_by_email(seller_email)
-                        if not seller:
-                            logger.warning(f"판매자 {seller_email}을(를) 찾을 수 없습니다")
-                            await seller_withdraw_repo.delete_by_id(str(reservation.id))
-                            continue
-                        
-                        stores = await store_repo.get_by_seller_email(seller_email)
-                        
-                        for store in stores:
-                            logger.info(f"가게 {store.store_name} (ID: {store.store_id}) 관련 데이터 삭제 시작")
-                            
-                            products = await product_repo.get_by_store_id(store.store_id)
-                            for product in products:
-                                await product_repo.delete(product.product_id)
-                            
-                            payment_info = await payment_info_repo.get_by_store_id(store.store_id)
-                            if payment_info:
-                                await payment_info_repo.delete(payment_info.store_id)
-                            
-                            operation_infos = await operation_info_repo.get_many(filters={"store_id": store.store_id})
-                            for op_info in operation_infos:
-                                await session.delete(op_info)
-                            
-                            images = await image_repo.get_by_store_id(store.store_id)
-                            for image in images:
-                                await session.delete(image)
-                            
-                            sns_info = await sns_repo.get_by_store_id(store.store_id)
-                            if sns_info:
-                                await session.delete(sns_info)
-                            
-                            await store_repo.delete(store.store_id)
-                            logger.info(f"가게 {store.store_name} 삭제 완료")
-                        
-                        await seller_repo.delete(seller_email)
-                        
-                        await seller_withdraw_repo.delete_by_id(str(reservation.id))
-                        
-                        processed_count += 1
-                        logger.info(f"판매자 {seller_email} 탈퇴 처리 완료")
-                        
-                    except Exception as e:
-                        logger.error(
-                            f"판매자 {reservation.seller_email} 탈퇴 처리 중 오류 발생: {str(e)}",
-                            exc_info=True
-                        )
-                        continue
+                sellers = await SellerRepository(session).get_many(
+                    filters={"email": list(reservation_ids_by_email)}
+                )
+                seller_emails = [seller.email for seller in sellers]
                 
-                await session.commit()
+                for seller_email in reservation_ids_by_email.keys() - set(seller_emails):
+                    logger.warning(f"판매자 {seller_email}을(를) 찾을 수 없습니다")
                 
+                deleted_emails, image_keys = [], []
+                if seller_emails:
+                    deleted_emails, image_keys = await UserWithdrawProcessTask._delete_in_savepoints(
+                        session, seller_emails, UserWithdrawProcessTask._delete_sellers, "판매자"
+                    )
+            
+            # 커밋된 판매자와 이미 없는 판매자의 탈퇴 예약만 삭제 (실패한 판매자는 다음 실행 때 재시도)
+            failed_emails = set(seller_emails) - set(deleted_emails)
+            done_ids = [
+                reservation_id
+                for seller_email, reservation_ids in reservation_ids_by_email.items()
+                if seller_email not in failed_emails
+                for reservation_id in reservation_ids
+            ]
+            await seller_withdraw_repo.delete_many(_id={"$in": done_ids})
+            
+            failed_keys = await object_storage.delete_files(image_keys)
+            if failed_keys:
+                logger.error(f"가게 이미지 {len(failed_keys)}개 삭제 실패: {failed_keys}")
+            
+            logger.info(
+                f"판매자 {len(deleted_emails)}명 탈퇴 처리 완료 "
+                f"(실패 {len(failed_emails)}명, 가게 이미지 {len(image_keys) - len(failed_keys)}개 삭제)"
+            )
+            return len(deleted_emails)
+            
         except Exception as e:
             logger.error(f"판매자 탈퇴 처리 중 오류 발생: {e}", exc_info=True)
-            
-        return processed_count
+            return 0
 
     @staticmethod
     async def _process_customer_withdrawals() -> int:
         """소비자 탈퇴 처리"""
-        processed_count = 0
-        
         try:
             customer_withdraw_repo = CustomerWithdrawReservationRepository()
             all_reservations = await customer_withdraw_repo.get_many()
@@ -139,40 +225,41 @@ class UserWithdrawProcessTask:
             
             logger.info(f"총 {len(all_reservations)}건의 소비자 탈퇴 예약 발견")
             
+            reservation_ids_by_email = defaultdict(list)
+            for reservation in all_reservations:
+                reservation_ids_by_email[reservation.customer_email].append(reservation.id)
+            
             async with get_session() as session:
-                customer_repo = CustomerRepository(session)
-                
-                for reservation in all_reservations:
-                    try:
-                        customer_email = reservation.customer_email
-                        logger.info(f"소비자 {customer_email} 탈퇴 처리 시작")
-                        
-                        customer = await customer_repo.get_by_email(customer_email)
-                        if not customer:
-                            logger.warning(f"소비자 {customer_email}을(를) 찾을 수 없습니다")
-                            await customer_withdraw_repo.delete_by_id(str(reservation.id))
-                            continue
-                        
-                        await customer_repo.delete(customer_email)
-                        
-                        await customer_withdraw_repo.delete_by_id(str(reservation.id))
-                        
-                        processed_count += 1
-                        logger.info(f"소비자 {customer_email} 탈퇴 처리 완료")
-                        
-                    except Exception as e:
-                        logger.error(
-                            f"소비자 {reservation.customer_email} 탈퇴 처리 중 오류 발생: {str(e)}",
-                            exc_info=True
-                        )
-                        continue
+                customers = await CustomerRepository(session).get_many(
+                    filters={"email": list(reservation_ids_by_email)}
+                )
+                customer_emails = [customer.email for customer in customers]
                 
-                await session.commit()
+                for customer_email in reservation_ids_by_email.keys() - set(customer_emails):
+                    logger.warning(f"소비자 {customer_email}을(를) 찾을 수 없습니다")
                 
+                deleted_emails = []
+                if customer_emails:
+                    deleted_emails, _ = await UserWithdrawProcessTask._delete_in_savepoints(
+                        session, customer_emails, UserWithdrawProcessTask._delete_customers, "소비자"
+                    )
+            
+            # 커밋된 소비자와 이미 없는 소비자의 탈퇴 예약만 삭제 (실패한 소비자는 다음 실행 때 재시도)
+            failed_emails = set(customer_emails) - set(deleted_emails)
+            done_ids = [
+                reservation_id
+                for customer_email, reservation_ids in reservation_ids_by_email.items()
+                if customer_email not in failed_emails
+                for reservation_id in reservation_ids
+            ]
+            await customer_withdraw_repo.delete_many(_id={"$in": done_ids})
+            
+            logger.info(f"소비자 {len(deleted_emails)}명 탈퇴 처리 완료 (실패 {len(failed_emails)}명)")
+            return len(deleted_emails)
+            
         except Exception as e:
             logger.error(f"소비자 탈퇴 처리 중 오류 발생: {e}", exc_info=True)
-            
-        return processed_count
+            return 0
 
     @staticmethod
     async def force_process_withdrawals_now() -> Dict[str, Any]:
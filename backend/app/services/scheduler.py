@@ -1,10 +1,21 @@
+import asyncio
 import logging
-from functools import partial
+import os
+import socket
+import sys
+import uuid
+from contextlib import suppress
 from pytz import timezone as pytz_timezone
 from typing import Dict, Any, List
 
+from apscheduler.executors.base import BaseExecutor, run_coroutine_job
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from services.scheduled_tasks.order_migration import scheduled_task as order_migration_task
 from services.scheduled_tasks.product_stock_update import scheduled_task as product_stock_update_task
@@ -15,17 +26,71 @@ from services.scheduled_tasks.store_operation_status_update import scheduled_tas
 from services.scheduled_tasks.auto_cancel_reservation_orders import scheduled_task as store_auto_complete_order_task, AutoCancelReservationOrdersTask
 from services.scheduled_tasks.auto_complete_orders import scheduled_task as store_auto_cancel_reservation_order_task, AutoCompleteOrdersTask
 from services.scheduled_tasks.user_withdraw_process import scheduled_task as user_withdraw_process_task
+from services.scheduled_tasks.hot_stock_flush import scheduled_task as hot_stock_flush_task
+from services.scheduled_tasks.payment_timeout_sweep import scheduled_task as payment_timeout_sweep_task
+from services.scheduled_tasks.refund_retry import scheduled_task as refund_retry_task
+from services.scheduled_tasks.leader_recovery import scheduled_task as leader_recovery_task
+from services.redis_cache import SchedulerLeaderLease
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 KST = pytz_timezone('Asia/Seoul')
 
 
+
+class EventLoopExecutor(BaseExecutor):
+    """작업 저장소 스케줄러 스레드에서 꺼낸 코루틴 작업을 애플리케이션 이벤트 루프에서 실행하는 실행기"""
+    
+    def __init__(self, eventloop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self._eventloop = eventloop
+    
+    def _do_submit_job(self, job, run_times):
+        def callback(f):
+            try:
+                events = f.result()
+            except BaseException:
+                self._run_job_error(job.id, *sys.exc_info()[1:])
+            else:
+                self._run_job_success(job.id, events)
+        
+        coro = run_coroutine_job(job, job._jobstore_alias, run_times, self._logger.name)
+        asyncio.run_coroutine_threadsafe(coro, self._eventloop).add_done_callback(callback)
+
+
 class SchedulerService:
-    """모든 스케줄된 작업을 관리하는 서비스"""
+    """모든 스케줄된 작업을 관리하는 서비스
+    
+    모든 워커가 스케줄러를 띄우지만, 작업은 Redis 임대로 선출된 리더 워커에서만 등록/실행됨
+    (서버 시작 시 복구 작업도 리더가 된 직후 한 번만 실행)
+    리더는 HEARTBEAT_SECONDS마다 임대를 갱신하고, 갱신에 실패하면 임대가 만료되기 전에 물러남
+    리더가 종료되거나 물러나면 LEASE_TTL_SECONDS 안에 다른 워커가 리더가 되어 작업을 다시 등록
+    
+    가게별 동적 스케줄(픽업 마감 취소/환불, 마감 자동 완료)과 그 등록 작업은 DB 작업 저장소에 보관되어
+    새 리더는 저장된 작업을 그대로 이어받고, 중단 중 지나간 작업은 misfire_grace_time 안이면 한 번만 실행
+    
+    DB 작업 저장소는 동기 I/O이므로 별도 스레드의 스케줄러(persistent_scheduler)가 조회/갱신하고
+    작업만 이벤트 루프에서 실행됨 (자주 실행되는 interval 작업은 메모리 저장소의 AsyncIOScheduler에서 처리)
+    """
+    
+    LEASE_TTL_SECONDS = 30
+    HEARTBEAT_SECONDS = 10
     
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+        self.scheduler = AsyncIOScheduler(
+            jobstores={"default": MemoryJobStore()},
+            job_defaults={"coalesce": True}
+        )
+        # 실행기는 이벤트 루프가 필요하므로 start()에서 등록
+        self.persistent_scheduler = BackgroundScheduler(
+            jobstores={"default": SQLAlchemyJobStore(url=settings.SCHEDULER_DATABASE_URL)},
+            job_defaults={"coalesce": True}
+        )
         self.is_running = False
+        self.is_leader = False
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._election_task = None
+        self._lease_renewed_at = 0.0
         self.scheduled_tasks: List[Dict[str, Any]] = [
             uncompleted_order_refund_task,
             product_stock_update_task,
@@ -33,51 +98,160 @@ class SchedulerService:
             order_migration_task,
             store_operation_modification_apply_tasak,
             store_operation_status_update_task,
-            user_withdraw_process_task
+            user_withdraw_process_task,
+            hot_stock_flush_task,
+            payment_timeout_sweep_task,
+            refund_retry_task,
+            leader_recovery_task
         ]
     
     def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (리더 선출 루프 시작, 작업은 리더가 된 뒤 등록)"""
         if not self.is_running:
-            self._configure_jobs()
-            self._configure_auto_cancel_refund_task()
-            self._configure_auto_complete_task()
-            self.scheduler.start()
+            self.scheduler.start(paused=True)
+            self.persistent_scheduler.add_executor(EventLoopExecutor(asyncio.get_running_loop()), "default")
+            self.persistent_scheduler.start(paused=True)
+            self._election_task = asyncio.get_running_loop().create_task(self._run_election())
             self.is_running = True
-            logger.info("스케줄러가 시작되었습니다")
+            logger.info(f"스케줄러가 시작되었습니다 (워커: {self.worker_id})")
     
-    def stop(self):
-        """스케줄러 중지"""
+    async def stop(self):
+        """스케줄러 중지 (리더였다면 임대를 반납해 다른 워커가 바로 이어받도록 함)"""
         if self.is_running:
+            self._election_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._election_task
+            
+            if self.is_leader:
+                self._step_down()
+                try:
+                    await SchedulerLeaderLease.release(self.worker_id)
+                except Exception as e:
+                    logger.error(f"스케줄러 리더 임대 반납 실패: {e}")
+            
             self.scheduler.shutdown(wait=False)
+            self.persistent_scheduler.shutdown(wait=False)
             self.is_running = False
             logger.info("스케줄러가 중지되었습니다")
     
+    async def _run_election(self):
+        """리더 임대 획득/갱신 루프"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            try:
+                if self.is_leader:
+                    if await SchedulerLeaderLease.renew(self.worker_id, self.LEASE_TTL_SECONDS):
+                        self._lease_renewed_at = loop.time()
+                    else:
+                        logger.warning("스케줄러 리더 임대를 다른 워커가 가져갔습니다")
+                        self._step_down()
+                elif await SchedulerLeaderLease.acquire(self.worker_id, self.LEASE_TTL_SECONDS):
+                    self._lease_renewed_at = loop.time()
+                    await self._become_leader()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"스케줄러 리더 선출 중 오류: {e}")
+                
+                # 다음 갱신 시도 전에 임대가 만료될 수 있으면 다른 워커가 리더가 되기 전에 먼저 물러남
+                if self.is_leader and loop.time() - self._lease_renewed_at >= self.LEASE_TTL_SECONDS - self.HEARTBEAT_SECONDS:
+                    logger.warning("스케줄러 리더 임대를 갱신하지 못해 물러납니다")
+                    self._step_down()
+            
+            await asyncio.sleep(self.HEARTBEAT_SECONDS)
+    
+    async def _become_leader(self):
+        """리더가 되면 작업을 등록하고 실행 시작 (저장된 동적 스케줄은 작업 저장소에서 이어받음)"""
+        self._configure_jobs()
+        await self._configure_auto_cancel_refund_task()
+        await self._configure_auto_complete_task()
+        self.scheduler.resume()
+        self.persistent_scheduler.resume()
+        self.is_leader = True
+        
+        pending_count = len(await asyncio.to_thread(self.persistent_scheduler.get_jobs))
+        logger.info(f"스케줄러 리더가 되었습니다 (워커: {self.worker_id}, 저장된 작업: {pending_count}개)")
+    
+    def _step_down(self):
+        """리더에서 물러나면 실행 중지 후 메모리 작업 제거 (저장된 작업은 다음 리더가 이어받음)"""
+        self.is_leader = False
+        self.scheduler.pause()
+        self.persistent_scheduler.pause()
+        self.scheduler.remove_all_jobs()
+        logger.info(f"스케줄러 리더에서 물러났습니다 (워커: {self.worker_id})")
+    
     def _configure_jobs(self):
         """로드된 모든 태스크를 스케줄러에 등록"""
         for task in self.scheduled_tasks:
             try:
+                trigger_args = task.get("trigger_args", {})
                 if task["trigger"] == "cron":
                     # KST 타임존 적용
-                    trigger_args = task.get("trigger_args", {})
                     trigger = CronTrigger(
                         **trigger_args,
                         timezone=KST
                     )
+                elif task["trigger"] == "interval":
+                    trigger = IntervalTrigger(**trigger_args)
+                elif task["trigger"] == "date":
+                    # 실행 시각이 없으면 리더가 된 직후 한 번 실행
+                    trigger = DateTrigger(**trigger_args, timezone=KST)
+                else:
+                    continue
 
-                    self.scheduler.add_job(
-                        func=task["func"],
-                        trigger=trigger,
-                        id=task["job_id"],
-                        name=task.get("job_name", task["job_id"]),
-                        misfire_grace_time=task.get("misfire_grace_time", 3600)
-                    )
+                self.scheduler.add_job(
+                    func=task["func"],
+                    trigger=trigger,
+                    id=task["job_id"],
+                    name=task.get("job_name", task["job_id"]),
+                    misfire_grace_time=task.get("misfire_grace_time", 3600)
+                )
 
-                    logger.info(f"태스크 등록됨: {task.get('job_name', task['job_id'])}")
+                logger.info(f"태스크 등록됨: {task.get('job_name', task['job_id'])}")
             except Exception as e:
                 logger.error(f"태스크 등록 실패 ({task.get('job_id', 'unknown')}): {e}")
+    
+    async def add_persistent_job(self, **job_kwargs):
+        """작업 저장소에 작업 등록 (DB I/O는 스레드에서 처리)"""
+        return await asyncio.to_thread(self.persistent_scheduler.add_job, **job_kwargs)
+    
+    async def remove_persistent_jobs(self, job_id_prefix: str) -> int:
+        """작업 저장소에서 id가 job_id_prefix로 시작하는 작업 삭제 (DB I/O는 스레드에서 처리)
+        
+        Returns:
+            삭제된 작업 수
+        """
+        def remove_jobs() -> int:
+            removed_count = 0
+            for job in self.persistent_scheduler.get_jobs():
+                if job.id.startswith(job_id_prefix):
+                    job.remove()
+                    removed_count += 1
+            return removed_count
+        
+        return await asyncio.to_thread(remove_jobs)
+    
+    async def _add_persistent_cron_job(self, func, trigger: CronTrigger, job_id: str, name: str):
+        """
+        작업 저장소에 cron 작업 등록
+        
+        이미 저장된 작업이면 저장된 다음 실행 시각을 유지해, 중단 중 지나간 실행도 misfire 규칙대로 한 번 실행됨
+        """
+        existing_job = await asyncio.to_thread(self.persistent_scheduler.get_job, job_id)
+        next_run_time = {"next_run_time": existing_job.next_run_time} if existing_job else {}
+        
+        await self.add_persistent_job(
+            func=func,
+            trigger=trigger,
+            id=job_id,
+            name=name,
+            misfire_grace_time=3600,
+            replace_existing=True,
+            **next_run_time
+        )
 
-    def _configure_auto_cancel_refund_task(self):
+    async def _configure_auto_cancel_refund_task(self):
         """픽업 마감 시 주문 자동 취소/환불 동적 스케줄 등록 태스크 설정"""
         try:
             trigger_args = store_auto_cancel_reservation_order_task.get("trigger_args", {})
@@ -86,19 +260,18 @@ class SchedulerService:
                 timezone=KST
             )
 
-            self.scheduler.add_job(
-                func=partial(AutoCancelReservationOrdersTask.register_daily_schedules, self),
+            await self._add_persistent_cron_job(
+                func=AutoCancelReservationOrdersTask.register_daily_schedules,
                 trigger=trigger,
-                id="register_auto_cancel_refund_schedules",
-                name="픽업 마감 시간 동적 스케줄 등록 (취소/환불)",
-                misfire_grace_time=3600
+                job_id="register_auto_cancel_refund_schedules",
+                name="픽업 마감 시간 동적 스케줄 등록 (취소/환불)"
             )
 
             logger.info("태스크 등록됨: 픽업 마감 시간 동적 스케줄 등록 (취소/환불)")
         except Exception as e:
             logger.error(f"동적 스케줄 등록 태스크 설정 실패 (취소/환불): {e}")
 
-    def _configure_auto_complete_task(self):
+    async def _configure_auto_complete_task(self):
         """가게 마감 시 주문 자동 완료 동적 스케줄 등록 태스크 설정"""
         try:
             trigger_args = store_auto_complete_order_task.get("trigger_args", {})
@@ -107,12 +280,11 @@ class SchedulerService:
                 timezone=KST
             )
 
-            self.scheduler.add_job(
-                func=partial(AutoCompleteOrdersTask.register_daily_schedules, self),
+            await self._add_persistent_cron_job(
+                func=AutoCompleteOrdersTask.register_daily_schedules,
                 trigger=trigger,
-                id="register_auto_complete_schedules",
-                name="가게 마감 시간 동적 스케줄 등록",
-                misfire_grace_time=3600
+                job_id="register_auto_complete_schedules",
+                name="가게 마감 시간 동적 스케줄 등록"
             )
 
             logger.info("태스크 등록됨: 가게 마감 시간 동적 스케줄 등록")
@@ -122,7 +294,7 @@ class SchedulerService:
     def get_jobs_info(self) -> List[Dict[str, Any]]:
         """현재 등록된 모든 작업 정보 반환"""
         jobs = []
-        for job in self.scheduler.get_jobs():
+        for job in self.scheduler.get_jobs() + self.persistent_scheduler.get_jobs():
             jobs.append({
                 "id": job.id,
                 "name": job.name,
@@ -133,7 +305,7 @@ class SchedulerService:
     
     async def run_job_now(self, job_id: str) -> Dict[str, Any]:
         """특정 작업을 즉시 실행 (테스트/관리 목적)"""
-        job = self.scheduler.get_job(job_id)
+        job = self.scheduler.get_job(job_id) or await asyncio.to_thread(self.persistent_scheduler.get_job, job_id)
         if not job:
             return {
                 "success": False,
@@ -141,7 +313,7 @@ class SchedulerService:
             }
         
         try:
-            await job.func()
+            await job.func(*job.args, **job.kwargs)
             return {
                 "success": True,
                 "message": f"작업이 실행되었습니다: {job_id}"
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Set
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from services.redis_cache import StoreCardCache
+
+
+DIRTY_STORE_IDS_KEY = "dirty_store_card_ids"
+DIRTY_ALL_KEY = "dirty_all_store_cards"
+
+# 커밋 후 실행되는 무효화 작업 (가비지 컬렉션 방지용 참조)
+_pending_tasks: Set[asyncio.Task] = set()
+
+
+def mark_store_cards_dirty(session, *store_ids: str) -> None:
+    """
+    가게 카드가 바뀌는 쓰기를 세션에 기록
+    
+    트랜잭션이 커밋되면 해당 가게 카드의 버전이 올라가 다음 조회 시 다시 생성됨
+    (롤백되면 기록은 버려짐)
+    
+    Args:
+        session: AsyncSession 또는 Session
+        store_ids: 카드가 바뀐 가게 ID 목록
+    """
+    info = getattr(session, "sync_session", session).info
+    info.setdefault(DIRTY_STORE_IDS_KEY, set()).update(
+        store_id for store_id in store_ids if store_id
+    )
+
+
+def mark_all_store_cards_dirty(session) -> None:
+    """모든 가게 카드가 바뀌는 쓰기(일괄 재고 초기화, 일괄 영업 상태 변경 등)를 세션에 기록"""
+    info = getattr(session, "sync_session", session).info
+    info[DIRTY_ALL_KEY] = True
+
+
+async def _invalidate(store_ids: Set[str], invalidate_all: bool) -> None:
+    try:
+        if invalidate_all:
+            await StoreCardCache.invalidate_all()
+        else:
+            await StoreCardCache.invalidate(store_ids)
+    except Exception as e:
+        logger.error(f"가게 카드 무효화 실패: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_store_cards_after_commit(session: Session) -> None:
+    store_ids = session.info.pop(DIRTY_STORE_IDS_KEY, None) or set()
+    invalidate_all = session.info.pop(DIRTY_ALL_KEY, False)
+    if not store_ids and not invalidate_all:
+        return
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    task = loop.create_task(_invalidate(store_ids, invalidate_all))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_store_cards_after_rollback(session: Session) -> None:
+    session.info.pop(DIRTY_STORE_IDS_KEY, None)
+    session.info.pop(DIRTY_ALL_KEY, None)
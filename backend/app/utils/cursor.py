@@ -0,0 +1,43 @@
+import base64
+import json
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """키셋 페이지네이션 값을 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps(values, separators=(",", ":"), ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], keys: Sequence[str]) -> Optional[Tuple[Any, ...]]:
+    """
+    커서 문자열을 키셋 페이지네이션 값으로 디코딩
+    
+    Args:
+        cursor: encode_cursor로 생성된 커서 (없으면 첫 페이지)
+        keys: 커서에서 꺼낼 값의 키 목록 (순서대로 반환)
+    
+    Returns:
+        keys 순서의 값 튜플 또는 None
+    
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않은 경우
+    """
+    if not cursor:
+        return None
+    
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError):
+        values = None
+    
+    if not isinstance(values, dict) or any(key not in values for key in keys):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 커서입니다"
+        )
+    
+    return tuple(values[key] for key in keys)
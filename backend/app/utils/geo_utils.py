@@ -0,0 +1,114 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+EARTH_RADIUS_M = 6371000
+METERS_PER_DEGREE = 111320
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9  # 저장용 정밀도 (약 4.8m x 4.8m)
+
+
+def parse_coordinate(value) -> Optional[float]:
+    """문자열 위도/경도를 float로 변환 (변환 불가 시 None)"""
+    try:
+        coordinate = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(coordinate) or math.isinf(coordinate):
+        return None
+    return coordinate
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """위도/경도를 geohash 문자열로 인코딩"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    bit_count = 0
+    is_lng = True
+
+    while len(geohash) < precision:
+        target_range, value = (lng_range, lng) if is_lng else (lat_range, lat)
+        mid = (target_range[0] + target_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            target_range[0] = mid
+        else:
+            bits = bits << 1
+            target_range[1] = mid
+        is_lng = not is_lng
+        bit_count += 1
+
+        if bit_count == 5:
+            geohash.append(GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(geohash)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """geohash 정밀도별 셀 크기 (위도 각도, 경도 각도)"""
+    total_bits = precision * 5
+    lat_bits = total_bits // 2
+    lng_bits = total_bits - lat_bits
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def covering_precision(lat: float, radius_m: float) -> int:
+    """반경을 셀 하나의 가로/세로가 모두 덮을 수 있는 가장 높은 정밀도"""
+    lng_scale = max(math.cos(math.radians(lat)), 0.01)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lng_deg = geohash_cell_size(precision)
+        height_m = lat_deg * METERS_PER_DEGREE
+        width_m = lng_deg * METERS_PER_DEGREE * lng_scale
+        if height_m >= radius_m and width_m >= radius_m:
+            return precision
+    return 1
+
+
+def covering_geohashes(lat: float, lng: float, radius_m: float) -> List[str]:
+    """
+    반경 내 모든 지점을 포함하는 geohash prefix 목록
+
+    중심 셀과 인접 8개 셀을 반환하며, 셀 크기가 반경 이상이므로
+    반경 원은 항상 이 9개 셀 안에 포함됨
+    """
+    precision = covering_precision(lat, radius_m)
+    lat_deg, lng_deg = geohash_cell_size(precision)
+
+    prefixes = []
+    for d_lat in (-1, 0, 1):
+        for d_lng in (-1, 0, 1):
+            neighbor_lat = min(max(lat + d_lat * lat_deg, -90.0), 90.0)
+            neighbor_lng = ((lng + d_lng * lng_deg + 180.0) % 360.0) - 180.0
+            prefix = encode_geohash(neighbor_lat, neighbor_lng, precision)
+            if prefix not in prefixes:
+                prefixes.append(prefix)
+    return prefixes
+
+
+def build_coordinate_values(lat, lng) -> Dict[str, Optional[object]]:
+    """
+    문자열 위도/경도로부터 공간 검색용 컬럼 값 생성
+
+    Returns:
+        latitude, longitude, geohash 값 (좌표가 올바르지 않으면 모두 None)
+    """
+    latitude = parse_coordinate(lat)
+    longitude = parse_coordinate(lng)
+
+    if (
+        latitude is None or longitude is None
+        or not -90.0 <= latitude <= 90.0
+        or not -180.0 <= longitude <= 180.0
+    ):
+        return {"latitude": None, "longitude": None, "geohash": None}
+
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "geohash": encode_geohash(latitude, longitude)
+    }
@@ -0,0 +1,78 @@
+from typing import Iterable, List, Set
+
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# 초성 19자 (호환 자모)
+CHOSEONG_LIST = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+CHOSEONG_SET = set(CHOSEONG_LIST)
+
+# 한 문서 안에서 이름끼리 이어 붙일 때 쓰는 구분자 (이름 경계를 넘는 매칭 방지)
+DOCUMENT_SEPARATOR = "\n"
+
+
+def normalize_search_text(text: str) -> str:
+    """검색용 정규화: 소문자 변환 및 공백 제거"""
+    if not text:
+        return ""
+    return "".join(text.lower().split())
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (한글이 아닌 문자는 그대로 유지)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            index = (code - HANGUL_SYLLABLE_START) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)
+            result.append(CHOSEONG_LIST[index])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_choseong_query(text: str) -> bool:
+    """검색어가 초성으로만 이루어져 있는지 확인"""
+    return bool(text) and all(char in CHOSEONG_SET for char in text)
+
+
+def ngrams(text: str) -> Set[str]:
+    """문자 unigram + bigram 토큰 생성"""
+    tokens = set(text)
+    tokens.update(text[i:i + 2] for i in range(len(text) - 1))
+    return tokens
+
+
+def build_document(names: Iterable[str]) -> str:
+    """가게/상품 이름 목록을 정규화된 검색 문서로 변환"""
+    normalized = [normalize_search_text(name) for name in names]
+    return DOCUMENT_SEPARATOR.join(name for name in normalized if name)
+
+
+def build_document_tokens(document: str) -> Set[str]:
+    """검색 문서에서 색인할 토큰 집합 생성 (원문 + 초성)"""
+    tokens = set()
+    for name in document.split(DOCUMENT_SEPARATOR):
+        if not name:
+            continue
+        tokens.update(ngrams(name))
+        tokens.update(ngrams(to_choseong(name)))
+    return tokens
+
+
+def build_query_tokens(normalized_query: str) -> List[str]:
+    """
+    검색어에서 조회할 토큰 목록 생성
+
+    한 글자는 unigram, 두 글자 이상은 bigram으로 조회하며
+    모든 토큰을 가진 문서만 후보가 됨
+    """
+    if len(normalized_query) == 1:
+        return [normalized_query]
+    return sorted({normalized_query[i:i + 2] for i in range(len(normalized_query) - 1)})
@@ -1,15 +1,16 @@
 from fastapi import HTTPException, status
-from typing import Optional
+from typing import Optional, List, Dict
 import pytz
 
-from api.deps.repository import StoreRepositoryDep
-from services.redis_cache import RedisCache
+from api.deps.repository import StoreRepositoryDep, CustomerFavoriteRepositoryDep
+from services.redis_cache import RedisCache, StoreCardCache, FavoriteCache
 from schemas.product import ProductResponse
 from schemas.store import StoreDetailResponseForCustomer
 from schemas.store_operation import StoreOperationResponse
 from schemas.image import ImageUploadResponse
 from core.object_storage import object_storage
-from schemas.order import OrderStatus
+from schemas.order import OrderStatus, OrderItemResponse
+from utils.string_utils import parse_comma_separated_string
 
 kst = pytz.timezone('Asia/Seoul')
 
@@ -54,8 +55,12 @@ async def get_store_id_by_email(
     return store.store_id
 
 
-def convert_store_to_response(store, is_favorite: bool = False) -> StoreDetailResponseForCustomer:
-    """가게 정보를 StoreDetailResponseForCustomer로 변환하는 헬퍼 함수"""
+def build_store_card(store) -> dict:
+    """
+    가게 정보를 카드(즐겨찾기 여부를 제외한 고객용 가게 상세 정보)로 직렬화하는 헬퍼 함수
+    
+    address, sns_info, operation_info, images, products(nutrition_info)가 로딩된 가게 필요
+    """
     # 가게 기본 정보
     store_data = {
         "store_id": store.store_id,
@@ -130,8 +135,63 @@ def convert_store_to_response(store, is_favorite: bool = False) -> StoreDetailRe
         )
     store_data["images"] = image_responses
     
-    store_data["is_favorite"] = is_favorite
-    return StoreDetailResponseForCustomer(**store_data)
+    return StoreDetailResponseForCustomer(**store_data).model_dump(mode="json", exclude={"is_favorite"})
+
+
+async def get_store_cards(store_ids: List[str], store_repo: StoreRepositoryDep) -> Dict[str, dict]:
+    """
+    가게 카드를 Redis에서 한 번에 조회하고, 없거나 만료된 카드만 DB에서 만들어 캐싱
+    
+    Args:
+        store_ids: 가게 ID 목록
+        store_repo: 가게 레포지토리
+    
+    Returns:
+        Dict[str, dict]: store_id별 가게 카드 (삭제된 가게는 제외)
+    """
+    cards, misses = await StoreCardCache.get_cards(store_ids)
+    
+    if misses:
+        stores = await store_repo.get_stores_for_cards(list(misses))
+        built_cards = {store.store_id: build_store_card(store) for store in stores}
+        await StoreCardCache.set_cards(built_cards, misses)
+        cards.update(built_cards)
+    
+    return cards
+
+
+async def get_favorite_flags(
+    customer_email: str,
+    store_ids: List[str],
+    favorite_repo: CustomerFavoriteRepositoryDep
+) -> List[bool]:
+    """
+    가게 목록의 즐겨찾기 여부 조회 (Redis Set 캐싱 적용)
+    
+    Args:
+        customer_email: 소비자 이메일
+        store_ids: 가게 ID 목록
+        favorite_repo: 즐겨찾기 레포지토리
+    
+    Returns:
+        List[bool]: store_ids 순서의 즐겨찾기 여부
+    """
+    flags = await FavoriteCache.get_flags(customer_email, store_ids)
+    
+    if flags is not None:
+        return flags
+    
+    # Redis에 없는 경우 DB에서 즐겨찾기 목록을 조회해 캐싱
+    favorite_store_ids = await favorite_repo.get_store_ids_by_customer(customer_email)
+    await FavoriteCache.set_favorites(customer_email, favorite_store_ids)
+    
+    favorite_store_ids = set(favorite_store_ids)
+    return [store_id in favorite_store_ids for store_id in store_ids]
+
+
+def convert_store_to_response(store_card: dict, is_favorite: bool = False) -> StoreDetailResponseForCustomer:
+    """가게 카드를 StoreDetailResponseForCustomer로 변환하는 헬퍼 함수"""
+    return StoreDetailResponseForCustomer(**store_card, is_favorite=is_favorite)
 
 
 def get_main_image_url(store) -> Optional[str]:
@@ -164,4 +224,32 @@ def get_order_time_by_status(order, status) -> tuple:
     kst_time = time_at.astimezone(kst)
     date_str = kst_time.strftime('%Y-%m-%d')
     time_str = kst_time.strftime('%H:%M')
-    return date_str, time_str
\ No newline at end of file
+    return date_str, time_str
+
+
+def convert_order_to_response(order) -> OrderItemResponse:
+    """당일 주문(product.store, customer.detail 관계 포함)을 주문 응답으로 변환"""
+    return OrderItemResponse(
+        payment_id=order.payment_id,
+        customer_id=order.customer_id,
+        customer_nickname=order.customer.detail.nickname,
+        customer_phone_number=order.customer.detail.phone_number,
+        product_id=order.product_id,
+        product_name=order.product.product_name,
+        store_id=order.product.store_id,
+        store_name=order.product.store.store_name,
+        quantity=order.quantity,
+        price=order.price,
+        sale=order.sale,
+        total_amount=order.total_amount,
+        status=order.status,
+        reservation_at=order.reservation_at,
+        accepted_at=order.accepted_at,
+        completed_at=order.completed_at,
+        canceled_at=order.canceled_at,
+        cancel_reason=order.cancel_reason,
+        preferred_menus=parse_comma_separated_string(order.preferred_menus),
+        nutrition_types=parse_comma_separated_string(order.nutrition_types),
+        allergies=parse_comma_separated_string(order.allergies),
+        topping_types=parse_comma_separated_string(order.topping_types)
+    )
\ No newline at end of file
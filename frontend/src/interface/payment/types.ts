@@ -44,6 +44,8 @@ export type SettlementItemType = {
 export type SettlementBaseType = {
   date: string;
   items: SettlementItemType[];
+  completed_amount: number;
+  canceled_amount: number;
 };
 
 export type SettlementType = {